@@ -0,0 +1,50 @@
+#!usr/bin/python3
+"""Attribute access throughput of parsed models.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=. python benchmarks/attributes.py [count]
+"""
+import sys
+import timeit
+
+from fixtures import profiles_page, projects_page
+
+from freelancehunt import Requester
+from freelancehunt.models.project import Project
+from freelancehunt.models.user import Freelancer
+
+
+def score_projects(projects):
+    return sum(project.bid_count + project.budget.amount
+               for project in projects if project.is_remote_job is False)
+
+
+def score_profiles(profiles):
+    return sum(profile.rating + profile.positive_reviews
+               for profile in profiles if profile.is_plus_active)
+
+
+def measure(function, objects, reads_per_object, repeat=5):
+    """Million attribute reads per second, the best of `repeat` runs."""
+    best = min(timeit.repeat(lambda: function(objects), number=1, repeat=repeat))
+    return len(objects) * reads_per_object / best / 1e6
+
+
+def main(count=50000):
+    Requester.get_requester('BENCHMARK_TOKEN')
+    pages = count // 50
+
+    projects = [Project.de_json(**data)
+                for page in range(pages)
+                for data in projects_page(start=300000 + page * 50)]
+    print(f"Project:    {measure(score_projects, projects, 4):6.2f} M reads/s")
+
+    profiles = [Freelancer.de_json(**data)
+                for page in range(pages)
+                for data in profiles_page(start=70000 + page * 50)]
+    print(f"Freelancer: {measure(score_profiles, profiles, 3):6.2f} M reads/s")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,96 @@
+#!usr/bin/python3
+"""Lookup and search throughput of static catalogs compared with a linear scan.
+
+The catalog is replayed from memory, only lookups are measured.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=. python benchmarks/catalogs.py [count]
+"""
+import random
+import sys
+import time
+import timeit
+
+from freelancehunt import AllCities, Cities, Countries, Requester, Skills
+
+
+def catalog_responce(count, iso2=False):
+    """Catalog in the shape of the API responce."""
+    data = []
+    for item_id in range(1, count + 1):
+        attributes = {"name": f"Entry #{item_id}"}
+        if iso2:
+            attributes["iso2"] = f"{chr(65 + item_id // 26 % 26)}{chr(65 + item_id % 26)}{item_id}"
+        data.append({"id": item_id, "type": "catalog", "attributes": attributes})
+    return {"data": data}
+
+
+def measure(lookup, keys, repeat=5):
+    """Lookups per second, the best of `repeat` runs."""
+    best = min(timeit.repeat(lambda: [lookup(key) for key in keys], number=1, repeat=repeat))
+    return len(keys) / best
+
+
+def main(count=20000):
+    requester = Requester.get_requester('BENCHMARK_TOKEN')
+    for name, catalog, size in (('Skills', Skills(), 250),
+                                ('Countries', Countries(), 250),
+                                ('Cities', Cities(1), 5000)):
+        responce = catalog_responce(size, iso2=name == 'Countries')
+        requester.request = lambda *args, **kwargs: responce
+        catalog.update()
+        keys = [random.randint(1, size) for _ in range(count)]
+
+        def scan(key):
+            return next(filter(lambda item: item.id == key, catalog.list))
+
+        print(f"{name}.get() ({size} entries): scan {measure(scan, keys):12.0f} lookups/s, "
+              f"index {measure(catalog.get, keys):12.0f} lookups/s")
+
+    # Autocomplete queries: prefixes, words inside names and typos
+    responce = {"data": [
+        {"id": item_id, "type": "city", "attributes": {"name": name}}
+        for item_id, name in enumerate(city_names(5000), 1)
+    ]}
+    requester.request = lambda *args, **kwargs: responce
+    cities = Cities(1)
+    cities.update()
+    queries = [random.choice(("kha", "novo", "ivano", "zhytomir", "pol", "dnipro", "rivne"))
+               for _ in range(count // 10)]
+
+    def scan_find(text):
+        return [city for city in cities.list if text in city.name]
+
+    print(f"Cities.find() (5000 entries): scan {measure(scan_find, queries):12.0f} queries/s, "
+          f"index {measure(cities.find, queries):12.0f} queries/s")
+    print(f"Cities.search() (5000 entries, top 10): {measure(cities.search, queries):12.0f} queries/s")
+
+    # Preload of cities of 40 countries, every request takes 50 ms
+    def slow_request(*args, **kwargs):
+        time.sleep(0.05)
+        return catalog_responce(100)
+
+    requester.request = slow_request
+    country_ids = range(1, 41)
+    started_at = time.perf_counter()
+    for country_id in country_ids:
+        Cities(country_id).update()
+    serial = time.perf_counter() - started_at
+    started_at = time.perf_counter()
+    AllCities(countries=country_ids).update()
+    bulk = time.perf_counter() - started_at
+    print(f"Cities of 40 countries: one by one {serial:6.2f} s, AllCities {bulk:6.2f} s")
+
+
+def city_names(count):
+    """Names with the shared words and prefixes like in the real catalog."""
+    roots = ("Kharkiv", "Novo", "Ivano", "Zhytomyr", "Poltava", "Dnipro", "Rivne", "Lviv",
+             "Odesa", "Sumy", "Chernihiv", "Kherson", "Mykolaiv", "Uzhhorod", "Ternopil")
+    suffixes = ("", "ka", "ske", "sk", "ivka", "-Frankivsk", "hrad", " Raion", "pil")
+    return [f"{roots[i % len(roots)]}{suffixes[i // len(roots) % len(suffixes)]} {i}"
+            for i in range(count)]
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
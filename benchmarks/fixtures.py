@@ -0,0 +1,135 @@
+#!usr/bin/python3
+"""Payloads for benchmarks, shaped as API data after `FreelancehuntObject._get()`."""
+import copy
+
+
+DESCRIPTION = "Backend must be PHP like Yii or Laravel. " * 20
+
+
+def avatar(login):
+    return {
+        "small": {
+            "url": f"https://content.freelancehunt.com/profile/photo/50/{login}.png",
+            "width": 50,
+            "height": 50
+        },
+        "large": {
+            "url": f"https://content.freelancehunt.com/profile/photo/225/{login}.png",
+            "width": 255,
+            "height": 255
+        }
+    }
+
+
+def project_data(project_id):
+    """Project from the `/projects` list."""
+    employer_id = 20000 + project_id % 300
+    return {
+        "id": project_id,
+        "type": "project",
+        "links": {
+            "self": {
+                "api": f"https://api.freelancehunt.com/v2/projects/{project_id}",
+                "web": f"https://freelancehunt.com/project/project/{project_id}.html"
+            },
+            "comments": f"https://api.freelancehunt.com/v2/projects/{project_id}/comments",
+            "bids": f"https://api.freelancehunt.com/v2/projects/{project_id}/bids"
+        },
+        "name": f"Looking for Full stack developer #{project_id}",
+        "description": DESCRIPTION,
+        "description_html": f"<p>{DESCRIPTION}</p>",
+        "skills": [
+            {"id": 56 + project_id % 7, "name": "1C"},
+            {"id": 1, "name": "PHP"},
+            {"id": 99, "name": "Web programming"}
+        ],
+        "status": {"id": 11, "name": "Open for proposals"},
+        "budget": {"amount": 2300 + project_id % 1000, "currency": "UAH"},
+        "bid_count": project_id % 40,
+        "is_remote_job": False,
+        "is_premium": False,
+        "is_only_for_plus": False,
+        "location": None,
+        "safe_type": "employer",
+        "is_personal": None,
+        "employer": {
+            "id": employer_id,
+            "type": "employer",
+            "login": f"employer-{employer_id}",
+            "first_name": "Михаил",
+            "last_name": "К.",
+            "avatar": avatar(f"employer-{employer_id}"),
+            "self": f"https://api.freelancehunt.com/v2/employers/{employer_id}"
+        },
+        "freelancer": None,
+        "updates": [],
+        "published_at": "2019-03-25T19:51:53+02:00",
+        "expired_at": "2019-04-01T16:51:53+03:00"
+    }
+
+
+def profile_data(profile_id):
+    """Freelancer from the `/freelancers` list."""
+    login = f"freelancer-{profile_id}"
+    return {
+        "id": profile_id,
+        "type": "freelancer",
+        "links": {
+            "self": {
+                "api": f"https://api.freelancehunt.com/v2/freelancers/{profile_id}",
+                "web": f"https://freelancehunt.com/freelancer/{login}.html"
+            },
+            "reviews": f"https://api.freelancehunt.com/v2/freelancers/{profile_id}/reviews"
+        },
+        "login": login,
+        "first_name": "Артём",
+        "last_name": "Yacuk",
+        "avatar": avatar(login),
+        "birth_date": None,
+        "created_at": "2014-09-08T15:21:45+03:00",
+        "cv": DESCRIPTION,
+        "cv_html": f"<p>{DESCRIPTION}</p>",
+        "rating": 31597,
+        "rating_position": profile_id % 1000,
+        "arbitrages": 0,
+        "positive_reviews": 295,
+        "negative_reviews": 0,
+        "plus_ends_at": None,
+        "is_plus_active": True,
+        "is_online": False,
+        "visited_at": "2020-06-01T10:00:00+03:00",
+        "location": {
+            "country": {"id": 1, "name": "Ukraine"},
+            "city": {"id": 3184, "name": "Kharkiv"}
+        },
+        "verification": {
+            "identity": True,
+            "birth_date": False,
+            "phone": True,
+            "website": False,
+            "wmid": False,
+            "email": False
+        },
+        "contacts": None,
+        "status": {"id": 10, "name": "Available for hire"},
+        "skills": [
+            {"id": 14, "name": "Search engine optimization", "rating_position": 0},
+            {"id": 127, "name": "Contextual advertising", "rating_position": 0},
+            {"id": 131, "name": "Social media marketing", "rating_position": 0}
+        ]
+    }
+
+
+def projects_page(count=50, start=300000):
+    """One page of the `/projects` list."""
+    return [project_data(start + index) for index in range(count)]
+
+
+def profiles_page(count=50, start=70000):
+    """One page of the `/freelancers` list."""
+    return [profile_data(start + index) for index in range(count)]
+
+
+def fresh(page):
+    """Copy page data, because models change the given data."""
+    return copy.deepcopy(page)
@@ -0,0 +1,66 @@
+#!usr/bin/python3
+"""Open time, memory and lookup throughput of memory-mapped catalogs.
+
+Compares the catalog of cities kept as Python objects in every process
+with the memory-mapped catalog file shared by processes.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=. python benchmarks/mapped.py [count]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+from freelancehunt import AllCities, Requester
+
+
+def cities_responce(count):
+    return {"data": [
+        {"id": city_id, "type": "city", "attributes": {"name": f"City #{city_id}"}}
+        for city_id in range(1, count + 1)
+    ]}
+
+
+def main(count=50000):
+    requester = Requester.get_requester('BENCHMARK_TOKEN')
+    responce = cities_responce(count)
+    requester.request = lambda *args, **kwargs: responce
+
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    cities = AllCities(countries=[1])
+    cities.update()
+    loaded = time.perf_counter() - started_at
+    objects_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    path = os.path.join(tempfile.mkdtemp(), 'cities.fhc')
+    cities.save_mapped(path)
+
+    tracemalloc.start()
+    started_at = time.perf_counter()
+    mapped = AllCities(countries=[1], mapped_path=path)
+    opened = time.perf_counter() - started_at
+    mapped_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    keys = [random.randint(1, count) for _ in range(20000)]
+    best = {}
+    for name, catalog in (('objects', cities), ('mapped', mapped)):
+        elapsed = min(timeit.repeat(lambda: [catalog.get(key) for key in keys], number=1, repeat=5))
+        best[name] = len(keys) / elapsed
+
+    print(f"{count} cities, file {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+    print(f"objects: start {loaded * 1000:8.1f} ms, {objects_memory / 2 ** 20:6.1f} MiB per process, "
+          f"{best['objects']:10.0f} lookups/s")
+    print(f"mapped:  start {opened * 1000:8.1f} ms, {mapped_memory / 2 ** 20:6.1f} MiB per process, "
+          f"{best['mapped']:10.0f} lookups/s")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,44 @@
+#!usr/bin/python3
+"""Memory used by parsed models, measured with tracemalloc.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=. python benchmarks/memory.py [count]
+"""
+import gc
+import sys
+import tracemalloc
+
+from fixtures import profiles_page, projects_page
+
+from freelancehunt import Requester
+from freelancehunt.models.project import Project
+from freelancehunt.models.user import Freelancer
+
+
+def measure(model, pages):
+    """Bytes allocated per object that stay alive after parsing."""
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    objects = [model.de_json(**data) for page in pages for data in page]
+    del pages
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (current - start) / len(objects)
+
+
+def main(count=10000):
+    Requester.get_requester('BENCHMARK_TOKEN')
+    pages = count // 50
+
+    projects = [projects_page(start=300000 + page * 50) for page in range(pages)]
+    print(f"Project:    {measure(Project, projects):8.0f} bytes per object")
+
+    profiles = [profiles_page(start=70000 + page * 50) for page in range(pages)]
+    print(f"Freelancer: {measure(Freelancer, profiles):8.0f} bytes per object")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,46 @@
+#!usr/bin/python3
+"""Throughput of parsing list pages to models.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=. python benchmarks/parsing.py [pages]
+"""
+import sys
+import time
+
+from fixtures import fresh, profiles_page, projects_page
+
+from freelancehunt import Requester
+from freelancehunt.models.project import Project
+from freelancehunt.models.user import Freelancer
+
+
+def measure(parse, page, pages, repeat=5):
+    """Parsed pages per second, the best of `repeat` runs."""
+    best = None
+    for _ in range(repeat):
+        # Models change the given data, so every run gets its own copy
+        copies = [fresh(page) for _ in range(pages)]
+        started_at = time.perf_counter()
+        for data in copies:
+            parse(data)
+        elapsed = time.perf_counter() - started_at
+        best = elapsed if best is None else min(best, elapsed)
+    return pages / best
+
+
+def main(pages=200):
+    Requester.get_requester('BENCHMARK_TOKEN')
+
+    def parse_projects(page):
+        return [Project.de_json(**data) for data in page]
+
+    def parse_profiles(page):
+        return [Freelancer.de_json(**data) for data in page]
+
+    print(f"Project.de_json:    {measure(parse_projects, projects_page(), pages):8.1f} pages/s")
+    print(f"Freelancer.de_json: {measure(parse_profiles, profiles_page(), pages):8.1f} pages/s")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,70 @@
+#!usr/bin/python3
+"""Throughput of list methods in raw mode compared with full models.
+
+The API responce is replayed from memory, so only the processing of
+data is measured: normalization of records and, for full models, making
+objects and reading the attributes used by a typical export.
+
+Usage (from the repository root)::
+
+    PYTHONPATH=. python benchmarks/raw.py [pages]
+"""
+import sys
+import time
+
+from fixtures import fresh, projects_page
+
+from freelancehunt import Projects, Requester
+
+
+def api_page(page):
+    """Shape normalized records back to the API responce."""
+    data = []
+    for record in fresh(page):
+        data.append({
+            "id": record.pop("id"),
+            "type": record.pop("type"),
+            "links": record.pop("links"),
+            "attributes": record,
+        })
+    return {"data": data}
+
+
+def measure(get_list, responce, pages, repeat=5):
+    """Processed pages per second, the best of `repeat` runs."""
+    requester = Requester.get_requester()
+    best = None
+    for _ in range(repeat):
+        # Responce data is changed by processing, so every page gets its own copy
+        copies = [fresh(responce) for _ in range(pages)]
+        requester.request = lambda *args, **kwargs: copies.pop()
+        started_at = time.perf_counter()
+        get_list(pages)
+        elapsed = time.perf_counter() - started_at
+        best = elapsed if best is None else min(best, elapsed)
+    return pages / best
+
+
+def main(pages=200):
+    Requester.get_requester('BENCHMARK_TOKEN')
+    projects = Projects()
+    responce = api_page(projects_page())
+
+    def models(pages):
+        return [(project.id, project.name, project.published_at,
+                 project.budget.amount, project.employer.login,
+                 [skill.id for skill in project.skills])
+                for project in projects.get_list(pages=pages)]
+
+    def raw(pages):
+        return [(project["id"], project["name"], project["published_at"],
+                 project["budget"]["amount"], project["employer"]["login"],
+                 [skill["id"] for skill in project["skills"]])
+                for project in projects.get_list(pages=pages, raw=True)]
+
+    print(f"Projects.get_list():         {measure(models, responce, pages):8.1f} pages/s")
+    print(f"Projects.get_list(raw=True): {measure(raw, responce, pages):8.1f} pages/s")
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
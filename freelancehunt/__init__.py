@@ -4,6 +4,7 @@ from . import models
 
 from .client import FreelanceHuntClient
 from .utils.requester import Requester
+from .utils.identity import IdentityMap
 
 from .packages.projects import Projects
 from .packages.feed import Feed
@@ -11,10 +12,17 @@ from .packages.profiles import Profiles
 from .packages.threads import Threads
 from .packages.contests import Contests
 from .packages.countries import Countries
-from .packages.cities import Cities
+from .packages.cities import Cities, AllCities
 from .packages.skills import Skills
 from .packages.reviews import Reviews
 
+from .services.base import PollingGroup
+from .services.projects import ProjectWatcher
+from .services.feed import FeedWatcher
+from .services.inbox import InboxSync
+
+from .analytics.frame import ProjectFrame
+
 from .version import __version__
 
 __author__ = ['code@dmytrohoi.com']
@@ -22,6 +30,7 @@ __author__ = ['code@dmytrohoi.com']
 __all__ = (
     'FreelanceHuntClient',
     'Requester',
+    'IdentityMap',
     'Projects',
     'Feed',
     'Profiles',
@@ -30,6 +39,12 @@ __all__ = (
     'Contests',
     'Countries',
     'Cities',
+    'AllCities',
     'Skills',
+    'PollingGroup',
+    'ProjectWatcher',
+    'FeedWatcher',
+    'InboxSync',
+    'ProjectFrame',
     'models',
 )
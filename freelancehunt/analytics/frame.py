@@ -0,0 +1,268 @@
+#!usr/bin/python3
+"""Columnar container of projects for bulk analytics.
+
+.. note:: Requires NumPy (``pip install freelancehunt-api[analytics]``).
+"""
+from __future__ import annotations
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ..utils.records import get_item
+from ..models.project import Project
+
+
+__all__ = ('ProjectFrame',)
+
+
+def _to_timestamp(value: Optional[Union[str, datetime]]) -> Any:
+    if not value:
+        return np.datetime64('NaT')
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return np.datetime64(int(value.timestamp()), 's')
+
+
+class ProjectFrame:
+    """Projects stored as NumPy columns.
+
+    Columns (one item per project):
+
+    * `id` - project identifier (int64);
+    * `budget_amount` - budget amount (float64, NaN if unknown);
+    * `currency` - budget currency code (str, empty if unknown);
+    * `bid_count` - count of bids (int64, -1 if unknown);
+    * `status_id` - project status code (int64, -1 if unknown);
+    * `published_at`, `expired_at` - UTC dates (datetime64[s], NaT if unknown).
+
+    Skills are stored as pairs of the project position and the skill
+    identifier, see :py:meth:`has_skills` and :py:meth:`skill_ids`.
+
+    Frames are made from projects, raw records (``raw=True``) or pages of
+    them, details of projects are never loaded while the frame is built.
+    Every operation returns a new frame, the source objects are kept and
+    returned by :py:meth:`to_projects`.
+
+    Example:
+
+    .. code-block:: python
+
+        frame = ProjectFrame.from_projects(projects.get_list(pages=50))
+        python = frame.filter(frame.has_skills([22]))
+        for currency, group in python.group_by('currency').items():
+            print(currency, np.median(group.budget_amount))
+
+    :param dict columns: arrays of the columns
+    :param skill_rows: project positions of skills, in ascending order
+    :param skill_values: skill identifiers
+    :param sources: projects or records the rows are made from
+    """
+
+    columns = ('id', 'budget_amount', 'currency', 'bid_count', 'status_id',
+               'published_at', 'expired_at')
+
+    def __init__(self,
+                 columns: Dict[str, np.ndarray],
+                 skill_rows: np.ndarray,
+                 skill_values: np.ndarray,
+                 sources: np.ndarray):
+        """Create frame from the prepared arrays.
+
+        :param columns: arrays of the columns
+        :param skill_rows: project positions of skills, in ascending order
+        :param skill_values: skill identifiers
+        :param sources: projects or records the rows are made from
+        """
+        self._columns = columns
+        self._skill_rows = skill_rows
+        self._skill_values = skill_values
+        self._sources = sources
+
+    @classmethod
+    def from_projects(cls, projects: Iterable[Union[Project, dict]]) -> ProjectFrame:
+        """Make frame from projects or raw project records.
+
+        :param projects: objects or records returned by :py:meth:`Projects.get_list`
+        :raises ImportError: NumPy is not installed
+        :return: new frame
+        """
+        if np is None:
+            raise ImportError("ProjectFrame requires NumPy, install it with "
+                              "`pip install freelancehunt-api[analytics]`")
+
+        values = {name: [] for name in cls.columns}
+        skill_rows, skill_values, sources = [], [], []
+        for row, project in enumerate(projects):
+            # Stored values, without loading details or parsing nested objects
+            get = project.get if isinstance(project, dict) else project._get_stored
+
+            budget = get('budget')
+            amount = get_item(budget, 'amount')
+            bid_count = get('bid_count')
+            status_id = get_item(get('status'), 'id')
+
+            values['id'].append(get('id'))
+            values['budget_amount'].append(amount if amount is not None else np.nan)
+            values['currency'].append(get_item(budget, 'currency') or '')
+            values['bid_count'].append(bid_count if bid_count is not None else -1)
+            values['status_id'].append(status_id if status_id is not None else -1)
+            values['published_at'].append(_to_timestamp(get('published_at')))
+            values['expired_at'].append(_to_timestamp(get('expired_at')))
+            for skill in get('skills') or ():
+                skill_rows.append(row)
+                skill_values.append(get_item(skill, 'id'))
+            sources.append(project)
+
+        object_sources = np.empty(len(sources), dtype=object)
+        object_sources[:] = sources
+        return cls(
+            {
+                'id': np.array(values['id'], dtype=np.int64),
+                'budget_amount': np.array(values['budget_amount'], dtype=np.float64),
+                'currency': np.array(values['currency'], dtype=str),
+                'bid_count': np.array(values['bid_count'], dtype=np.int64),
+                'status_id': np.array(values['status_id'], dtype=np.int64),
+                'published_at': np.array(values['published_at'], dtype='datetime64[s]'),
+                'expired_at': np.array(values['expired_at'], dtype='datetime64[s]'),
+            },
+            np.array(skill_rows, dtype=np.int64),
+            np.array(skill_values, dtype=np.int64),
+            object_sources,
+        )
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Iterable[Union[Project, dict]]]) -> ProjectFrame:
+        """Make frame from a stream of pages with projects or raw records.
+
+        :param pages: iterable of pages
+        :return: new frame
+        """
+        return cls.from_projects(chain.from_iterable(pages))
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # Columns are read as attributes
+        try:
+            return self.__dict__['_columns'][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._columns[name]
+
+    def age(self, now: Optional[datetime] = None) -> np.ndarray:
+        """Get time passed from the publish date of every project.
+
+        :param now: the moment to count age to, defaults to None (current time)
+        :return: array of timedelta64[s]
+        """
+        now = now or datetime.now(timezone.utc)
+        return np.datetime64(int(now.timestamp()), 's') - self._columns['published_at']
+
+    def has_skills(self, skill_ids: Iterable[int], require_all: bool = False) -> np.ndarray:
+        """Get mask of projects with the skills.
+
+        :param skill_ids: identifiers of the desired skills
+        :param require_all: project must have all skills instead of any of them, defaults to False
+        :return: boolean array
+        """
+        skill_ids = np.unique(np.fromiter(skill_ids, dtype=np.int64))
+        matched = np.isin(self._skill_values, skill_ids)
+        counts = np.bincount(self._skill_rows[matched], minlength=len(self))
+        if require_all:
+            return counts >= len(skill_ids)
+        return counts > 0
+
+    def skill_ids(self, position: int) -> frozenset:
+        """Get skill identifiers of the project.
+
+        :param position: position of the project in the frame
+        :return: set of skill identifiers
+        """
+        return frozenset(self._skill_values[self._skill_rows == position].tolist())
+
+    def filter(self, mask: np.ndarray) -> ProjectFrame:
+        """Get frame with the selected projects.
+
+        :param mask: boolean mask or array of positions
+        :return: new frame
+        """
+        mask = np.asarray(mask)
+        positions = np.flatnonzero(mask) if mask.dtype == bool else mask
+        return self._take(positions)
+
+    def sort(self, by: str, descending: bool = False) -> ProjectFrame:
+        """Get frame sorted by the column.
+
+        :param by: name of the column
+        :param descending: sort from the largest value, defaults to False
+        :return: new frame
+        """
+        positions = np.argsort(self._columns[by], kind='stable')
+        if descending:
+            positions = positions[::-1]
+        return self._take(positions)
+
+    def group_by(self, by: str) -> Dict[Any, ProjectFrame]:
+        """Split frame to groups with the same value of the column.
+
+        :param by: name of the column
+        :return: frames by the column values
+        """
+        keys, inverse = np.unique(self._columns[by], return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[order], np.arange(len(keys) + 1))
+        return {
+            key.item(): self._take(order[start:end])
+            for key, start, end in zip(keys, bounds[:-1], bounds[1:])
+        }
+
+    def aggregate(self, by: str, column: str,
+                  func: Callable[[np.ndarray], Any] = None) -> Dict[Any, Any]:
+        """Apply function to the column of every group.
+
+        :param by: name of the column to group by
+        :param column: name of the aggregated column
+        :param func: aggregate function, defaults to None (`numpy.mean`)
+        :return: results by the group values
+        """
+        func = func or np.mean
+        return {key: func(group[column]) for key, group in self.group_by(by).items()}
+
+    def to_projects(self) -> List[Project]:
+        """Get projects of the frame, records are parsed to objects.
+
+        :return: list of projects
+        """
+        return [
+            Project.de_json(**source) if isinstance(source, dict) else source
+            for source in self._sources
+        ]
+
+    def _take(self, positions: np.ndarray) -> ProjectFrame:
+        # Skills are ordered by project positions, so skills of a project
+        # are a slice from its offset; slices are copied for every taken
+        # position, repeated positions included
+        positions = np.asarray(positions, dtype=np.int64)
+        counts = np.bincount(self._skill_rows, minlength=len(self))
+        offsets = np.cumsum(counts) - counts
+        taken_counts = counts[positions]
+        starts = np.repeat(offsets[positions] - (np.cumsum(taken_counts) - taken_counts),
+                           taken_counts)
+        skills = starts + np.arange(taken_counts.sum())
+        return ProjectFrame(
+            {name: column[positions] for name, column in self._columns.items()},
+            np.repeat(np.arange(len(positions), dtype=np.int64), taken_counts),
+            self._skill_values[skills],
+            self._sources[positions],
+        )
+
+    def __repr__(self) -> str:
+        return f'<freelancehunt.ProjectFrame ({len(self)} projects)>'
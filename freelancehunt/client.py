@@ -1,7 +1,5 @@
 #!usr/bin/python3
 """Main file of FreelanceHunt API framework."""
-from datetime import datetime, timedelta
-
 from .core import FreelancehuntObject
 
 from .packages.projects import Projects
@@ -107,15 +105,7 @@ class FreelanceHuntClient(FreelancehuntObject):
     @property
     def left_time_limit_update(self) -> int:
         """Second to update remaining API limits."""
-        last_request_datetime = self._requester.request_date
-        if last_request_datetime is None:
+        seconds_left = self._requester.limit_reset_in
+        if seconds_left is None:
             raise ValueError("No requests found.")
-
-        last_request_hour = last_request_datetime.replace(
-            microsecond=0,
-            second=0,
-            minute=0
-        )
-        update_datetime = last_request_hour + timedelta(hours=1)
-        seconds_left = update_datetime.timestamp() - datetime.utcnow().timestamp()
-        return int(seconds_left) if seconds_left > 0 else 0
+        return seconds_left
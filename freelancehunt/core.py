@@ -1,29 +1,449 @@
 #!usr/bin/python3
 """Basic classes for API objects."""
 from __future__ import annotations
-from typing import List, Optional, Tuple, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from itertools import product
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from requests.models import Response
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from .utils.errors import SchemaError
+from .utils.identity import IdentityMap
 from .utils.requester import Requester
 
 
-__all__ = ('FreelancehuntObject',)
+__all__ = ('FreelancehuntObject', 'LoadableObject', 'DateTimeField', 'NestedField',
+           'Schema',)
+
+
+@lru_cache(maxsize=None)
+def _slot_names(cls: type) -> Tuple[str]:
+    """Get names of all slots defined in the class hierarchy."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names += [name for name in slots if name not in ('__dict__', '__weakref__')]
+    return tuple(dict.fromkeys(names))
+
+
+# Slots of the object itself, not of the API data
+_UNCOPIED_SLOTS = frozenset(('_own_requester', '__weakref__'))
+
+
+class Field:
+    """Descriptor of a model field stored in the slot named `_<field name>`.
+
+    The stored value is converted on the first access and the result is
+    stored back, so objects pay only for the fields that are really used.
+    An empty slot raises AttributeError as usual, so
+    :py:meth:`LoadableObject.__getattr__` still loads not loaded fields.
+    """
+
+    __slots__ = ('name', 'storage_name', '_storage')
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.storage_name = '_' + name
+        # Member descriptor of the slot
+        self._storage = owner.__dict__[self.storage_name]
+
+    def __get__(self, obj: Optional[FreelancehuntObject], objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+
+        value = self._storage.__get__(obj, objtype)
+        if self._is_raw(value):
+            value = self._convert(value)
+            self._storage.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: FreelancehuntObject, value: Any) -> None:
+        self._storage.__set__(obj, value)
+
+    def __delete__(self, obj: FreelancehuntObject) -> None:
+        self._storage.__delete__(obj)
+
+    def _is_raw(self, value: Any) -> bool:
+        raise NotImplementedError
+
+    def _convert(self, value: Any) -> Any:
+        raise NotImplementedError
+
+
+class DateTimeField(Field):
+    """Datetime field, parsed from the ISO format string on the first access."""
+
+    __slots__ = ()
+
+    def _is_raw(self, value: Any) -> bool:
+        return value.__class__ is str
+
+    def _convert(self, value: str) -> datetime:
+        return datetime.fromisoformat(value)
+
+
+class NestedField(Field):
+    """Field with a model (or a list of models) made from API data on the first access.
+
+    :param model: model class with `de_json()` method
+    :param bool many: field contains list of objects
+    """
+
+    __slots__ = ('model', 'many')
+
+    def __init__(self, model: type, many: bool = False):
+        self.model = model
+        self.many = many
+
+    def _is_raw(self, value: Any) -> bool:
+        if self.many:
+            return value.__class__ is list and bool(value) and value[0].__class__ is dict
+        return value.__class__ is dict
+
+    def _convert(self, value: Union[dict, List[dict]]) -> Any:
+        identity_map = IdentityMap.get_current()
+        if identity_map is None:
+            if self.many:
+                return [self.model.de_json(**data) for data in value]
+            return self.model.de_json(**value)
+
+        # Share objects of the same entities
+        if self.many:
+            return [identity_map.make(self.model, data) for data in value]
+        return identity_map.make(self.model, value)
+
+
+class Schema:
+    """Declarative schema of a model compiled to the decoder of API data.
+
+    Every field maps the API key to the expected type of its value:
+
+    * a type or a tuple of types, checked with `isinstance()`, `object`
+      disables the check;
+    * `datetime` for ISO format strings (an empty string means None);
+    * a model class for nested objects, kept as dict in :py:class:`NestedField`
+      (plain slots get objects, made from dicts by `from_dict()`);
+    * `[model]` for lists of nested objects.
+
+    The value is stored in the slot with the field name, in the storage
+    slot of the field descriptor, or in the private slot `_<field name>`.
+    For every model the schema is compiled once to a function assigning
+    the slots directly, and not loaded fields of :py:class:`LoadableObject`
+    are just left empty. :py:meth:`encode` makes the data back from the
+    stored values, so objects are restored by :py:meth:`decode` as is.
+
+    :param dict fields: expected types of values by API keys
+    :param tuple required: keys required in the data, defaults to ('id',)
+    :param str extra: slot to store the data with unknown keys, defaults to None
+    :raises SchemaError: the data does not match the schema (on decoding)
+    """
+
+    __slots__ = ('fields', 'required', 'extra', '_decoders', '_layouts')
+
+    def __init__(self,
+                 fields: Dict[str, Any],
+                 required: Tuple[str] = ('id',),
+                 extra: Optional[str] = None):
+        """Create schema of a model.
+
+        :param fields: expected types of values by API keys
+        :param required: keys required in the data, defaults to ('id',)
+        :param extra: slot to store the data with unknown keys, defaults to None
+        """
+        self.fields = fields
+        self.required = frozenset(required)
+        self.extra = extra
+        self._decoders: Dict[type, Callable[[dict], Any]] = {}
+        self._layouts: Dict[type, Tuple[Tuple[str, str]]] = {}
+
+    def decode(self, model: type, data: dict) -> Any:
+        """Make object of the `model` from API data.
+
+        .. note:: Fields are removed from the `data`, so pass a copy.
+
+        :param model: model class with this schema
+        :param data: normalized API data
+        :return: object of the `model`
+        """
+        try:
+            decoder = self._decoders[model]
+        except KeyError:
+            decoder = self._decoders[model] = self.compile(model)
+        return decoder(data)
+
+    def encode(self, obj: Any) -> dict:
+        """Make data of the object, which is decoded to the same object.
+
+        Stored values are used as is, so nothing is loaded or parsed:
+        datetimes become ISO format strings and nested objects become
+        their data. Not loaded fields are left out.
+
+        :param obj: object of a model with this schema
+        :return: normalized data
+        """
+        model = type(obj)
+        try:
+            layout = self._layouts[model]
+        except KeyError:
+            layout = self._layouts[model] = tuple(
+                (key, self._get_slot(model, key)[0]) for key in self.fields
+            )
+
+        data = {}
+        for key, slot in layout:
+            try:
+                value = object.__getattribute__(obj, slot)
+            except AttributeError:
+                continue
+            data[key] = _encode_value(value)
+
+        if self.extra:
+            try:
+                extra = object.__getattribute__(obj, self.extra)
+            except AttributeError:
+                extra = None
+            for key, value in (extra or {}).items():
+                data.setdefault(key, _encode_value(value))
+        return data
+
+    def compile(self, model: type) -> Callable[[dict], Any]:
+        """Generate the decoder of API data to objects of the `model`.
+
+        :param model: model class with this schema
+        :return: function making object from the data
+        """
+        namespace = {
+            'new': object.__new__,
+            'model': model,
+            'MISSING': _MISSING,
+            'missing': _missing_field,
+            'invalid': _invalid_field,
+        }
+        lines = [
+            'def decode(data):',
+            '    pop = data.pop',
+            '    obj = new(model)',
+        ]
+        lazy_fields = getattr(model, '_lazy_fields', frozenset())
+
+        for index, (key, spec) in enumerate(self.fields.items()):
+            slot, is_field = self._get_slot(model, key)
+            check = f'T{index}'
+            is_datetime = spec is datetime
+            if is_datetime:
+                namespace[check] = str
+            elif isinstance(spec, list):
+                namespace[check] = list
+            elif isinstance(spec, type) and issubclass(spec, FreelancehuntObject):
+                namespace[check] = (dict, spec)
+            else:
+                namespace[check] = spec
+
+            if key in self.required:
+                lines += [
+                    f'    value = pop({key!r}, MISSING)',
+                    '    if value is MISSING:',
+                    f'        missing(model, {key!r})',
+                ]
+            else:
+                lines.append(f'    value = pop({key!r}, None)')
+
+            condition = 'value' if is_datetime else 'value is not None'
+            lines.append(f'    if {condition}:')
+            if namespace[check] is not object:
+                lines += [
+                    f'        if not isinstance(value, {check}):',
+                    f'            invalid(model, {key!r}, value)',
+                ]
+            # Plain slots keep objects, data of them is made by `encode()`
+            if isinstance(namespace[check], tuple) and not is_field:
+                namespace[f'M{index}'] = spec
+                lines += [
+                    '        if value.__class__ is dict:',
+                    f'            value = M{index}.from_dict(value)',
+                ]
+            lines.append(f'        obj.{slot} = value')
+            # Not loaded fields are loaded on access
+            if slot not in lazy_fields:
+                lines += ['    else:', f'        obj.{slot} = None']
+
+        if self.extra:
+            lines.append(f'    obj.{self.extra} = data')
+        lines.append('    return obj')
+
+        exec('\n'.join(lines), namespace)
+        return namespace['decode']
+
+    @staticmethod
+    def _get_slot(model: type, key: str) -> Tuple[str, bool]:
+        attr = getattr(model, key, None)
+        if isinstance(attr, Field):
+            return attr.storage_name, True
+
+        slots = _slot_names(model)
+        for slot in (key, '_' + key):
+            if slot in slots:
+                return slot, False
+        raise TypeError(f"{model.__name__} has no slot for the field '{key}'")
+
+
+_MISSING = object()
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, FreelancehuntObject):
+        return value.to_dict()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value.__class__ is list:
+        return [_encode_value(item) for item in value]
+    return value
+
+
+def _missing_field(model: type, key: str) -> None:
+    raise SchemaError(f"{model.__name__}: field '{key}' is required")
+
+
+def _invalid_field(model: type, key: str, value: Any) -> None:
+    raise SchemaError(
+        f"{model.__name__}: unexpected {type(value).__name__} value of field '{key}'"
+    )
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ImportError("MessagePack serialization requires msgpack, install it with "
+                          "`pip install freelancehunt-api[msgpack]`")
 
 
 class FreelancehuntObject:
-    """Core class for all parts of API."""
+    """Core class for all parts of API.
+
+    Models declare `__slots__` to keep objects compact, parts of API
+    (subclasses without `__slots__`) keep the usual instance `__dict__`.
+
+    Models are created detached: they do not call `__init__` of this class
+    and use the current :py:class:`Requester` only when a request is made.
+    The requester is not serialized, so pickled or restored objects use
+    the current one too.
+    """
+
+    __slots__ = ('_own_requester', '__weakref__')
 
-    _requester = None
+    # Fields of the model, see Schema
+    schema: Optional[Schema] = None
 
     def __init__(self, token: str = None, **kwargs):
-        self._requester = Requester.get_requester(token, **kwargs)
+        self._own_requester = Requester.get_requester(token, **kwargs)
+
+    @classmethod
+    def _decode(cls, data: dict) -> FreelancehuntObject:
+        """Make object from normalized API data by the model schema."""
+        return cls.schema.decode(cls, data)
+
+    def to_dict(self) -> dict:
+        """Get data of the model, restored by :py:meth:`from_dict`.
+
+        Nested objects are included as data, datetimes as ISO format
+        strings, so the result is JSON (and MessagePack) serializable
+        if the API data is. Not loaded fields are left out and loaded
+        on access of the restored object.
+
+        :return: normalized data
+        """
+        if self.schema is None:
+            # Simple models are made from their public slots, empty ones are defaults
+            data = {}
+            for name in _slot_names(type(self)):
+                if name.startswith('_'):
+                    continue
+                try:
+                    value = object.__getattribute__(self, name)
+                except AttributeError:
+                    continue
+                if value is not None:
+                    data[name] = _encode_value(value)
+            return data
+        return self.schema.encode(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> FreelancehuntObject:
+        """Make model from data returned by :py:meth:`to_dict`.
+
+        :param data: normalized data, it is not changed
+        :raises SchemaError: the data does not match the schema
+        :return: object of this class (or of the concrete type for base models)
+        """
+        if cls.schema is None:
+            return cls(**data)
+        identity_type = getattr(cls, '_identity_type', None)
+        model = identity_type(data) if identity_type else cls
+        return model._decode(dict(data))
+
+    def to_msgpack(self) -> bytes:
+        """Get data of the model packed by MessagePack.
+
+        .. note:: Requires msgpack (``pip install freelancehunt-api[msgpack]``).
+
+        :raises ImportError: msgpack is not installed
+        :return: packed :py:meth:`to_dict` data
+        """
+        _require_msgpack()
+        return msgpack.packb(self.to_dict(), use_bin_type=True)
+
+    @classmethod
+    def from_msgpack(cls, packed: bytes) -> FreelancehuntObject:
+        """Make model from data packed by :py:meth:`to_msgpack`.
+
+        :param packed: packed data
+        :raises ImportError: msgpack is not installed
+        :return: object of this class
+        """
+        _require_msgpack()
+        return cls.from_dict(msgpack.unpackb(packed, raw=False))
+
+    def __getstate__(self) -> dict:
+        # Every set slot except the requester, the state of parts of API is kept too
+        state = dict(getattr(self, '__dict__', {}))
+        for name in _slot_names(type(self)):
+            try:
+                state[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        state.pop('_own_requester', None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def _requester(self) -> Requester:
+        try:
+            return self._own_requester
+        except AttributeError:
+            return Requester.get_requester()
+
+    @_requester.setter
+    def _requester(self, requester: Requester) -> None:
+        self._own_requester = requester
 
     def _get(
         self,
         url: str,
         filters: Optional[dict] = None,
-        page: Optional[int] = None
+        page: Optional[int] = None,
+        language: Optional[str] = None
     ) -> dict:
         if page is not None and not isinstance(page, int):
             raise ValueError("Invalid page value {page}".format(page=page))
@@ -32,15 +452,15 @@ class FreelancehuntObject:
                 filters = {}
             filters.update({'page[number]': page})
 
-        result = self._requester.request("GET", url=url, filters=filters)
+        result = self._requester.request("GET", url=url, filters=filters, language=language)
         return self.__parse_data(result["data"], result.get("meta"))
 
-    def _multi_page_get(
+    def _iter_pages(
         self,
         url: str,
         filters: Optional[dict] = None,
         pages: Optional[Union[int, Tuple[int], List[int]]] = None
-    ) -> List[dict]:
+    ) -> Iterator[List[dict]]:
         if pages is None or isinstance(pages, int):
             min_page_num = 1
             max_page_num = pages or 1
@@ -49,11 +469,98 @@ class FreelancehuntObject:
         else:
             raise ValueError("Invalid pages value {pages}".format(pages=pages))
 
-        result = []
         for page in range(min_page_num, max_page_num + 1):
-            result += self._get(url, filters, page)
+            data = self._get(url, filters, page)
+            # Empty page means that there are no more pages to get
+            if not data:
+                return
+            yield data
+
+    def _multi_page_get(
+        self,
+        url: str,
+        filters: Optional[dict] = None,
+        pages: Optional[Union[int, Tuple[int], List[int]]] = None
+    ) -> List[dict]:
+        result = []
+        for page_data in self._iter_pages(url, filters, pages):
+            result += page_data
+        return result
+
+    def _iter_parsed_pages(
+        self,
+        url: str,
+        parser: Optional[Callable[..., FreelancehuntObject]],
+        filters: Optional[dict] = None,
+        pages: Optional[Union[int, Tuple[int], List[int]]] = None
+    ) -> Iterator[List[Union[FreelancehuntObject, dict]]]:
+        """Get objects page by page, without `parser` normalized records are yielded."""
+        for page_data in self._iter_pages(url, filters, pages):
+            if parser is None:
+                yield page_data
+            else:
+                yield [parser(**data) for data in page_data]
+
+    def _multi_page_parse(
+        self,
+        url: str,
+        parser: Optional[Callable[..., FreelancehuntObject]],
+        filters: Optional[dict] = None,
+        pages: Optional[Union[int, Tuple[int], List[int]]] = None,
+        stop_when: Optional[Callable[[Union[FreelancehuntObject, dict]], bool]] = None
+    ) -> List[Union[FreelancehuntObject, dict]]:
+        """Get objects from multiple pages, stop on the first page matched by `stop_when`.
+
+        Objects matched by `stop_when` are skipped, the rest of the page
+        is kept and no more pages are requested. Without `parser` the
+        normalized records (plain dicts) are returned as is and `stop_when`
+        gets the records.
+        """
+        result = []
+        for objects in self._iter_parsed_pages(url, parser, filters, pages):
+            if stop_when is None:
+                result += objects
+                continue
+
+            kept = [obj for obj in objects if not stop_when(obj)]
+            result += kept
+            if len(kept) != len(objects):
+                break
         return result
 
+    def _get_many(
+        self,
+        urls: Iterable[str],
+        max_workers: int = 8,
+        language: Optional[str] = None
+    ) -> Dict[str, dict]:
+        """Get data from many URLs concurrently, each distinct URL once."""
+        return {
+            url: data
+            for (url, _), data in self._get_translations(urls, (language,), max_workers).items()
+        }
+
+    def _get_translations(
+        self,
+        urls: Iterable[str],
+        languages: Iterable[Optional[str]],
+        max_workers: int = 8
+    ) -> Dict[Tuple[str, Optional[str]], dict]:
+        """Get data from many URLs in every language concurrently, keyed by (url, language)."""
+        def get(key: Tuple[str, Optional[str]]) -> dict:
+            url, language = key
+            # The requester language is sent without overriding it
+            if language is None or language == self._requester.language:
+                return self._get(url)
+            return self._get(url, language=language)
+
+        keys = list(product(dict.fromkeys(urls), dict.fromkeys(languages)))
+        if len(keys) < 2:
+            return {key: get(key) for key in keys}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as executor:
+            return dict(zip(keys, executor.map(get, keys)))
+
     def _post(self, url: str, payload: Optional[dict] = None) -> dict:
         result: Response = self._requester.request("POST", url=url, payload=payload)
         data = result.get("data")
@@ -80,12 +587,201 @@ class FreelancehuntObject:
 
         attributes: dict = data.get("attributes", {})
         if attributes:
-            basic_data.update(**attributes)
+            basic_data.update(attributes)
         else:
-            basic_data.update(**data)
+            basic_data.update(data)
         return basic_data
 
+    def _get_stored(self, name: str) -> Any:
+        """Get the stored value of the field without loading or parsing it.
+
+        Fields with descriptors are read from their storage slots, so the
+        value may be raw API data (dict, list or ISO format string).
+        Properties (e.g. `status`) are read from the private slot.
+        """
+        attr = getattr(type(self), name, None)
+        if isinstance(attr, Field):
+            name = attr.storage_name
+        elif attr is None or isinstance(attr, property):
+            name = '_' + name
+        try:
+            return object.__getattribute__(self, name)
+        except AttributeError:
+            return None
+
+    def _update_from(self, other: FreelancehuntObject) -> None:
+        """Replace attributes of this object by attributes of `other` object.
+
+        The requester this object is bound to is kept.
+        """
+        for name in _slot_names(type(other)):
+            if name in _UNCOPIED_SLOTS:
+                continue
+            try:
+                value = object.__getattribute__(other, name)
+            except AttributeError:
+                # Not set in the other object, so remove it here too
+                try:
+                    object.__delattr__(self, name)
+                except AttributeError:
+                    pass
+            else:
+                object.__setattr__(self, name, value)
+
     @staticmethod
     def _filter_list_by_attr(objects: List[FreelancehuntObject],
                              attribute: str) -> list:
         return list(filter(lambda obj: getattr(obj, attribute), objects))
+
+
+class LoadableObject(FreelancehuntObject):
+    """Object with fields loaded by `load_details()` on the first access.
+
+    Fields listed in `_lazy_fields` are not stored while their value is
+    None, so an empty slot marks a not loaded field. Reading a stored field
+    is a plain slot access, only reading an empty one calls
+    :py:meth:`__getattr__`, which loads details of the object.
+
+    After details are loaded, an empty field is a known null and costs no
+    request. If `details_max_age` is set, details older than this count of
+    seconds are reloaded once on access to an empty field, or by
+    :py:meth:`refresh_if_stale`.
+
+    :var Optional[float] details_max_age: maximal age of loaded details in seconds,
+        defaults to None
+    """
+
+    __slots__ = ('_loaded_at',)
+
+    _lazy_fields = frozenset()
+    _lazy_slots = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Slots are cleared as is, fields stored in lazy slots are lazy too
+        cls._lazy_slots = tuple(
+            name for name in _slot_names(cls) if name in cls._lazy_fields
+        )
+        lazy_fields = set(cls._lazy_fields)
+        for klass in cls.__mro__:
+            for name, attr in vars(klass).items():
+                if isinstance(attr, Field) and attr.storage_name in lazy_fields:
+                    lazy_fields.add(name)
+        cls._lazy_fields = frozenset(lazy_fields)
+
+    details_max_age: Optional[float] = None
+
+    def load_details(self) -> None:
+        """Load details about current object and reload all attributes."""
+        raise NotImplementedError
+
+    @classmethod
+    def _get_parser(
+        cls,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        raw: bool = False
+    ) -> Optional[Callable[..., Union[LoadableObject, dict]]]:
+        """Get parser of API data which drops the fields out of the projection.
+
+        Dropped fields are never stored, so they are loaded on access.
+
+        :param include: schema fields to keep (required fields are always kept), defaults to None
+        :param exclude: schema fields to drop, defaults to None
+        :param raw: parser returns normalized records instead of objects, defaults to False
+        :return: parser or None for raw records without projection
+        """
+        dropped = cls._get_dropped_fields(include, exclude)
+        if not dropped:
+            return None if raw else cls.de_json
+
+        def parse(**data) -> Union[LoadableObject, dict]:
+            for key in dropped:
+                data.pop(key, None)
+            return data if raw else cls.de_json(**data)
+        return parse
+
+    @classmethod
+    def _get_dropped_fields(cls,
+                            include: Optional[Iterable[str]] = None,
+                            exclude: Optional[Iterable[str]] = None) -> Tuple[str]:
+        if include is None and exclude is None:
+            return ()
+
+        fields = set(cls.schema.fields)
+        keep = fields if include is None else set(include)
+        drop = set(exclude or ())
+        unknown = (keep | drop) - fields
+        if unknown:
+            raise ValueError(f"Unknown {cls.__name__} fields: {sorted(unknown)}")
+
+        required = drop & cls.schema.required
+        if required:
+            raise ValueError(
+                f"Required {cls.__name__} fields can not be dropped: {sorted(required)}"
+            )
+        return tuple((fields - keep - cls.schema.required) | drop)
+
+    @property
+    def loaded_at(self) -> Optional[datetime]:
+        """Date of the last details loading, None if details are not loaded."""
+        loaded_at = self._get_loaded_at()
+        return datetime.fromtimestamp(loaded_at) if loaded_at is not None else None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Check that details of this object are loaded."""
+        return self._get_loaded_at() is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Check that details are not loaded or older than `details_max_age`."""
+        loaded_at = self._get_loaded_at()
+        if loaded_at is None:
+            return True
+        max_age = self.details_max_age
+        return max_age is not None and time.time() - loaded_at > max_age
+
+    def refresh_if_stale(self) -> bool:
+        """Load details if they are not loaded or stale.
+
+        :return: True if details have been loaded, False otherwise
+        """
+        if not self.is_stale:
+            return False
+        self.load_details()
+        return True
+
+    def _mark_loaded(self) -> None:
+        """Mark that this object contains full details from API."""
+        self._loaded_at = time.time()
+
+    def _get_loaded_at(self) -> Optional[float]:
+        try:
+            return object.__getattribute__(self, '_loaded_at')
+        except AttributeError:
+            return None
+
+    def _clear_missing(self) -> None:
+        """Remove lazy fields with None value to load them on access."""
+        for name in self._lazy_slots:
+            try:
+                if object.__getattribute__(self, name) is None:
+                    object.__delattr__(self, name)
+            except AttributeError:
+                pass
+
+    def __getattr__(self, name: str):
+        """Auto load_details() if the desired attribute is not loaded yet."""
+        if name not in type(self)._lazy_fields:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        # Known null value of the loaded object
+        if not self.refresh_if_stale():
+            return None
+        try:
+            return object.__getattribute__(self, name)
+        except AttributeError:
+            return None
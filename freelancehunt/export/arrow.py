@@ -0,0 +1,298 @@
+#!usr/bin/python3
+"""Apache Arrow record batches and Parquet datasets of crawled entities.
+
+.. note:: Requires PyArrow (``pip install freelancehunt-api[arrow]``).
+"""
+from __future__ import annotations
+import os
+import uuid
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from ..core import FreelancehuntObject
+from ..utils.records import get_item
+
+
+__all__ = ('RecordBatchBuilder', 'ParquetDatasetWriter',)
+
+
+Getter = Callable[[str], Any]
+
+
+def _get_getter(item: Union[FreelancehuntObject, dict]) -> Getter:
+    """Get function reading stored values of the object or raw record."""
+    if isinstance(item, dict):
+        return item.get
+
+    # Unknown keys of models are kept in `other`
+    other = item._get_stored('other') or {}
+
+    def get(name: str) -> Any:
+        value = item._get_stored(name)
+        return other.get(name) if value is None else value
+    return get
+
+
+def _to_datetime(value: Optional[Union[str, datetime]]) -> Optional[datetime]:
+    if not value:
+        return None
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+
+def _nested(key: str, name: str) -> Callable[[Getter], Any]:
+    return lambda get: get_item(get(key), name)
+
+
+def _nested_list(key: str, name: str) -> Callable[[Getter], Any]:
+    return lambda get: [get_item(item, name) for item in get(key) or ()]
+
+
+def _nested_id(key: str) -> Callable[[Getter], Any]:
+    return _nested(key, 'id')
+
+
+def _location_id(key: str) -> Callable[[Getter], Any]:
+    return lambda get: get_item(get_item(get('location'), key), 'id')
+
+
+def _creator(name: str) -> Callable[[Getter], Any]:
+    # Raw records keep the creator in the `from` key
+    return lambda get: get_item(get('creator') or get('from'), name)
+
+
+def _field(key: str) -> Callable[[Getter], Any]:
+    return lambda get: get(key)
+
+
+def _datetime(key: str) -> Callable[[Getter], Any]:
+    return lambda get: _to_datetime(get(key))
+
+
+def _columns() -> Dict[str, List[Tuple[str, Any, Callable[[Getter], Any]]]]:
+    """Columns of every entity: name, Arrow type and value getter."""
+    timestamp = pa.timestamp('s', tz='UTC')
+    budget = [
+        ('budget_amount', pa.float64(), _nested('budget', 'amount')),
+        ('budget_currency', pa.string(), _nested('budget', 'currency')),
+    ]
+    skills = [
+        ('skill_ids', pa.list_(pa.int32()), _nested_list('skills', 'id')),
+        ('skill_names', pa.list_(pa.string()), _nested_list('skills', 'name')),
+    ]
+    profile = [
+        ('id', pa.int64(), _field('id')),
+        ('login', pa.string(), _field('login')),
+        ('type', pa.string(), _field('type')),
+        ('first_name', pa.string(), _field('first_name')),
+        ('last_name', pa.string(), _field('last_name')),
+        ('rating', pa.float64(), _field('rating')),
+        ('rating_position', pa.int32(), _field('rating_position')),
+        ('arbitrages', pa.int32(), _field('arbitrages')),
+        ('positive_reviews', pa.int32(), _field('positive_reviews')),
+        ('negative_reviews', pa.int32(), _field('negative_reviews')),
+        ('is_plus_active', pa.bool_(), _field('is_plus_active')),
+        ('is_online', pa.bool_(), _field('is_online')),
+        ('status_id', pa.int32(), _nested_id('status')),
+        ('country_id', pa.int32(), _location_id('country')),
+        ('city_id', pa.int32(), _location_id('city')),
+        ('birth_date', timestamp, _datetime('birth_date')),
+        ('created_at', timestamp, _datetime('created_at')),
+        ('visited_at', timestamp, _datetime('visited_at')),
+        ('plus_ends_at', timestamp, _datetime('plus_ends_at')),
+    ] + skills
+    return {
+        'project': [
+            ('id', pa.int64(), _field('id')),
+            ('name', pa.string(), _field('name')),
+            ('status_id', pa.int32(), _nested_id('status')),
+            ('safe_type', pa.string(), _field('safe_type')),
+            ('description', pa.string(), _field('description')),
+            ('bid_count', pa.int32(), _field('bid_count')),
+            ('is_remote_job', pa.bool_(), _field('is_remote_job')),
+            ('is_premium', pa.bool_(), _field('is_premium')),
+            ('is_only_for_plus', pa.bool_(), _field('is_only_for_plus')),
+            ('is_personal', pa.bool_(), _field('is_personal')),
+            ('employer_id', pa.int64(), _nested_id('employer')),
+            ('employer_login', pa.string(), _nested('employer', 'login')),
+            ('freelancer_id', pa.int64(), _nested_id('freelancer')),
+            ('published_at', timestamp, _datetime('published_at')),
+            ('expired_at', timestamp, _datetime('expired_at')),
+        ] + budget + skills,
+        'freelancer': profile,
+        'employer': profile,
+        'bid': [
+            ('id', pa.int64(), _field('id')),
+            ('project_id', pa.int64(), _nested_id('project')),
+            ('freelancer_id', pa.int64(), _nested_id('freelancer')),
+            ('status', pa.string(), _field('status')),
+            ('days', pa.int32(), _field('days')),
+            ('safe_type', pa.string(), _field('safe_type')),
+            ('comment', pa.string(), _field('comment')),
+            ('is_hidden', pa.bool_(), _field('is_hidden')),
+            ('is_winner', pa.bool_(), _field('is_winner')),
+            ('published_at', timestamp, _datetime('published_at')),
+        ] + budget,
+        'review': [
+            ('id', pa.int64(), _field('id')),
+            ('project_id', pa.int64(), _nested_id('project')),
+            ('creator_id', pa.int64(), _creator('id')),
+            ('creator_type', pa.string(), _creator('type')),
+            ('comment', pa.string(), _field('comment')),
+            ('is_pending', pa.bool_(), _field('is_pending')),
+            ('grades', pa.map_(pa.string(), pa.float64()),
+             lambda get: list((get('grades') or {}).items())),
+            ('published_at', timestamp, _datetime('published_at')),
+            ('pending_ends_at', timestamp, _datetime('pending_ends_at')),
+        ],
+    }
+
+
+class RecordBatchBuilder:
+    """Build Arrow record batches of entities, one batch per page.
+
+    Objects and raw records (``raw=True``) are accepted, details of
+    objects are never loaded. Skills become list columns, budget becomes
+    flat `budget_amount` and `budget_currency` columns, nested profiles
+    and projects are referenced by identifiers.
+
+    Example:
+
+    .. code-block:: python
+
+        builder = RecordBatchBuilder('project')
+        batch = builder.build(projects.get_list(raw=True))
+
+    :param str entity: "project", "freelancer", "employer", "bid" or "review"
+    """
+
+    entities = ('project', 'freelancer', 'employer', 'bid', 'review')
+
+    def __init__(self, entity: str):
+        """Create builder of record batches.
+
+        :param entity: "project", "freelancer", "employer", "bid" or "review"
+        :raises ImportError: PyArrow is not installed
+        :raises ValueError: unknown entity
+        """
+        if pa is None:
+            raise ImportError("RecordBatchBuilder requires PyArrow, install it with "
+                              "`pip install freelancehunt-api[arrow]`")
+        if entity not in self.entities:
+            raise ValueError(f"Unknown entity '{entity}', expected one of {self.entities}")
+
+        self.entity = entity
+        self._columns = _columns()[entity]
+        self.schema = pa.schema([(name, type_) for name, type_, _ in self._columns])
+
+    def build(self, items: Iterable[Union[FreelancehuntObject, dict]]) -> pa.RecordBatch:
+        """Build record batch of the entities.
+
+        :param items: objects or raw records
+        :return: record batch with the builder `schema`
+        """
+        getters = [_get_getter(item) for item in items]
+        arrays = [
+            pa.array([read(get) for get in getters], type=type_)
+            for _, type_, read in self._columns
+        ]
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+class ParquetDatasetWriter:
+    """Append pages of entities to a partitioned Parquet dataset.
+
+    Every writer adds a new file to the hive-style partition directory
+    (``<path>/crawl_date=2020-06-01/part-<id>.parquet`` by default), so
+    daily crawls are appended to the same dataset. Rows are buffered up to
+    `row_group_size` and written as row groups, so memory is bounded by
+    one row group regardless of the crawl size.
+
+    Example:
+
+    .. code-block:: python
+
+        with ParquetDatasetWriter('crawls/projects', 'project') as writer:
+            for page in range(1, 100):
+                writer.write(projects.get_list(pages=(page, page), raw=True))
+
+    :param str path: root directory of the dataset
+    :param str entity: "project", "freelancer", "employer", "bid" or "review"
+    :param dict partition: partition keys and values, defaults to the crawl date
+    :param int row_group_size: count of rows in one row group
+    :param str compression: Parquet compression codec
+    """
+
+    def __init__(self,
+                 path: str,
+                 entity: str,
+                 partition: Optional[Dict[str, Any]] = None,
+                 row_group_size: int = 10000,
+                 compression: str = 'zstd'):
+        """Create writer to the dataset.
+
+        :param path: root directory of the dataset
+        :param entity: "project", "freelancer", "employer", "bid" or "review"
+        :param partition: partition keys and values, defaults to None (`crawl_date` of today)
+        :param row_group_size: count of rows in one row group, defaults to 10000
+        :param compression: Parquet compression codec, defaults to 'zstd'
+        """
+        self.builder = RecordBatchBuilder(entity)
+        self.partition = partition or {'crawl_date': date.today().isoformat()}
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self.rows = 0
+
+        directory = os.path.join(
+            path, *(f'{key}={value}' for key, value in self.partition.items())
+        )
+        self.file_path = os.path.join(directory, f'part-{uuid.uuid4().hex}.parquet')
+        self._writer = None
+        self._batches: List[pa.RecordBatch] = []
+        self._buffered_rows = 0
+
+    def write(self, items: Iterable[Union[FreelancehuntObject, dict]]) -> None:
+        """Append page of entities.
+
+        :param items: objects or raw records
+        """
+        batch = self.builder.build(items)
+        self._batches.append(batch)
+        self._buffered_rows += batch.num_rows
+        self.rows += batch.num_rows
+        if self._buffered_rows >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows to the file."""
+        if not self._buffered_rows:
+            return
+
+        if self._writer is None:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            self._writer = pq.ParquetWriter(self.file_path, self.builder.schema,
+                                            compression=self.compression)
+        self._writer.write_table(pa.Table.from_batches(self._batches),
+                                 row_group_size=self.row_group_size)
+        self._batches = []
+        self._buffered_rows = 0
+
+    def close(self) -> None:
+        """Write buffered rows and close the file."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> ParquetDatasetWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,135 @@
+#!usr/bin/python3
+"""Newline-delimited JSON export of crawled entities.
+
+.. note:: Zstandard compression requires zstandard (``pip install freelancehunt-api[zstd]``).
+"""
+from __future__ import annotations
+import gzip
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Optional, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from ..core import FreelancehuntObject
+
+
+__all__ = ('NDJSONWriter', 'export_ndjson',)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, FreelancehuntObject):
+        return value.to_dict()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class NDJSONWriter:
+    """Write entities to a newline-delimited JSON file, one entity per line.
+
+    Every page is encoded and written as soon as it is passed, so memory
+    is bounded by one page regardless of the crawl size. Raw records
+    (``raw=True``) are written as is, objects are written as the result
+    of :py:meth:`FreelancehuntObject.to_dict`.
+
+    Example:
+
+    .. code-block:: python
+
+        with NDJSONWriter('projects.ndjson.gz', compression='gzip') as writer:
+            for page in projects.iter_pages(pages=100, raw=True):
+                writer.write(page)
+
+    :param str path: path of the file
+    :param str compression: None, "gzip" or "zstd"
+    :param int level: compression level
+    """
+
+    compressions = (None, 'gzip', 'zstd')
+
+    def __init__(self, path: str, compression: Optional[str] = None, level: Optional[int] = None):
+        """Open file to write entities to.
+
+        :param path: path of the file
+        :param compression: None, "gzip" or "zstd", defaults to None
+        :param level: compression level, defaults to None (the codec default)
+        :raises ImportError: zstandard is not installed
+        :raises ValueError: unknown compression
+        """
+        if compression not in self.compressions:
+            raise ValueError(f"Unknown compression '{compression}', "
+                             f"expected one of {self.compressions}")
+        if compression == 'zstd' and zstandard is None:
+            raise ImportError("Zstandard compression requires zstandard, install it with "
+                              "`pip install freelancehunt-api[zstd]`")
+
+        self.path = path
+        self.compression = compression
+        self.rows = 0
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'),
+                                         default=_default)
+
+        if compression == 'gzip':
+            self._file = gzip.open(path, 'wb', compresslevel=6 if level is None else level)
+        elif compression == 'zstd':
+            self._raw_file = open(path, 'wb')
+            compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+            self._file = compressor.stream_writer(self._raw_file)
+        else:
+            self._file = open(path, 'wb')
+
+    def write(self, items: Iterable[Union[FreelancehuntObject, dict]]) -> int:
+        """Append page of entities.
+
+        :param items: objects or raw records
+        :return: count of written entities
+        """
+        lines = [self._encoder.encode(item) for item in items]
+        if lines:
+            # One write per page, the trailing newline ends the last line
+            self._file.write(('\n'.join(lines) + '\n').encode('utf-8'))
+        self.rows += len(lines)
+        return len(lines)
+
+    def close(self) -> None:
+        """Flush compressed data and close the file."""
+        if self._file.closed:
+            return
+        self._file.close()
+        if self.compression == 'zstd' and not self._raw_file.closed:
+            self._raw_file.close()
+
+    def __enter__(self) -> NDJSONWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def export_ndjson(pages: Iterable[Iterable[Union[FreelancehuntObject, dict]]],
+                  path: str,
+                  compression: Optional[str] = None,
+                  level: Optional[int] = None) -> int:
+    """Write a stream of pages to a newline-delimited JSON file.
+
+    Example:
+
+    .. code-block:: python
+
+        export_ndjson(profiles.iter_freelancers_pages(pages=50, raw=True),
+                      'freelancers.ndjson.zst', compression='zstd')
+
+    :param pages: iterable of pages, e.g. returned by :py:meth:`Projects.iter_pages`
+    :param path: path of the file
+    :param compression: None, "gzip" or "zstd", defaults to None
+    :param level: compression level, defaults to None (the codec default)
+    :return: count of written entities
+    """
+    with NDJSONWriter(path, compression, level) as writer:
+        for page in pages:
+            writer.write(page)
+    return writer.rows
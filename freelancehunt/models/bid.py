@@ -63,7 +63,7 @@ Documentation example:
 from __future__ import annotations
 from typing import Type
 
-from ..core import FreelancehuntObject
+from ..core import FreelancehuntObject, NestedField, Schema
 
 from .budget import BudgetInfo
 from .user import Freelancer
@@ -89,6 +89,32 @@ class Bid(FreelancehuntObject):
     :var Project ~.project: related project information
     """
 
+    __slots__ = (
+        'id', 'status', 'days', 'safe_type', 'comment', 'currency',
+        'is_hidden', 'is_winner', '_freelancer', '_budget', '_project',
+        'other',
+    )
+
+    # Parsed on the first access
+    freelancer = NestedField(Freelancer)
+    budget = NestedField(BudgetInfo)
+    project = NestedField(Project)
+
+    schema = Schema({
+        'id': int,
+        'status': str,
+        'days': int,
+        'safe_type': str,
+        'comment': str,
+        'currency': str,
+        'is_hidden': bool,
+        'is_winner': bool,
+        'freelancer': Freelancer,
+        'budget': BudgetInfo,
+        'project': Project,
+    }, required=('id', 'status', 'days', 'safe_type', 'comment', 'is_hidden',
+                 'is_winner', 'freelancer', 'budget', 'project'), extra='other')
+
     def __init__(
         self,
         id: int,
@@ -118,7 +144,6 @@ class Bid(FreelancehuntObject):
         :param budget: estimated budget for this project
         :param project: related project information
         """
-        super().__init__()
         self.id = id
         self.status = status
         self.days = days
@@ -186,7 +211,5 @@ class Bid(FreelancehuntObject):
         if not data:
             return None
 
-        data["budget"] = BudgetInfo.de_json(**data["budget"])
-        data["freelancer"] = Freelancer.de_json(**data["freelancer"])
-        data["project"] = Project.de_json(**data["project"])
-        return cls(**data)
+        # Nested objects are made from data on the first access
+        return cls._decode(data)
@@ -26,6 +26,8 @@ class BudgetInfo(FreelancehuntObject):
     :var str currency: current currency
     """
 
+    __slots__ = ('amount', 'currency',)
+
     def __init__(
         self,
         amount: int,
@@ -37,7 +39,6 @@ class BudgetInfo(FreelancehuntObject):
         :param amount: amount of budget
         :param currency: current currency
         """
-        super().__init__()
         self.amount = amount
         self.currency = currency
 
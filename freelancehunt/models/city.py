@@ -11,7 +11,7 @@ Documentation example:
     },
 """
 from __future__ import annotations
-from typing import Type
+from typing import Dict, Optional, Type
 
 from ..core import FreelancehuntObject
 
@@ -24,17 +24,29 @@ class City(FreelancehuntObject):
 
     :var int id: city API identifier
     :var str name: city name
+    :var Optional[int] country_id: API identifier of the city country, defaults to None
+    :var Optional[Dict[str, str]] names: city names by languages, defaults to None
     """
 
-    def __init__(self, id: int, name: str, **kwargs):
+    __slots__ = ('id', 'name', 'country_id', 'names',)
+
+    def __init__(self,
+                 id: int,
+                 name: str,
+                 country_id: Optional[int] = None,
+                 names: Optional[Dict[str, str]] = None,
+                 **kwargs):
         """Create object to provide operations with City.
 
         :param id: city API identifier
         :param name: city name
+        :param country_id: API identifier of the city country (set by catalogs), defaults to None
+        :param names: city names by languages (set by catalogs), defaults to None
         """
-        super().__init__()
         self.id = id
         self.name = name
+        self.country_id = country_id
+        self.names = names
 
     @classmethod
     def de_json(cls, **data) -> Type[City]:
@@ -63,10 +63,10 @@ Documentation example:
 
 """
 from __future__ import annotations
-from typing import List, Optional, Type
 from datetime import datetime
+from typing import List, Optional, Type
 
-from ..core import FreelancehuntObject
+from ..core import DateTimeField, LoadableObject, NestedField, Schema
 
 from .user import Employer, Freelancer
 from .skill import Skill
@@ -76,7 +76,7 @@ from .budget import BudgetInfo
 __all__ = ('Contest',)
 
 
-class Contest(FreelancehuntObject):
+class Contest(LoadableObject):
     """Provide operations with Contest.
 
     :var int id: contest unique identifier
@@ -96,6 +96,40 @@ class Contest(FreelancehuntObject):
     :var Optional[int] duration_days: contest duration in days, defaults to None
     """
 
+    __slots__ = (
+        'id', 'name', 'description', 'description_html', 'application_count',
+        'updates', 'duration_days', '_final_started_at', '_published_at',
+        'other', 'links', '_employer', '_freelancer', '_budget', '_skills',
+        '_status',
+    )
+    _lazy_fields = frozenset(__slots__)
+
+    # Parsed on the first access
+    final_started_at = DateTimeField()
+    published_at = DateTimeField()
+    employer = NestedField(Employer)
+    freelancer = NestedField(Freelancer)
+    budget = NestedField(BudgetInfo)
+    skills = NestedField(Skill, many=True)
+
+    schema = Schema({
+        'id': int,
+        'name': str,
+        'budget': BudgetInfo,
+        'status': dict,
+        'description': str,
+        'description_html': str,
+        'skills': [Skill],
+        'final_started_at': datetime,
+        'employer': Employer,
+        'application_count': int,
+        'freelancer': Freelancer,
+        'updates': object,
+        'published_at': datetime,
+        'links': dict,
+        'duration_days': int,
+    }, extra='other')
+
     def __init__(
         self,
         id: int,
@@ -133,7 +167,6 @@ class Contest(FreelancehuntObject):
         :param Optional[dict] links: URLs related to contest, defaults to None
         :param Optional[int] duration_days: contest duration in days, defaults to None
         """
-        super().__init__()
         self.id = id
         self.name = name
         self.description = description
@@ -141,12 +174,8 @@ class Contest(FreelancehuntObject):
         self.application_count = application_count
         self.updates = updates
         self.duration_days = duration_days
-        self.final_started_at = (
-            datetime.fromisoformat(final_started_at) if final_started_at else None
-        )
-        self.published_at = (
-            datetime.fromisoformat(published_at) if published_at else None
-        )
+        self.final_started_at = final_started_at or None
+        self.published_at = published_at or None
         self.other = kwargs
         self.links = links
         # Framework objects
@@ -156,8 +185,13 @@ class Contest(FreelancehuntObject):
         self.skills = skills
         # Will be parsed to objects
         self._status = status
-        # Custom attributes
-        self.api_url = f"/contests/{self.id}"
+        # Not loaded fields are loaded on access
+        self._clear_missing()
+
+    @property
+    def api_url(self) -> str:
+        """Get API URL of this contest."""
+        return f"/contests/{self.id}"
 
     @property
     def status(self) -> str:
@@ -173,7 +207,8 @@ class Contest(FreelancehuntObject):
         """Load details about current Contest and reload all attributes."""
         responce = self._get(self.api_url)
         new = self.de_json(**responce)
-        self.__dict__ = new.__dict__
+        self._update_from(new)
+        self._mark_loaded()
 
     @classmethod
     def de_json(cls, **data: Optional[dict]) -> Type["Contest"]:
@@ -184,20 +219,5 @@ class Contest(FreelancehuntObject):
         if not data:
             return None
 
-        data["skills"] = [Skill.de_json(**skill) for skill in data["skills"]]
-        data["employer"] = Employer.de_json(**data["employer"])
-        data["budget"] = BudgetInfo.de_json(**data["budget"])
-        if data["freelancer"]:
-            data["freelancer"] = Freelancer.de_json(**data["freelancer"])
-        return cls(**data)
-
-    def __getattribute__(self, name):
-        """Auto load_details() if the desired attribute is None."""
-        if name.startswith("__") or name not in self.__dict__:
-            return object.__getattribute__(self, name)
-
-        value = self.__dict__[name]
-        if value is None:
-            self.load_details()
-            value = self.__dict__[name]
-        return value
+        # Nested objects are made from data on the first access
+        return cls._decode(data)
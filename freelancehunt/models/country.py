@@ -11,7 +11,7 @@ Documentation example:
         "name": "Австралия"
     },
 """
-from typing import Optional
+from typing import Dict, Optional
 
 from ..core import FreelancehuntObject
 
@@ -25,19 +25,28 @@ class Country(FreelancehuntObject):
     :var int id: country API identifier
     :var str iso2: ISO format of country identifier, defaults to None (for Profile "country" var)
     :var str name: country name
+    :var Optional[Dict[str, str]] names: country names by languages, defaults to None
     """
 
-    def __init__(self, id: int, name: str, iso2: Optional[str] = None, **kwargs):
+    __slots__ = ('id', 'iso2', 'name', 'names',)
+
+    def __init__(self,
+                 id: int,
+                 name: str,
+                 iso2: Optional[str] = None,
+                 names: Optional[Dict[str, str]] = None,
+                 **kwargs):
         """Create object to provide operations with Country.
 
         :param id: country API identifier
         :param iso2: ISO format of country identifier
         :param name: country name
+        :param names: country names by languages (set by catalogs), defaults to None
         """
-        super().__init__()
         self.id = id
         self.iso2 = iso2
         self.name = name
+        self.names = names
 
     @classmethod
     def de_json(cls, **data):
@@ -38,7 +38,7 @@ Documentation example:
 from datetime import datetime
 from typing import Optional, Type, Union
 
-from ..core import FreelancehuntObject
+from ..core import DateTimeField, FreelancehuntObject, NestedField, Schema
 
 from .user import Employer, Freelancer, Profile
 from .project import Project
@@ -60,6 +60,25 @@ class FeedMessage(FreelancehuntObject):
     :var Optional[Contest] ~.contest: linked contest object, defaults to None
     """
 
+    __slots__ = (
+        'id', '_message_from', 'message', 'is_new', '_created_at', '_project',
+        '_contest',
+    )
+
+    # Parsed on the first access
+    message_from = NestedField(Profile)
+    created_at = DateTimeField()
+
+    schema = Schema({
+        'id': int,
+        'message_from': Profile,
+        'message': str,
+        'created_at': datetime,
+        'is_new': bool,
+        'project': Project,
+        'contest': Contest,
+    }, required=('id', 'message_from', 'message', 'created_at', 'is_new'))
+
     def __init__(self,
                  id: int,
                  message_from: Union[Employer, Freelancer],
@@ -79,20 +98,25 @@ class FeedMessage(FreelancehuntObject):
         :param Optional[Project] project: linked project object, defaults to None
         :param Optional[Contest] contest: linked contest object, defaults to None
         """
-        super().__init__()
         self.id = id
         self.message_from = message_from
         self.message = message
         self.is_new = is_new
-        self.created_at = datetime.fromisoformat(created_at)
+        self.created_at = created_at
         self._project = project
         self._contest = contest
 
     @property
     def sender(self) -> Union[Employer, Freelancer]:
         """Load and get sender information."""
-        self.message_from.load_details()
-        return self.message_from
+        sender = self.message_from
+        try:
+            # Sender is loaded by the requester the message is bound to
+            sender._requester = self._own_requester
+        except AttributeError:
+            pass
+        sender.load_details()
+        return sender
 
     @property
     def type(self) -> str:
@@ -123,7 +147,7 @@ class FeedMessage(FreelancehuntObject):
         :return: object of linked Project or None.
         """
         if self._project is not None:
-            self._project = self._project.load_details()
+            self._project.refresh_if_stale()
         return self._project
 
     @property
@@ -133,9 +157,20 @@ class FeedMessage(FreelancehuntObject):
         :return: object of linked Contest or None.
         """
         if self._contest is not None:
-            self._contest = self._contest.load_details()
+            self._contest.refresh_if_stale()
         return self._contest
 
+    @property
+    def _linked(self) -> Optional[Union[Project, Contest]]:
+        return self._project if self._project is not None else self._contest
+
+    def _set_linked(self, obj: Union[Project, Contest]) -> None:
+        """Replace the linked object with the already loaded one."""
+        if isinstance(obj, Project):
+            self._project = obj
+        else:
+            self._contest = obj
+
     @classmethod
     def de_json(cls, **data) -> Type["FeedMessage"]:
         """Parse json data from API responce and make object of this class.
@@ -146,20 +181,20 @@ class FeedMessage(FreelancehuntObject):
         if not data:
             return None
 
-        data["message_from"] = Profile.de_json(**data.pop("from"))
+        data["message_from"] = data.pop("from")
 
         links = data.get("links")
         if links:
             if "project" in links:
-                project_id = links["project"].split('/')[-1]
+                project_id = int(links["project"].rstrip('/').split('/')[-1])
                 data["project"] = Project(project_id)
                 data["type"] = "project"
             elif "contest" in links:
-                contest_id = links["contest"].split('/')[-1]
+                contest_id = int(links["contest"].rstrip('/').split('/')[-1])
                 data["contest"] = Contest(contest_id)
                 data["type"] = "contest"
 
-        return cls(**data)
+        return cls._decode(data)
 
     def __str__(self) -> str:
         if self.is_project:
@@ -73,7 +73,7 @@ from datetime import datetime
 
 from typing import List, Optional, Type
 
-from ..core import FreelancehuntObject
+from ..core import DateTimeField, LoadableObject, NestedField, Schema
 from .user import Employer, Freelancer
 from .skill import Skill
 from .budget import BudgetInfo
@@ -84,7 +84,7 @@ from ..utils.errors import BadRequestError
 __all__ = ('Project',)
 
 
-class Project(FreelancehuntObject):
+class Project(LoadableObject):
     """Provide operations with Project.
 
     :var int id: project unique identifier
@@ -109,6 +109,46 @@ class Project(FreelancehuntObject):
     :var Optional[dict] links: URLs related to project, defaults to None
     """
 
+    __slots__ = (
+        'id', 'name', 'safe_type', 'description', 'description_html',
+        'bid_count', 'is_remote_job', 'is_premium', 'is_only_for_plus',
+        'is_personal', '_expired_at', '_published_at', 'updates', 'location',
+        'other', 'links', '_employer', '_freelancer', '_budget', '_skills',
+        '_status',
+    )
+    _lazy_fields = frozenset(__slots__)
+
+    # Parsed on the first access
+    expired_at = DateTimeField()
+    published_at = DateTimeField()
+    employer = NestedField(Employer)
+    freelancer = NestedField(Freelancer)
+    budget = NestedField(BudgetInfo)
+    skills = NestedField(Skill, many=True)
+
+    schema = Schema({
+        'id': int,
+        'name': str,
+        'employer': Employer,
+        'freelancer': Freelancer,
+        'budget': BudgetInfo,
+        'safe_type': str,
+        'status': dict,
+        'description': str,
+        'description_html': str,
+        'skills': [Skill],
+        'bid_count': int,
+        'is_remote_job': bool,
+        'is_premium': bool,
+        'is_only_for_plus': bool,
+        'is_personal': bool,
+        'updates': object,
+        'location': object,
+        'expired_at': datetime,
+        'published_at': datetime,
+        'links': dict,
+    }, extra='other')
+
     def __init__(self,
                  id: int,
                  name: Optional[str] = None,
@@ -154,7 +194,6 @@ class Project(FreelancehuntObject):
         :param Optional[str] published_at: string representation of the publish date, defaults to None
         :param Optional[dict] links: URLs related to project, defaults to None
         """
-        super().__init__()
         # Raw attributes
         self.id = id
         self.name = name
@@ -166,12 +205,8 @@ class Project(FreelancehuntObject):
         self.is_premium = is_premium
         self.is_only_for_plus = is_only_for_plus
         self.is_personal = is_personal
-        self.expired_at = (
-            datetime.fromisoformat(expired_at) if expired_at else None
-        )
-        self.published_at = (
-            datetime.fromisoformat(published_at) if published_at else None
-        )
+        self.expired_at = expired_at or None
+        self.published_at = published_at or None
         self.updates = updates
         self.location = location  # TODO: Make parsing for this attribute
         self.other = kwargs
@@ -183,8 +218,13 @@ class Project(FreelancehuntObject):
         self.skills = skills
         # Will be parsed to objects
         self._status = status
-        # Custom attributes
-        self.api_url = f"/projects/{self.id}"
+        # Not loaded fields are loaded on access
+        self._clear_missing()
+
+    @property
+    def api_url(self) -> str:
+        """Get API URL of this project."""
+        return f"/projects/{self.id}"
 
     @property
     def status(self) -> str:
@@ -278,7 +318,8 @@ class Project(FreelancehuntObject):
         """Load details about current Project and reload all attributes."""
         responce = self._get(self.api_url)
         new = self.de_json(**responce)
-        self.__dict__ = new.__dict__
+        self._update_from(new)
+        self._mark_loaded()
 
     @classmethod
     def de_json(cls, **data) -> Type["Project"]:
@@ -290,40 +331,14 @@ class Project(FreelancehuntObject):
         if not data:
             return None
 
-        # NOTE: Can be None for plus_only projects
-        employer = data.get("employer")
-        if employer:
-            data["employer"] = Employer.de_json(**employer)
-
-        freelancer = data.get("freelancer")
-        if freelancer:
-            data["freelancer"] = Freelancer.de_json(**freelancer)
-
-        budget = data.get("budget")
-        if budget:
-            data["budget"] = BudgetInfo.de_json(**budget)
-
-        skills = data.get("skills")
-        if skills:
-            data["skills"] = [Skill.de_json(**skill) for skill in skills]
-
+        # NOTE: Nested objects (employer can be None for plus_only
+        # projects) are made from data on the first access
         self_ = data.pop("self", None)
         if self_:
             links = data.get("links", {})
             links.update({"self": self_})
             data["links"] = links
-        return cls(**data)
-
-    def __getattribute__(self, name):
-        """Auto load_details() if the desired attribute is None."""
-        if name.startswith("__") or name not in self.__dict__:
-            return object.__getattribute__(self, name)
-
-        value = self.__dict__[name]
-        if value is None:
-            self.load_details()
-            value = self.__dict__[name]
-        return value
+        return cls._decode(data)
 
     def __str__(self):
         employer = self.employer.full_name \
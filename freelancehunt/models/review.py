@@ -62,7 +62,7 @@ Documentation example:
 from datetime import datetime
 from typing import Optional, Type, Union
 
-from ..core import FreelancehuntObject
+from ..core import DateTimeField, FreelancehuntObject, NestedField, Schema
 
 from .user import Employer, Freelancer, Profile
 from .project import Project
@@ -84,6 +84,29 @@ class Review(FreelancehuntObject):
     :var Optional[Project] ~.project: related project object, defaults to None
     """
 
+    __slots__ = (
+        'id', '_published_at', 'comment', 'is_pending', 'grades', '_creator',
+        '_pending_ends_at', '_project', 'other',
+    )
+
+    # Parsed on the first access
+    published_at = DateTimeField()
+    pending_ends_at = DateTimeField()
+    creator = NestedField(Profile)
+    project = NestedField(Project)
+
+    schema = Schema({
+        'id': int,
+        'published_at': datetime,
+        'comment': str,
+        'is_pending': bool,
+        'grades': dict,
+        'creator': Profile,
+        'pending_ends_at': datetime,
+        'project': Project,
+    }, required=('id', 'published_at', 'comment', 'is_pending', 'grades',
+                 'creator'), extra='other')
+
     def __init__(self,
                  id: int,
                  published_at: str,
@@ -105,16 +128,13 @@ class Review(FreelancehuntObject):
         :param Optional[str] pending_ends_at: string representation of the pending date, defaults to None
         :param Optional[Project] project: related project object, defaults to None
         """
-        super().__init__()
         self.id = id
-        self.published_at = datetime.fromisoformat(published_at)
+        self.published_at = published_at
         self.comment = comment
         self.is_pending = is_pending
         self.grades = grades
         self.creator = creator
-        self.pending_ends_at = (
-            datetime.fromisoformat(pending_ends_at) if pending_ends_at else None
-        )
+        self.pending_ends_at = pending_ends_at or None
         self.project = project
         self.other = kwargs
 
@@ -127,9 +147,6 @@ class Review(FreelancehuntObject):
         if not data:
             return None
 
-        data["creator"] = Profile.de_json(**data["from"])
-
-        project_info = data.get("project")
-        if project_info:
-            data["project"] = Project.de_json(**project_info)
-        return cls(**data)
+        # Nested objects are made from data on the first access
+        data["creator"] = data["from"]
+        return cls._decode(data)
@@ -10,7 +10,7 @@ Documentation example:
         "name": "Architectural design"
     }
 """
-from typing import Type
+from typing import Dict, Optional, Type
 
 from ..core import FreelancehuntObject
 
@@ -23,17 +23,21 @@ class Skill(FreelancehuntObject):
 
     :var int id: skill unique identifier
     :var str name: skill name
+    :var Optional[Dict[str, str]] names: skill names by languages, defaults to None
     """
 
-    def __init__(self, id: int, name: str, **kwargs):
+    __slots__ = ('id', 'name', 'names',)
+
+    def __init__(self, id: int, name: str, names: Optional[Dict[str, str]] = None, **kwargs):
         """Create object to provide operations with Skill.
 
         :param int id: skill unique identifier
         :param str name: skill name
+        :param names: skill names by languages (set by catalogs), defaults to None
         """
-        super().__init__()
         self.id = id
         self.name = name
+        self.names = names
 
     @classmethod
     def de_json(cls, **data) -> Type["Skill"]:
@@ -69,7 +69,7 @@ Documentation example:
 from datetime import datetime
 from typing import List, Tuple, Type, Union
 
-from ..core import FreelancehuntObject
+from ..core import DateTimeField, FreelancehuntObject, NestedField, Schema
 from ..utils.errors import BadRequestError
 
 from .user import Profile
@@ -93,6 +93,30 @@ class Thread(FreelancehuntObject):
     :param Profile recipient: thread recipient information
     """
 
+    __slots__ = (
+        'id', 'subject', '_first_post_at', '_last_post_at', 'messages_count',
+        'is_unread', 'has_attachments', '_sender', '_recipient',
+    )
+
+    # Parsed on the first access
+    first_post_at = DateTimeField()
+    last_post_at = DateTimeField()
+    sender = NestedField(Profile)
+    recipient = NestedField(Profile)
+
+    schema = Schema({
+        'id': int,
+        'subject': str,
+        'first_post_at': datetime,
+        'last_post_at': datetime,
+        'messages_count': int,
+        'is_unread': bool,
+        'has_attachments': bool,
+        'sender': Profile,
+        'recipient': Profile,
+    }, required=('id', 'subject', 'first_post_at', 'last_post_at', 'messages_count',
+                 'is_unread', 'has_attachments', 'sender', 'recipient'))
+
     def __init__(self,
                  id: int,
                  subject: str,
@@ -116,19 +140,21 @@ class Thread(FreelancehuntObject):
         :param Profile sender: thread creator information
         :param Profile recipient: thread recipient information
         """
-        super().__init__(**kwargs)
         self.id = id
         self.subject = subject
-        self.first_post_at = datetime.fromisoformat(first_post_at)
-        self.last_post_at = datetime.fromisoformat(last_post_at)
+        self.first_post_at = first_post_at
+        self.last_post_at = last_post_at
         self.messages_count = messages_count
         self.is_unread = is_unread
         self.has_attachments = has_attachments
         # Framework objects
         self.sender = sender
         self.recipient = recipient
-        # Custom attributes
-        self.api_url = f"/threads/{self.id}"
+
+    @property
+    def api_url(self) -> str:
+        """Get API URL of this thread."""
+        return f"/threads/{self.id}"
 
     def get_messages(self, pages: Union[int, Tuple[int], List[int]] = 1) -> List[ThreadMessage]:
         responce = self._multi_page_get(self.api_url, pages=pages)
@@ -156,13 +182,14 @@ class Thread(FreelancehuntObject):
 
         participants = data["participants"]
 
+        # Profiles are made from data on the first access
         sender = participants.get("from")
         if sender:
-            data["sender"] = Profile.de_json(**sender)
+            data["sender"] = sender
 
         recipient = participants.get("to")
         if recipient:
-            data["recipient"] = Profile.de_json(**recipient)
+            data["recipient"] = recipient
 
-        return cls(**data)
+        return cls._decode(data)
 
@@ -61,7 +61,7 @@ Documentation example:
 from datetime import datetime
 from typing import Type, Optional
 
-from ..core import FreelancehuntObject
+from ..core import DateTimeField, FreelancehuntObject, NestedField, Schema
 from ..utils.errors import BadRequestError
 
 from .user import Profile
@@ -82,6 +82,27 @@ class ThreadMessage(FreelancehuntObject):
     :param Profile recipient: message recipient information
     """
 
+    __slots__ = (
+        'id', '_posted_at', 'message', 'message_html', 'attachments',
+        '_sender', '_recipient', '_thread',
+    )
+
+    # Parsed on the first access
+    posted_at = DateTimeField()
+    sender = NestedField(Profile)
+    recipient = NestedField(Profile)
+
+    schema = Schema({
+        'id': int,
+        'posted_at': datetime,
+        'message': str,
+        'message_html': str,
+        'sender': Profile,
+        'recipient': Profile,
+        'attachments': object,
+        'thread': dict,
+    }, required=('id', 'posted_at', 'message', 'message_html', 'sender', 'recipient'))
+
     def __init__(self,
                  id: int,
                  posted_at: str,
@@ -102,9 +123,8 @@ class ThreadMessage(FreelancehuntObject):
         :param Profile sender: message creator information
         :param Profile recipient: message recipient information
         """
-        super().__init__(**kwargs)
         self.id = id
-        self.posted_at = datetime.fromisoformat(posted_at)
+        self.posted_at = posted_at
         self.message = message
         self.message_html = message_html
         self.attachments = attachments  # TODO: Implement attachments parsing
@@ -113,8 +133,10 @@ class ThreadMessage(FreelancehuntObject):
         self.recipient = recipient
         # Will be parsed to objects
         self._thread = thread
-        # Custom attributes
-        self._create_msg_url = f"/threads/{self._thread.get('id')}" if self._thread else None
+
+    @property
+    def _create_msg_url(self) -> Optional[str]:
+        return f"/threads/{self._thread.get('id')}" if self._thread else None
 
     def answer(self, message_html: str) -> Type["ThreadMessage"]:
         """Answer to this message in current thread.
@@ -148,16 +170,17 @@ class ThreadMessage(FreelancehuntObject):
 
         participants = data["participants"]
 
+        # Profiles are made from data on the first access
         sender = participants.get("from")
         if sender:
-            data["sender"] = Profile.de_json(**sender)
+            data["sender"] = sender
 
         recipient = participants.get("to")
         if recipient:
-            data["recipient"] = Profile.de_json(**recipient)
+            data["recipient"] = recipient
 
         meta = data.get("meta")
         if meta:
             data["thread"] = meta["thread"]
-        return cls(**data)
+        return cls._decode(data)
 
@@ -90,7 +90,7 @@ Documentation example:
 from datetime import datetime
 from typing import List, Optional, Type
 
-from ..core import FreelancehuntObject
+from ..core import DateTimeField, LoadableObject, NestedField, Schema
 
 from ..models.skill import Skill
 from ..models.country import Country
@@ -100,10 +100,10 @@ from ..models.city import City
 __all__ = ('Profile', 'Employer', 'Freelancer',)
 
 
-class Profile(FreelancehuntObject):
+class Profile(LoadableObject):
     """Provide operations with Profile.
 
-    .. note:: Information will be loaded by :py:func:`load_details` if attribute is `None`
+    .. note:: Information will be loaded by :py:func:`load_details` if attribute is not loaded yet
 
     :var int ~.id: unique profile identifier
     :var str login: profile login name
@@ -130,6 +130,51 @@ class Profile(FreelancehuntObject):
     :var dict links: URLs related to profile, defaults to None
     """
 
+    __slots__ = (
+        'id', 'login', 'type', 'first_name', 'last_name', 'avatar', 'cv',
+        'cv_html', 'rating', 'rating_position', 'arbitrages',
+        'positive_reviews', 'negative_reviews', 'is_plus_active', 'is_online',
+        'verification', 'contacts', 'links', '_skills', '_status', '_location',
+        '_birth_date', '_created_at', '_visited_at', '_plus_ends_at',
+        '_reviews',
+    )
+    _lazy_fields = frozenset(__slots__) - {'_reviews'}
+
+    # Parsed on the first access
+    birth_date = DateTimeField()
+    created_at = DateTimeField()
+    visited_at = DateTimeField()
+    plus_ends_at = DateTimeField()
+    skills = NestedField(Skill, many=True)
+
+    schema = Schema({
+        'id': int,
+        'login': str,
+        'type': str,
+        'first_name': str,
+        'last_name': str,
+        'avatar': dict,
+        'birth_date': datetime,
+        'created_at': datetime,
+        'cv': str,
+        'cv_html': str,
+        'rating': (int, float),
+        'rating_position': int,
+        'arbitrages': int,
+        'positive_reviews': int,
+        'negative_reviews': int,
+        'plus_ends_at': datetime,
+        'is_plus_active': bool,
+        'is_online': bool,
+        'visited_at': datetime,
+        'location': dict,
+        'verification': object,
+        'contacts': object,
+        'status': dict,
+        'skills': [Skill],
+        'links': dict,
+    }, required=('id', 'login', 'type', 'first_name', 'last_name'))
+
     def __init__(self,
                  id: int,
                  login: str,
@@ -185,7 +230,6 @@ class Profile(FreelancehuntObject):
         :param Optional[List[Skill]] skills: user skills, defaults to None
         :param Optional[dict] links: URLs related to profile, defaults to None
         """
-        super().__init__()
         self.id = id
         self.login = login
         self.type = type
@@ -210,24 +254,16 @@ class Profile(FreelancehuntObject):
         self._status = status
         self._location = location
         # Datetimes
-        self.birth_date = (
-            datetime.fromisoformat(birth_date)
-            if birth_date is not None else None
-        )
-        self.created_at = (
-            datetime.fromisoformat(created_at)
-            if created_at is not None else None
-        )
-        self.visited_at = (
-            datetime.fromisoformat(visited_at)
-            if visited_at is not None else None
-        )
-        self.plus_ends_at = (
-            datetime.fromisoformat(plus_ends_at)
-            if plus_ends_at is not None else None
-        )
-        # Custom attributes
-        self._api_url = f"/{self.type}s/{self.id}"
+        self.birth_date = birth_date
+        self.created_at = created_at
+        self.visited_at = visited_at
+        self.plus_ends_at = plus_ends_at
+        # Not loaded fields are loaded on access
+        self._clear_missing()
+
+    @property
+    def _api_url(self) -> str:
+        return f"/{self.type}s/{self.id}"
 
     @property
     def status(self) -> str:
@@ -288,7 +324,18 @@ class Profile(FreelancehuntObject):
         """Load details about current User and reload all attributes."""
         responce = self._get(self._api_url)
         new = self.de_json(**responce)
-        self.__dict__ = new.__dict__
+        self._update_from(new)
+        self._mark_loaded()
+
+    @classmethod
+    def _identity_type(cls, data: dict) -> Type["Profile"]:
+        """Get type of the object made from `data` by :py:meth:`de_json`."""
+        if cls is Profile:
+            if data.get("type") == "freelancer":
+                return Freelancer
+            elif data.get("type") == "employer":
+                return Employer
+        return cls
 
     @classmethod
     def de_json(cls, **data) -> Type["Profile"]:
@@ -303,33 +350,20 @@ class Profile(FreelancehuntObject):
         data["links"] = {
             "self": {"api": data.pop("self")}
         } if data.get("self") else data.get('links') or {}
-        skills = data.get("skills")
-
-        if skills:
-            data["skills"] = [Skill.de_json(**skill) for skill in skills]
 
         if cls is Profile:
             if data["type"] == "freelancer":
-                return Freelancer(**data)
+                return Freelancer._decode(data)
             elif data["type"] == "employer":
-                return Employer(**data)
-        return cls(**data)
-
-    def __getattribute__(self, name):
-        """Auto load_details() if the desired attribute is None."""
-        if name.startswith("__") or name not in self.__dict__:
-            return object.__getattribute__(self, name)
-
-        value = self.__dict__[name]
-        if value is None:
-            self.load_details()
-            value = self.__dict__[name]
-        return value
+                return Employer._decode(data)
+        return cls._decode(data)
 
 
 class Employer(Profile):
     """Provide operations with Employer profile."""
 
+    __slots__ = ()
+
     def __str__(self):
         return f'Employer {self.id} ({self.full_name})'
 
@@ -337,5 +371,7 @@ class Employer(Profile):
 class Freelancer(Profile):
     """Provide operations with Freelancer profile."""
 
+    __slots__ = ()
+
     def __str__(self):
         return f'Freelancer {self.id} ({self.full_name})'
@@ -1,7 +1,7 @@
 #!usr/bin/python3
 """`Freelancehunt Documentation - Bids API <https://apidocs.freelancehunt.com/?version=latest#d327b03a-1ab8-4c5f-b060-63a8216c1d4e>`_."""
 from __future__ import annotations
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from ..core import FreelancehuntObject
 
@@ -29,12 +29,14 @@ class Bids(FreelancehuntObject):
     def get_project_bids(self,
                          project_id: int,
                          status: Optional[str] = None,
-                         is_winner: bool = False) -> List[Bid]:
+                         is_winner: bool = False,
+                         raw: bool = False) -> Union[List[Bid], List[dict]]:
         """Get filtered projects bid.
 
         :param project_id: project where find bids
         :param status: get bids with the desired status or all (None), defaults to None
         :param is_winner: get winner bid or all (False), defaults to False
+        :param raw: return normalized records (plain dicts) instead of objects, defaults to False
         :return: list of filtered bids
         """
         filters = {}
@@ -45,15 +47,19 @@ class Bids(FreelancehuntObject):
             filters.update({"status": status})
 
         raw_bids = self._get(f"/projects/{project_id}/bids", filters=filters)
+        if raw:
+            return raw_bids
         return [Bid.de_json(**bid) for bid in raw_bids]
 
     def get_my_bids(self,
                     project_id: Optional[int] = None,
-                    status: Optional[str] = None) -> List[Bid]:
+                    status: Optional[str] = None,
+                    raw: bool = False) -> Union[List[Bid], List[dict]]:
         """Get my filtered bids.
 
         :param project_id: get bid for the desired project or all (None), defaults to None
         :param status: get bids with the desired status, defaults to None
+        :param raw: return normalized records (plain dicts) instead of objects, defaults to False
         :return: list of my filtered bids
         """
         filters = {}
@@ -64,6 +70,8 @@ class Bids(FreelancehuntObject):
             filters.update({"status": status})
 
         raw_bids = self._get("/my/bids", filters=filters)
+        if raw:
+            return raw_bids
         return [Bid.de_json(**bid) for bid in raw_bids]
 
     @property
@@ -0,0 +1,416 @@
+#!usr/bin/python3
+"""Base class for static catalogs of API (skills, countries, cities)."""
+from __future__ import annotations
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from ..core import FreelancehuntObject
+from ..utils.errors import SchemaError
+from ..utils.mapped import CatalogFile
+from ..utils.requester import DEFAULT_LANGUAGE, LANGUAGES
+from ..utils.search import SearchIndex
+from ..utils.storage import JSONStorage
+
+
+__all__ = ('Catalog',)
+
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogState(NamedTuple):
+    """Loaded entries of a catalog, their indexes by attribute values and by names."""
+
+    items: List[Any]
+    indexes: Dict[str, Dict[Any, Any]]
+    search: SearchIndex
+    # Timestamp of the API responce with the entries
+    loaded_at: float
+
+
+class Catalog(FreelancehuntObject):
+    """Provide indexed lookups in a static catalog.
+
+    Entries are loaded on the first access and indexed by every attribute
+    of `_index_keys`, so lookups by the attribute value do not scan the
+    list. If values are not unique, the first entry is kept in the index.
+    Names are indexed by :py:class:`SearchIndex` for :py:meth:`search`.
+    Entries and indexes are replaced at once by :py:meth:`update`.
+
+    Entries are cached by language: the `language` of the catalog or, if
+    it is not set, the language of the requester at the time of access,
+    so one catalog serves every language without mixing them.
+    :py:meth:`update_languages` requests several languages concurrently
+    and merges names of entries with the same id into their `names`
+    (e.g. ``skill.names['uk']``).
+
+    With `max_age` the entries older than this count of seconds are
+    refreshed on read (stale-while-revalidate): the read returns the
+    current entries at once and one background refresh per language
+    requests the new ones, which replace the old entries and indexes at
+    once when it completes. If it fails, the current entries are kept
+    and the refresh is retried not earlier than `min_refresh_interval`.
+    With `background_refresh` False the read waits for the refresh.
+
+    With `snapshot_path` the entries are saved to a local snapshot file
+    after every update, and the first access loads the snapshot instead
+    of requesting API. A snapshot older than `snapshot_max_age` is still
+    used, but it is updated in a background thread (or before the access
+    if `background_refresh` is False). Snapshots of another format
+    version, another catalog or another language are ignored, use the
+    ``{language}`` placeholder in the path to keep one per language.
+
+    With `mapped_path` lookups by the indexed attributes are served from
+    a read-only memory-mapped file written by :py:meth:`save_mapped`, so
+    processes share one copy of the catalog and no entries are loaded
+    on start. Entries are made on lookup; the list and the search index
+    are made from the file on the first access to them. The file serves
+    the language it is written in, and is not refreshed by reads.
+
+    Subclasses set `_url` and `_model` (a model with `de_json()`).
+
+    :param str token: your API token, optional
+    :param str snapshot_path: path to the snapshot file, optional
+    :param float snapshot_max_age: maximal age of the snapshot in seconds, optional
+    :param bool background_refresh: update stale entries in a background thread, optional
+    :param str mapped_path: path to the memory-mapped catalog file, optional
+    :param str language: language of entries ('en', 'ru' or 'uk'), optional
+    :param float max_age: age of entries in seconds to refresh them on read, optional
+    """
+
+    # Format of snapshot files, snapshots of other versions are ignored
+    snapshot_version = 2
+
+    # Maximal count of concurrent requests
+    max_workers: int = 8
+
+    # Minimal interval between background refreshes of one language in seconds,
+    # so failing refreshes do not flood API
+    min_refresh_interval: float = 60
+
+    _url: str = None
+    _model: type = None
+
+    # Attributes (or tuples of attributes) of entries with hash indexes
+    _index_keys: Tuple[Union[str, Tuple[str]]] = ('id', 'name')
+
+    def __init__(self,
+                 token: Optional[str] = None,
+                 snapshot_path: Optional[str] = None,
+                 snapshot_max_age: Optional[float] = 24 * 60 * 60,
+                 background_refresh: bool = True,
+                 mapped_path: Optional[str] = None,
+                 language: Optional[str] = None,
+                 max_age: Optional[float] = None,
+                 **kwargs):
+        """Create catalog.
+
+        :param token: your API token (only for directly usage, not inside Client class),
+            defaults to None
+        :param snapshot_path: path to the snapshot file, may contain ``{language}``,
+            defaults to None (no snapshot)
+        :param snapshot_max_age: maximal age of the snapshot in seconds, defaults to one day,
+            None means that the snapshot is never updated
+        :param background_refresh: update stale entries in a background thread, defaults to True
+        :param mapped_path: path to the memory-mapped catalog file, defaults to None
+        :param language: language of entries and of the requester made with `token`,
+            defaults to None (the language of the requester)
+        :param max_age: age of entries in seconds to refresh them on read, defaults to None (never)
+        :raises ValueError: the mapped file is not a catalog file or the language is not supported
+        """
+        if language is not None and language not in LANGUAGES:
+            raise ValueError(f"Language must be one of {LANGUAGES}, not {language!r}")
+        if language is not None:
+            # The requester made with the token is in the same language
+            kwargs['language'] = language
+        super().__init__(token, **kwargs)
+        self.language = language
+        self.snapshot_path = snapshot_path
+        self.snapshot_max_age = snapshot_max_age
+        self.background_refresh = background_refresh
+        self.max_age = max_age
+        # Loaded entries by languages
+        self._states: Dict[Optional[str], CatalogState] = {}
+        self._lock = threading.Lock()
+        # Background refreshes and times of their starts by languages
+        self._refresh_lock = threading.Lock()
+        self._refresh_threads: Dict[Optional[str], threading.Thread] = {}
+        self._refresh_started: Dict[Optional[str], float] = {}
+        self._mapped = CatalogFile(mapped_path) if mapped_path else None
+
+    def update(self) -> None:
+        """Update static information from API."""
+        self._update(self._get_language())
+
+    def update_languages(self, languages: Iterable[str] = LANGUAGES) -> None:
+        """Update entries in several languages from API concurrently.
+
+        Every entry gets `names` with its names in all the languages,
+        e.g. ``{'en': 'Kyiv', 'ru': 'Киев', 'uk': 'Київ'}``. Entries of
+        every language are cached, and saved to snapshots if the snapshot
+        path has the ``{language}`` placeholder (only the catalog language
+        is saved otherwise).
+
+        :param languages: languages to request, defaults to all languages of API
+        """
+        languages = list(dict.fromkeys(languages))
+        loaded_at = time.time()
+        urls = self._get_urls()
+        responces = self._get_translations(urls, languages, self.max_workers)
+        items = {
+            language: self._make_items(urls, {url: responces[url, language] for url in urls})
+            for language in languages
+        }
+
+        # Names of the same entry in every language
+        names = {}
+        for language, language_items in items.items():
+            for item in language_items:
+                names.setdefault(item.id, {})[language] = item.name
+
+        for language, language_items in items.items():
+            for item in language_items:
+                item.names = names[item.id]
+            self._set_items(language_items, loaded_at, language)
+            if self.snapshot_path and \
+                    ('{language}' in self.snapshot_path or language == self._get_language()):
+                self.save_snapshot(language=language)
+
+    @property
+    def list(self) -> List[Any]:
+        """Get list of all entries.
+
+        :return: list of entries
+        """
+        return self._get_state().items
+
+    @property
+    def loaded_at(self) -> Optional[datetime]:
+        """Date of the API responce with the entries, None if they are not loaded."""
+        state = self._states.get(self._get_language())
+        return datetime.fromtimestamp(state.loaded_at) if state is not None else None
+
+    def search(self, text: str, limit: int = 10, fuzzy: bool = True) -> List[Any]:
+        """Get entries with the best matching names, e.g. for autocomplete.
+
+        Case and diacritics are ignored, names starting with the text are
+        ranked first, then names with a word starting with the text, with
+        the text inside, and with typos.
+
+        :param text: search query
+        :param limit: maximal count of results, defaults to 10
+        :param fuzzy: find names with typos if there are not enough matches, defaults to True
+        :return: list of entries, the best first
+        """
+        return self._get_state().search.search(text, limit, fuzzy)
+
+    def save_snapshot(self, path: Optional[str] = None, language: Optional[str] = None) -> None:
+        """Save the loaded entries to the snapshot file.
+
+        :param path: path to the snapshot file, defaults to None (`snapshot_path`)
+        :param language: language of the entries, defaults to None (the catalog language)
+        """
+        language = language or self._get_language()
+        state = self._get_state(language)
+        self._get_snapshot(path, language).save({
+            'version': self.snapshot_version,
+            'url': self._url,
+            'language': language,
+            'loaded_at': state.loaded_at,
+            'items': [item.to_dict() for item in state.items],
+        })
+
+    def load_snapshot(self, path: Optional[str] = None, language: Optional[str] = None) -> bool:
+        """Replace entries by the entries from the snapshot file.
+
+        :param path: path to the snapshot file, defaults to None (`snapshot_path`)
+        :param language: language of the entries, defaults to None (the catalog language)
+        :return: True if the snapshot is loaded, False if it is missing, corrupt or not compatible
+        """
+        language = language or self._get_language()
+        storage = self._get_snapshot(path, language)
+        try:
+            snapshot = storage.load() if storage is not None else None
+            if not isinstance(snapshot, dict) or snapshot.get('version') != self.snapshot_version \
+                    or snapshot.get('url') != self._url or snapshot.get('language') != language:
+                return False
+
+            items = [self._model.from_dict(data) for data in snapshot['items']]
+            loaded_at = float(snapshot['loaded_at'])
+        except (OSError, ValueError, KeyError, TypeError, SchemaError) as error:
+            # Corrupt snapshot is replaced by the next update
+            logger.warning("Snapshot %s of %s is not loaded: %r",
+                           storage.path, type(self).__name__, error)
+            return False
+
+        self._set_items(items, loaded_at, language)
+        return True
+
+    def save_mapped(self, path: str) -> None:
+        """Write the loaded entries to a memory-mapped catalog file.
+
+        The file is replaced atomically, processes which have mapped the
+        old file keep reading it until they open the new one. Only the
+        catalog language is written, `names` of entries are left out.
+
+        :param path: path to the file
+        """
+        language = self._get_language()
+        state = self._get_state(language)
+        items = []
+        for item in state.items:
+            data = item.to_dict()
+            data.pop('names', None)
+            items.append(data)
+        CatalogFile.write(path, items, keys=self._index_keys,
+                          loaded_at=state.loaded_at, language=language)
+
+    @property
+    def is_stale(self) -> bool:
+        """Check that entries are not loaded or older than `max_age`.
+
+        Without `max_age` the age is compared with `snapshot_max_age`.
+        """
+        max_age = self.max_age if self.max_age is not None else self.snapshot_max_age
+        return self._is_stale(self._get_language(), max_age)
+
+    def _get_language(self) -> str:
+        """Get language of entries: of the catalog, of the requester or the API default one."""
+        return self.language or self._requester.language or DEFAULT_LANGUAGE
+
+    def _get_snapshot(self, path: Optional[str], language: Optional[str]) -> Optional[JSONStorage]:
+        path = path or self.snapshot_path
+        if not path:
+            return None
+        return JSONStorage(path.format(language=language or 'default'))
+
+    def _is_stale(self, language: Optional[str], max_age: Optional[float]) -> bool:
+        state = self._states.get(language)
+        if state is None:
+            return True
+        return max_age is not None and time.time() - state.loaded_at > max_age
+
+    def _get_state(self, language: Optional[str] = None) -> CatalogState:
+        language = language or self._get_language()
+        state = self._states.get(language)
+        if state is not None:
+            max_age = self.max_age
+            if max_age is not None and time.time() - state.loaded_at > max_age:
+                self._refresh(language, max_age)
+                # Not changed unless the refresh is made in this thread
+                return self._states[language]
+            return state
+
+        with self._lock:
+            # Loaded by another thread while waiting for the lock
+            mapped = self._mapped
+            stale = False
+            if language in self._states:
+                pass
+            elif mapped is not None and mapped.language in (None, language):
+                items = [self._model.from_dict(data) for data in mapped]
+                self._set_items(items, mapped.loaded_at, language)
+            elif not self.load_snapshot(language=language):
+                self._update(language)
+            else:
+                stale = self._is_stale(language, self.snapshot_max_age)
+        if stale:
+            self._refresh(language, self.snapshot_max_age)
+        return self._states[language]
+
+    def _update(self, language: Optional[str]) -> None:
+        """Update entries in the language from API, entries with `names` in all their languages."""
+        state = self._states.get(language)
+        names = next((item.names for item in state.items if getattr(item, 'names', None)),
+                     None) if state is not None else None
+        if names:
+            # Names merged by update_languages() are merged again, not dropped
+            self.update_languages([language, *names])
+            return
+
+        loaded_at = time.time()
+        urls = self._get_urls()
+        responces = self._get_many(urls, self.max_workers, language)
+        self._set_items(self._make_items(urls, responces), loaded_at, language)
+        if self.snapshot_path:
+            self.save_snapshot(language=language)
+
+    def _refresh(self, language: Optional[str], max_age: Optional[float]) -> None:
+        """Update stale entries, in background if it is enabled.
+
+        One refresh per language runs at a time.
+        """
+        if not self.background_refresh:
+            with self._lock:
+                # Refreshed by another thread while waiting for the lock
+                if self._is_stale(language, max_age):
+                    self._update(language)
+            return
+
+        with self._refresh_lock:
+            thread = self._refresh_threads.get(language)
+            if thread is not None and thread.is_alive():
+                return
+            now = time.time()
+            started = self._refresh_started.get(language, -float('inf'))
+            if now - started < self.min_refresh_interval:
+                return
+            self._refresh_started[language] = now
+            thread = threading.Thread(
+                target=self._background_update,
+                args=(language,),
+                name=f'{type(self).__name__}-{language}-refresh',
+                daemon=True,
+            )
+            self._refresh_threads[language] = thread
+            thread.start()
+
+    def _background_update(self, language: Optional[str]) -> None:
+        try:
+            self._update(language)
+        except Exception:
+            # The current entries are kept until the next refresh
+            logger.exception("Background update of %s failed", type(self).__name__)
+
+    def _get_urls(self) -> Dict[str, dict]:
+        """Get URLs of entries with the attributes to set on their entries."""
+        return {self._url: {}}
+
+    def _make_items(self, urls: Dict[str, dict], responces: Dict[str, List[dict]]) -> List[Any]:
+        """Make entries from API data of the URLs."""
+        return [
+            self._model.de_json(**attributes, **data)
+            for url, attributes in urls.items()
+            for data in responces[url]
+        ]
+
+    def _set_items(self,
+                   items: List[Any],
+                   loaded_at: Optional[float] = None,
+                   language: Optional[str] = None) -> None:
+        indexes = {key: {} for key in self._index_keys}
+        for item in items:
+            for key, index in indexes.items():
+                if isinstance(key, tuple):
+                    value = tuple(getattr(item, name, None) for name in key)
+                    if None in value:
+                        continue
+                else:
+                    value = getattr(item, key, None)
+                if value is not None:
+                    index.setdefault(value, item)
+        # Readers see either the old or the new state, never a mix of them
+        self._states[language or self._get_language()] = CatalogState(
+            items, indexes, SearchIndex(items), time.time() if loaded_at is None else loaded_at)
+
+    def _lookup(self, key: str, value: Any) -> Optional[Any]:
+        """Get entry with the attribute value or None."""
+        language = self._get_language()
+        mapped = self._mapped
+        if mapped is not None and mapped.language in (None, language):
+            data = mapped.lookup(key, value)
+            return self._model.from_dict(data) if data is not None else None
+        return self._get_state(language).indexes[key].get(value)
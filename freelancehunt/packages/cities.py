@@ -1,17 +1,17 @@
 #!usr/bin/python3
 """`Freelancehunt Documentation - Cities API <https://apidocs.freelancehunt.com/?version=latest#65a2a9b4-b52d-4706-8c54-990600b58c2b>`_."""
 from __future__ import annotations
-from typing import List, Optional
-
-from ..core import FreelancehuntObject
+from typing import Dict, Iterable, List, Optional
 
 from ..models.city import City
 
+from .catalog import Catalog
+
 
-__all__ = ('Cities',)
+__all__ = ('Cities', 'AllCities',)
 
 
-class Cities(FreelancehuntObject):
+class Cities(Catalog):
     """Provide operations with Cities API part.
 
     .. note:: This module contains static content. It may be `update()`, but loaded info does not change on the API side.
@@ -22,6 +22,8 @@ class Cities(FreelancehuntObject):
     :param int country_id: API-related country identifier to get cities of it
     """
 
+    _model = City
+
     def __init__(self, country_id: int, token: Optional[str] = None, **kwargs):
         """Create object to provide operations with Cities API part.
 
@@ -33,13 +35,8 @@ class Cities(FreelancehuntObject):
 
         self._url = f'/cities/{self.country_id}'
 
-    def update(self) -> None:
-        """Update static information from API."""
-        cities_data = self._get(self._url)
-        self._cities = [
-            City.de_json(**city)
-            for city in cities_data
-        ]
+    def _get_urls(self) -> Dict[str, dict]:
+        return {self._url: {'country_id': self.country_id}}
 
     @property
     def list(self) -> List[City]:
@@ -47,23 +44,135 @@ class Cities(FreelancehuntObject):
 
         :return: list of cities.
         """
-        if not hasattr(self, '_cities'):
-            self.update()
-        return self._cities
+        return self._get_state().items
 
     def get(self, city_id: int) -> City:
         """Get the desired city by city_id.
 
         :param city_id: id of the desired city
             (https://apidocs.freelancehunt.com/?version=latest#65a2a9b4-b52d-4706-8c54-990600b58c2b).
+        :raises ValueError: City not found.
+        :return: the desired city.
+        """
+        city = self._lookup('id', city_id)
+        if city is None:
+            raise ValueError(f'City with id {city_id} not found')
+        return city
+
+    def get_by_name(self, name: str) -> City:
+        """Get the desired city by exact name.
+
+        :param name: name of the desired city.
+        :raises ValueError: City not found.
         :return: the desired city.
         """
-        return filter(lambda city: city.id == city_id, self.list)
+        city = self._lookup('name', name)
+        if city is None:
+            raise ValueError(f'City with name {name} not found')
+        return city
 
     def find(self, text: str) -> List[City]:
         """Find the names of the cities that contain the desired text.
 
+        Case and diacritics are ignored, see :py:meth:`search` for ranked results.
+
+        :param text: the desired text that need to be in an city name.
+        :return: list of cities with an text in name.
+        """
+        return self._get_state().search.find(text)
+
+
+class AllCities(Catalog):
+    """Provide operations with cities of all countries.
+
+    Cities of every country are requested concurrently, at most
+    `max_workers` requests at once, and indexed together by id and by
+    country and name. Every city has `country_id` set.
+
+    Example:
+
+    .. code-block:: python
+
+        cities = AllCities(snapshot_path='cities.json')
+        city = cities.get(profile._location['city']['id'])
+
+    .. warning:: For directly usage please set `token` argument.
+
+    :param str token: your API token, optional
+    :param countries: identifiers of countries to load, optional
+    :param int max_workers: maximal count of concurrent requests, optional
+    """
+
+    _url = '/cities'
+    _model = City
+    _index_keys = ('id', ('country_id', 'name'))
+
+    def __init__(self,
+                 token: Optional[str] = None,
+                 countries: Optional[Iterable[int]] = None,
+                 max_workers: int = 8,
+                 **kwargs):
+        """Create object to provide operations with cities of all countries.
+
+        :param token: your API token (only for directly usage, not inside Client class),
+            defaults to None
+        :param countries: identifiers of countries to load, defaults to None (all countries)
+        :param max_workers: maximal count of concurrent requests, defaults to 8
+        """
+        super().__init__(token, **kwargs)
+        self.countries = list(countries) if countries is not None else None
+        self.max_workers = max_workers
+
+    @property
+    def list(self) -> List[City]:
+        """Get list of cities of all countries.
+
+        :return: list of cities.
+        """
+        return self._get_state().items
+
+    def get(self, city_id: int) -> City:
+        """Get the desired city by city_id.
+
+        :param city_id: id of the desired city
+        :raises ValueError: City not found.
+        :return: the desired city.
+        """
+        city = self._lookup('id', city_id)
+        if city is None:
+            raise ValueError(f'City with id {city_id} not found')
+        return city
+
+    def get_by_name(self, country_id: int, name: str) -> City:
+        """Get the desired city of the country by exact name.
+
+        :param country_id: id of the city country
+        :param name: name of the desired city.
+        :raises ValueError: City not found.
+        :return: the desired city.
+        """
+        city = self._lookup(('country_id', 'name'), (country_id, name))
+        if city is None:
+            raise ValueError(f'City with name {name} not found in country {country_id}')
+        return city
+
+    def find(self, text: str) -> List[City]:
+        """Find the names of the cities that contain the desired text.
+
+        Case and diacritics are ignored, see :py:meth:`search` for ranked results.
+
         :param text: the desired text that need to be in an city name.
         :return: list of cities with an text in name.
         """
-        return list(filter(lambda country: text in country.name, self.list))
+        return self._get_state().search.find(text)
+
+    def _get_urls(self) -> Dict[str, dict]:
+        from .countries import Countries
+
+        country_ids = self.countries
+        if country_ids is None:
+            # Countries are requested with the same token and language
+            countries = Countries(language=self.language)
+            countries._requester = self._requester
+            country_ids = [country.id for country in countries.list]
+        return {f'/cities/{country_id}': {'country_id': country_id} for country_id in country_ids}
@@ -2,17 +2,16 @@
 """`Freelancehunt Documentation - Countries API <https://apidocs.freelancehunt.com/?version=latest#d781d975-810f-47d6-b267-5179ed8a5562>`_."""
 from typing import List, Optional
 
-from ..core import FreelancehuntObject
-
 from ..models.country import Country
 
+from .catalog import Catalog
 from .cities import Cities
 
 
 __all__ = ('Countries',)
 
 
-class Countries(FreelancehuntObject):
+class Countries(Catalog):
     """Provide operations with Countries API part.
 
     .. note:: This module contains static content. It may be `update()`,
@@ -23,6 +22,10 @@ class Countries(FreelancehuntObject):
     :param str token: your API token, optional
     """
 
+    _url = '/countries'
+    _model = Country
+    _index_keys = ('id', 'iso2', 'name')
+
     def __init__(self, token: Optional[str] = None, **kwargs):
         """Create object to provide operations with Countries API part.
 
@@ -30,23 +33,13 @@ class Countries(FreelancehuntObject):
         """
         super().__init__(token, **kwargs)
 
-    def update(self):
-        """Update static information from API."""
-        responce = self._get('/countries')
-        self._countries = [
-            Country.de_json(**country)
-            for country in responce
-        ]
-
     @property
     def list(self) -> List[Country]:
         """Get list of all countries.
 
         :return: list of countries
         """
-        if not hasattr(self, '_countries'):
-            self.update()
-        return self._countries
+        return self._get_state().items
 
     def get(self,
             country_id: Optional[int] = None,
@@ -71,20 +64,33 @@ class Countries(FreelancehuntObject):
             attr = 'iso2'
             check = iso_code
 
-        filtered_list = list(filter(lambda c: getattr(c, attr) == check,
-                                    self.list))
-        if not filtered_list:
+        country = self._lookup(attr, check)
+        if country is None:
             raise ValueError(f'Country with {attr} "{check}" not found')
-        return filtered_list.pop()
+        return country
+
+    def get_by_name(self, name: str) -> Country:
+        """Get the desired country by exact name.
+
+        :param name: name of the desired country
+        :raises ValueError: Contry not found
+        :return: the desired country
+        """
+        country = self._lookup('name', name)
+        if country is None:
+            raise ValueError(f'Country with name "{name}" not found')
+        return country
 
     def find(self, text: str) -> List[Country]:
         """Find countries with the desired text.
 
+        Case and diacritics are ignored, see :py:meth:`search` for ranked results.
+
         :param text: text in country name
         :raises ValueError: No countries found
         :return: list of countries with an text in name
         """
-        filtered_list = list(filter(lambda c: text in c.name, self.list))
+        filtered_list = self._get_state().search.find(text)
         if not filtered_list:
             raise ValueError(f'Country with text {text} not found')
         return filtered_list
@@ -1,10 +1,12 @@
 #!usr/bin/python3
 """`Freelancehunt Documentation - Feed API <https://apidocs.freelancehunt.com/?version=latest#d229fc5c-e10a-41ff-97fc-2c5129f4b3da>`_."""
-from typing import List, Optional
+from typing import Dict, List, Optional, Union
 
 from ..core import FreelancehuntObject
 
 from ..models.feed import FeedMessage
+from ..models.project import Project
+from ..models.contest import Contest
 
 
 __all__ = ('Feed',)
@@ -18,22 +20,81 @@ class Feed(FreelancehuntObject):
     :param str token: your API token, optional
     """
 
-    _latest_feed = []
-
     def __init__(self, token: Optional[str] = None, **kwargs):
         """Creates object to provide operations with Feed API part.
 
         :param token: your API token (only for directly usage, not inside Client class), defaults to None
         """
         super().__init__(token, **kwargs)
+        self._latest_feed = None
+        # Loaded linked objects by API URL
+        self._linked_cache: Dict[str, Union[Project, Contest]] = {}
+
+    def update(self, prefetch: bool = False, max_workers: int = 8):
+        """Get latest feed information.
+
+        :param prefetch: load linked projects and contests concurrently, defaults to False
+        :param max_workers: maximal count of concurrent requests for prefetch, defaults to 8
+        """
+        self._latest_feed = self.get_list()
+        if prefetch:
+            self.hydrate(max_workers)
+
+    def get_list(self, raw: bool = False) -> Union[List[FeedMessage], List[dict]]:
+        """Get feed messages from API, they are not kept in :py:attr:`list`.
 
-    def update(self):
-        """Get latest feed information."""
+        :param raw: return normalized records (plain dicts) instead of objects, defaults to False
+        :return: list of feed messages
+        """
         responce = self._get('/my/feed')
-        self._latest_feed = [
+        if raw:
+            return responce
+        messages = [
             FeedMessage.de_json(**message)
             for message in responce
         ]
+        for message in messages:
+            self._bind(message)
+        return messages
+
+    def hydrate(self, max_workers: int = 8) -> None:
+        """Load projects and contests linked to feed messages concurrently.
+
+        Every distinct project or contest is requested once, already loaded
+        and not stale objects are reused.
+
+        :param max_workers: maximal count of concurrent requests, defaults to 8
+        """
+        messages = [message for message in self.list if message._linked is not None]
+        urls = {message._linked.api_url for message in messages}
+        # Keep only fresh objects linked to the current feed
+        self._linked_cache = {
+            url: obj for url, obj in self._linked_cache.items()
+            if url in urls and not obj.is_stale
+        }
+        # Objects loaded before on access are reused too
+        for message in messages:
+            if not message._linked.is_stale:
+                self._linked_cache.setdefault(message._linked.api_url, message._linked)
+
+        responces = self._get_many(
+            (url for url in urls if url not in self._linked_cache),
+            max_workers
+        )
+        for message in messages:
+            url = message._linked.api_url
+            if url not in self._linked_cache:
+                linked = type(message._linked).de_json(**responces[url])
+                linked._requester = self._requester
+                linked._mark_loaded()
+                self._linked_cache[url] = linked
+            message._set_linked(self._linked_cache[url])
+
+    def _bind(self, message: FeedMessage) -> None:
+        """Make the message and its linked object use the requester of this feed."""
+        message._requester = self._requester
+        if message._linked is not None:
+            message._linked._requester = self._requester
 
     def read(self):
         """Mark feed as read."""
@@ -56,6 +117,6 @@ class Feed(FreelancehuntObject):
     @property
     def list(self) -> List[FeedMessage]:
         """Get all feed messages."""
-        if not self._latest_feed:
+        if self._latest_feed is None:
             self.update()
         return self._latest_feed
@@ -1,6 +1,6 @@
 #!usr/bin/python3
 """`Freelancehunt Documentation - Profiles API <https://apidocs.freelancehunt.com/?version=latest#7dfb1bc1-4d54-46d8-9c01-75b7a32f3db6>`_."""
-from typing import List, Optional, Tuple, Union
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 from ..core import FreelancehuntObject
 from ..models.user import Profile, Freelancer, Employer
 
@@ -30,7 +30,9 @@ class Profiles(FreelancehuntObject):
         :return: information of your account
         """
         responce = self._get('/my/profile')
-        return Profile.de_json(**responce)
+        profile = Profile.de_json(**responce)
+        profile._mark_loaded()
+        return profile
 
     def get_freelancers_list(
         self,
@@ -38,8 +40,12 @@ class Profiles(FreelancehuntObject):
         city_id: Optional[int] = None,
         skill_id: Optional[int] = None,
         login: Optional[str] = None,
-        pages: Optional[Union[int, Tuple[int], List[int]]] = 1
-    ) -> List[Freelancer]:
+        pages: Optional[Union[int, Tuple[int], List[int]]] = 1,
+        stop_when: Optional[Callable[[Freelancer], bool]] = None,
+        raw: bool = False,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None
+    ) -> Union[List[Freelancer], List[dict]]:
         """Get filtered freelancer profiles.
 
         :param country_id: freelancer from country (API-related Country identifier), defaults to None
@@ -47,6 +53,11 @@ class Profiles(FreelancehuntObject):
         :param skill_id: freelancer skill (API-related Skill identifier), defaults to None
         :param login: with the desired login, defaults to None
         :param pages: number of pages, defaults to 1
+        :param stop_when: predicate to skip profiles and stop fetching after the page
+            where it first matched, defaults to None
+        :param raw: return normalized records (plain dicts) instead of objects, defaults to False
+        :param include: fields to keep, the rest is loaded on access, defaults to None
+        :param exclude: fields to drop, they are loaded on access, defaults to None
         :return: list of filtered freelancer profiles
         """
         filters = {
@@ -55,22 +66,31 @@ class Profiles(FreelancehuntObject):
             'skill_id': skill_id,
             'login': login
         }
-        responce = self._multi_page_get('/freelancers', filters, pages)
-        return [Freelancer.de_json(**data) for data in responce]
+        parser = Freelancer._get_parser(include, exclude, raw)
+        return self._multi_page_parse('/freelancers', parser, filters, pages, stop_when)
 
     def get_employers_list(
         self,
         country_id: Optional[int] = None,
         city_id: Optional[int] = None,
         login: Optional[str] = None,
-        pages: Optional[Union[int, Tuple[int], List[int]]] = 1
-    ) -> List[Employer]:
+        pages: Optional[Union[int, Tuple[int], List[int]]] = 1,
+        stop_when: Optional[Callable[[Employer], bool]] = None,
+        raw: bool = False,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None
+    ) -> Union[List[Employer], List[dict]]:
         """Get filtered employer profiles.
 
         :param country_id: employer from country (API-related Country identifier), defaults to None
         :param city_id: employer from city (API-related City identifier), defaults to None
         :param login: with the desired login, defaults to None
         :param pages: number of pages, defaults to 1
+        :param stop_when: predicate to skip profiles and stop fetching after the page
+            where it first matched, defaults to None
+        :param raw: return normalized records (plain dicts) instead of objects, defaults to False
+        :param include: fields to keep, the rest is loaded on access, defaults to None
+        :param exclude: fields to drop, they are loaded on access, defaults to None
         :return: list of filtered employer profiles
         """
         filters = {
@@ -78,21 +98,109 @@ class Profiles(FreelancehuntObject):
             'city_id': city_id,
             'login': login
         }
-        responce = self._multi_page_get('/employers', filters, pages)
-        return [Employer.de_json(**data) for data in responce]
+        parser = Employer._get_parser(include, exclude, raw)
+        return self._multi_page_parse('/employers', parser, filters, pages, stop_when)
 
-    def get_freelancer_datails(self, profile_id: int) -> Freelancer:
+    def iter_freelancers_pages(
+        self,
+        country_id: Optional[int] = None,
+        city_id: Optional[int] = None,
+        skill_id: Optional[int] = None,
+        login: Optional[str] = None,
+        pages: Optional[Union[int, Tuple[int], List[int]]] = 1,
+        raw: bool = False,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None
+    ) -> Iterator[Union[List[Freelancer], List[dict]]]:
+        """Get filtered freelancer profiles page by page.
+
+        Filters are the same as for :py:meth:`get_freelancers_list`, each
+        page is requested when the previous one is used.
+
+        :param pages: number of pages, defaults to 1
+        :param raw: yield normalized records (plain dicts) instead of objects, defaults to False
+        :param include: fields to keep, the rest is loaded on access, defaults to None
+        :param exclude: fields to drop, they are loaded on access, defaults to None
+        :return: iterator of pages
+        """
+        filters = {
+            'country_id': country_id,
+            'city_id': city_id,
+            'skill_id': skill_id,
+            'login': login
+        }
+        parser = Freelancer._get_parser(include, exclude, raw)
+        return self._iter_parsed_pages('/freelancers', parser, filters, pages)
+
+    def iter_employers_pages(
+        self,
+        country_id: Optional[int] = None,
+        city_id: Optional[int] = None,
+        login: Optional[str] = None,
+        pages: Optional[Union[int, Tuple[int], List[int]]] = 1,
+        raw: bool = False,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None
+    ) -> Iterator[Union[List[Employer], List[dict]]]:
+        """Get filtered employer profiles page by page.
+
+        Filters are the same as for :py:meth:`get_employers_list`, each
+        page is requested when the previous one is used.
+
+        :param pages: number of pages, defaults to 1
+        :param raw: yield normalized records (plain dicts) instead of objects, defaults to False
+        :param include: fields to keep, the rest is loaded on access, defaults to None
+        :param exclude: fields to drop, they are loaded on access, defaults to None
+        :return: iterator of pages
+        """
+        filters = {
+            'country_id': country_id,
+            'city_id': city_id,
+            'login': login
+        }
+        parser = Employer._get_parser(include, exclude, raw)
+        return self._iter_parsed_pages('/employers', parser, filters, pages)
+
+    def get_freelancer_datails(self,
+                               profile_id: int,
+                               raw: bool = False,
+                               include: Optional[Iterable[str]] = None,
+                               exclude: Optional[Iterable[str]] = None) -> Union[Freelancer, dict]:
         """Get information about freelancer by identifier.
 
         :param profile_id: the desired profile identifier
+        :param raw: return normalized record (plain dict) instead of object, defaults to False
+        :param include: fields to keep, the rest is loaded on access, defaults to None
+        :param exclude: fields to drop, they are loaded on access, defaults to None
         """
+        parser = Freelancer._get_parser(include, exclude, raw)
         responce = self._get(f'/freelancers/{profile_id}')
-        return Freelancer.de_json(**responce)
-
-    def get_employer_datails(self, profile_id: int) -> Employer:
+        if parser is None:
+            return responce
+        profile = parser(**responce)
+        # Dropped fields are not known nulls, so they are loaded on access
+        if not raw and include is None and exclude is None:
+            profile._mark_loaded()
+        return profile
+
+    def get_employer_datails(self,
+                             profile_id: int,
+                             raw: bool = False,
+                             include: Optional[Iterable[str]] = None,
+                             exclude: Optional[Iterable[str]] = None) -> Union[Employer, dict]:
         """Get information about employer by identifier.
 
         :param profile_id: the desired profile identifier
+        :param raw: return normalized record (plain dict) instead of object, defaults to False
+        :param include: fields to keep, the rest is loaded on access, defaults to None
+        :param exclude: fields to drop, they are loaded on access, defaults to None
         """
+        parser = Employer._get_parser(include, exclude, raw)
         responce = self._get(f'/employers/{profile_id}')
-        return Employer.de_json(**responce)
+        if parser is None:
+            return responce
+        profile = parser(**responce)
+        # Dropped fields are not known nulls, so they are loaded on access
+        if not raw and include is None and exclude is None:
+            profile._mark_loaded()
+        return profile
@@ -1,6 +1,6 @@
 #!usr/bin/python3
 """`Freelancehunt Documentation - Projects API <https://apidocs.freelancehunt.com/?version=latest#54939f33-1e54-4953-b199-a63893886fed>`_."""
-from typing import List, Optional, Tuple, Union
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 from ..core import FreelancehuntObject
 
@@ -33,14 +33,85 @@ class Projects(FreelancehuntObject):
                      Union[int, str, Skill, List[Skill],
                            List[int], Tuple[Skill], Tuple[int]]
                  ] = None,
-                 employer_id: Optional[int] = None) -> List[Project]:
+                 employer_id: Optional[int] = None,
+                 stop_when: Optional[Callable[[Union[Project, dict]], bool]] = None,
+                 raw: bool = False,
+                 include: Optional[Iterable[str]] = None,
+                 exclude: Optional[Iterable[str]] = None) -> Union[List[Project], List[dict]]:
         """Get projects with filter and from multiple pages.
 
+        Example of incremental fetching (only projects newer than the last run):
+
+        .. code-block:: python
+
+            projects.get_list(pages=10, stop_when=lambda p: p.published_at <= watermark)
+
+        With `raw` the predicate gets the normalized records (plain dicts
+        with API values, dates are ISO format strings) instead of objects:
+
+        .. code-block:: python
+
+            projects.get_list(pages=10, raw=True,
+                              stop_when=lambda record: record['published_at'] <= since)
+
+        Heavy fields not needed by the caller may be dropped while parsing:
+
+        .. code-block:: python
+
+            projects.get_list(exclude=('description', 'description_html'))
+
         :param skills: filter by skills
         :param employer_id: projects from employer with id
         :param only_for_plus: filter only for plus if False, get otherwise, defaults is False
         :param pages: number of pages to get, defaults - 1
+        :param stop_when: predicate to skip projects and stop fetching after the page
+            where it first matched, it gets records with `raw`, defaults to None
+        :param raw: return normalized records (plain dicts) instead of objects, defaults to False
+        :param include: fields to keep, the rest is loaded on access, defaults to None
+        :param exclude: fields to drop, they are loaded on access, defaults to None
+        """
+        filters = self._get_filters(only_for_plus, skills, employer_id)
+        parser = Project._get_parser(include, exclude, raw)
+        return self._multi_page_parse('/projects', parser, filters, pages, stop_when)
+
+    def iter_pages(self,
+                   pages: Union[int, Tuple[int], List[int]] = 1,
+                   only_for_plus: bool = False,
+                   skills: Optional[
+                       Union[int, str, Skill, List[Skill],
+                             List[int], Tuple[Skill], Tuple[int]]
+                   ] = None,
+                   employer_id: Optional[int] = None,
+                   raw: bool = False,
+                   include: Optional[Iterable[str]] = None,
+                   exclude: Optional[Iterable[str]] = None
+                   ) -> Iterator[Union[List[Project], List[dict]]]:
+        """Get projects page by page, each page is requested when the previous one is used.
+
+        Filters are the same as for :py:meth:`get_list`. Example of
+        streaming export:
+
+        .. code-block:: python
+
+            export_ndjson(projects.iter_pages(pages=100, raw=True), 'projects.ndjson.gz')
+
+        :param pages: number of pages to get, defaults - 1
+        :param raw: yield normalized records (plain dicts) instead of objects, defaults to False
+        :param include: fields to keep, the rest is loaded on access, defaults to None
+        :param exclude: fields to drop, they are loaded on access, defaults to None
+        :return: iterator of pages
         """
+        filters = self._get_filters(only_for_plus, skills, employer_id)
+        parser = Project._get_parser(include, exclude, raw)
+        return self._iter_parsed_pages('/projects', parser, filters, pages)
+
+    @staticmethod
+    def _get_filters(only_for_plus: bool = False,
+                     skills: Optional[
+                         Union[int, str, Skill, List[Skill],
+                               List[int], Tuple[Skill], Tuple[int]]
+                     ] = None,
+                     employer_id: Optional[int] = None) -> dict:
         filters = {}
         if employer_id:
             filters.update({
@@ -76,29 +147,52 @@ class Projects(FreelancehuntObject):
 
             # Add skill_id to filters dict
             filters.update({"skill_id": skills_filter_str})
-
-        responce = self._multi_page_get('/projects', filters, pages)
-        return [Project.de_json(**data) for data in responce]
-
-    def my_projects(self, pages: Union[int, Tuple[int], List[int]] = 1) -> List[Project]:
+        return filters
+
+    def my_projects(self,
+                    pages: Union[int, Tuple[int], List[int]] = 1,
+                    stop_when: Optional[Callable[[Union[Project, dict]], bool]] = None,
+                    raw: bool = False,
+                    include: Optional[Iterable[str]] = None,
+                    exclude: Optional[Iterable[str]] = None) -> Union[List[Project], List[dict]]:
         """Get my projects list (10 objects).
 
         .. note: ONLY FOR EMPLOYER!
 
         :param pages: number of pages, defaults to 1
+        :param stop_when: predicate to skip projects and stop fetching after the page
+            where it first matched, it gets records with `raw`, defaults to None
+        :param raw: return normalized records (plain dicts) instead of objects, defaults to False
+        :param include: fields to keep, the rest is loaded on access, defaults to None
+        :param exclude: fields to drop, they are loaded on access, defaults to None
         :raise BadRequest: raises when you are not Employer.
         """
-        responce = self._multi_page_get("/my/projects", pages=pages)
-        return [Project.de_json(**data) for data in responce]
-
-    def get_project(self, project_id: int) -> Project:
+        parser = Project._get_parser(include, exclude, raw)
+        return self._multi_page_parse("/my/projects", parser,
+                                      pages=pages, stop_when=stop_when)
+
+    def get_project(self,
+                    project_id: int,
+                    raw: bool = False,
+                    include: Optional[Iterable[str]] = None,
+                    exclude: Optional[Iterable[str]] = None) -> Union[Project, dict]:
         """Get specific project by id.
 
         :param project_id: id of the desired project.
+        :param raw: return normalized record (plain dict) instead of object, defaults to False
+        :param include: fields to keep, the rest is loaded on access, defaults to None
+        :param exclude: fields to drop, they are loaded on access, defaults to None
         :return: the desired project object.
         """
+        parser = Project._get_parser(include, exclude, raw)
         responce = self._get(f"/projects/{project_id}")
-        return Project.de_json(**responce)
+        if parser is None:
+            return responce
+        project = parser(**responce)
+        # Dropped fields are not known nulls, so they are loaded on access
+        if not raw and include is None and exclude is None:
+            project._mark_loaded()
+        return project
 
     def create_project(self, information: dict) -> Project:
         """Create new project on site.
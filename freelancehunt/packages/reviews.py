@@ -1,6 +1,6 @@
 #!usr/bin/python3
 """`Freelancehunt Documentation - Reviews API <https://apidocs.freelancehunt.com/?version=latest#ffd08d46-6b1e-416f-be75-e6cb583df5c0>`_."""
-from typing import List, Optional, Type
+from typing import Iterator, List, Optional, Tuple, Type, Union
 
 from ..core import FreelancehuntObject
 
@@ -24,20 +24,62 @@ class Reviews(FreelancehuntObject):
         """
         super().__init__(token, **kwargs)
 
-    def get_reviews(self, profile_type: str, profile_id: int) -> List[Type["Review"]]:
+    def get_reviews(self,
+                    profile_type: str,
+                    profile_id: int,
+                    raw: bool = False) -> Union[List[Type["Review"]], List[dict]]:
         """Get reviews of the desired profile.
 
         :param profile_type: type of the desired profile, can be "freelancer" or "employer"
         :param profile_id: identifier of the desired profile
+        :param raw: return normalized records (plain dicts) instead of objects, defaults to False
         :return: profile reviews
         """
         responce = self._get(f'/{profile_type}s/{profile_id}/reviews')
+        if raw:
+            return responce
         return [Review.de_json(**data) for data in responce]
 
-    def get_my_reviews(self) -> List[Type["Review"]]:
+    def get_my_reviews(self, raw: bool = False) -> Union[List[Type["Review"]], List[dict]]:
         """Get reviews of my profile.
 
+        :param raw: return normalized records (plain dicts) instead of objects, defaults to False
         :return: profile reviews
         """
         responce = self._get('/my/reviews')
-        return [Review.de_json(**data) for data in responce]
\ No newline at end of file
+        if raw:
+            return responce
+        return [Review.de_json(**data) for data in responce]
+
+    def iter_reviews_pages(
+        self,
+        profile_type: str,
+        profile_id: int,
+        pages: Union[int, Tuple[int], List[int]] = 1,
+        raw: bool = False
+    ) -> Iterator[Union[List[Type["Review"]], List[dict]]]:
+        """Get reviews of the desired profile page by page.
+
+        Each page is requested when the previous one is used.
+
+        :param profile_type: type of the desired profile, can be "freelancer" or "employer"
+        :param profile_id: identifier of the desired profile
+        :param pages: count of pages to get, defaults to 1
+        :param raw: yield normalized records (plain dicts) instead of objects, defaults to False
+        :return: iterator of pages
+        """
+        return self._iter_parsed_pages(f'/{profile_type}s/{profile_id}/reviews',
+                                       None if raw else Review.de_json, pages=pages)
+
+    def iter_my_reviews_pages(
+        self,
+        pages: Union[int, Tuple[int], List[int]] = 1,
+        raw: bool = False
+    ) -> Iterator[Union[List[Type["Review"]], List[dict]]]:
+        """Get reviews of my profile page by page.
+
+        :param pages: count of pages to get, defaults to 1
+        :param raw: yield normalized records (plain dicts) instead of objects, defaults to False
+        :return: iterator of pages
+        """
+        return self._iter_parsed_pages('/my/reviews', None if raw else Review.de_json, pages=pages)
@@ -1,6 +1,6 @@
 #!usr/bin/python3
 """`Freelancehunt Documentation - Threads API <https://apidocs.freelancehunt.com/?version=latest#a313684a-aa56-4f67-bb4c-5ba014c43006>`_."""
-from typing import List, Optional, Tuple, Union
+from typing import Callable, Iterator, List, Optional, Tuple, Union
 
 from ..core import FreelancehuntObject
 
@@ -25,13 +25,30 @@ class Threads(FreelancehuntObject):
         """
         super().__init__(token, **kwargs)
 
-    def get_threads(self, pages: Union[int, Tuple[int], List[int]] = 1) -> List[Thread]:
+    def get_threads(self,
+                    pages: Union[int, Tuple[int], List[int]] = 1,
+                    stop_when: Optional[Callable[[Thread], bool]] = None,
+                    raw: bool = False) -> Union[List[Thread], List[dict]]:
         """Get list of threads.
 
         :param Union[int, Tuple[int], List[int]] pages: count of pages to get, defaults to 1
+        :param stop_when: predicate to skip threads and stop fetching after the page
+            where it first matched, defaults to None
+        :param raw: return normalized records (plain dicts) instead of objects, defaults to False
         """
-        responce = self._multi_page_get("/threads", pages=pages)
-        return [Thread.de_json(**data) for data in responce]
+        return self._multi_page_parse("/threads", None if raw else Thread.de_json,
+                                      pages=pages, stop_when=stop_when)
+
+    def iter_pages(self,
+                   pages: Union[int, Tuple[int], List[int]] = 1,
+                   raw: bool = False) -> Iterator[Union[List[Thread], List[dict]]]:
+        """Get threads page by page, each page is requested when the previous one is used.
+
+        :param Union[int, Tuple[int], List[int]] pages: count of pages to get, defaults to 1
+        :param raw: yield normalized records (plain dicts) instead of objects, defaults to False
+        :return: iterator of pages
+        """
+        return self._iter_parsed_pages("/threads", None if raw else Thread.de_json, pages=pages)
 
     def create_thread(self, to_profile_id: int, subject: str, message_html: str) -> Thread:
         """Create new thread.
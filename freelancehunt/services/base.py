@@ -0,0 +1,273 @@
+#!usr/bin/python3
+"""Basic class for long-running polling services."""
+import logging
+import threading
+import time
+from queue import Queue
+from typing import Any, Callable, List, Optional
+
+from requests import RequestException
+
+from ..core import FreelancehuntObject
+from ..utils.errors import FreelancehuntError
+from ..utils.polling import AdaptiveInterval
+from ..utils.storage import JSONStorage
+
+
+__all__ = ('PollingService', 'PollingGroup',)
+
+
+logger = logging.getLogger(__name__)
+
+
+class PollingService(FreelancehuntObject):
+    """Poll API with adaptive interval and emit only new objects.
+
+    New objects are passed to every subscribed callback and put to the
+    `queue` (if set). Errors of callbacks and of the queue are logged and
+    do not stop the service or delivery of other objects.
+
+    Subclasses implement :py:meth:`_poll` and the state (de)serialization
+    with :py:meth:`_get_state` (a new JSON-serializable dict on every call,
+    the state is saved only if it is changed) and :py:meth:`_set_state`.
+
+    .. warning:: For directly usage please set `token` argument.
+
+    :param str token: your API token, optional
+    :param list callbacks: functions to call with every new object, optional
+    :param Queue queue: queue to put new objects, optional
+    :param str state_path: path to file to persist the service state, optional
+    :param AdaptiveInterval interval: poll interval policy, optional
+    """
+
+    def __init__(self,
+                 token: Optional[str] = None,
+                 callbacks: Optional[List[Callable[[Any], None]]] = None,
+                 queue: Optional[Queue] = None,
+                 state_path: Optional[str] = None,
+                 interval: Optional[AdaptiveInterval] = None,
+                 **kwargs):
+        """Create polling service.
+
+        :param token: your API token (only for directly usage, not inside Client class),
+            defaults to None
+        :param callbacks: functions to call with every new object, defaults to None
+        :param queue: queue to put new objects, defaults to None
+        :param state_path: path to file to persist the service state, defaults to None
+        :param interval: poll interval policy, defaults to None
+        """
+        super().__init__(token, **kwargs)
+        self.callbacks = list(callbacks or [])
+        self.queue = queue
+        self.interval = interval or AdaptiveInterval()
+        self.last_poll_at = None
+        self.next_poll_at = 0
+        self._storage = JSONStorage(state_path) if state_path else None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        state = self._storage.load() if self._storage else None
+        try:
+            self._set_state(state or {})
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            # State of another schema, the service starts from scratch
+            logger.warning('%s state is not loaded: %r', type(self).__name__, error)
+            state = None
+            self._set_state({})
+        # The last saved state, unchanged state is not written again
+        self._saved_state = state
+
+    def subscribe(self, callback: Callable[[Any], None]) -> None:
+        """Call `callback` with every new object.
+
+        :param callback: function with one argument
+        """
+        self.callbacks.append(callback)
+
+    def poll(self) -> list:
+        """Poll API once and emit new objects.
+
+        :return: list of new objects
+        """
+        limit_before = self._requester.limit
+        started_at = time.monotonic()
+
+        new_objects = self._poll()
+
+        if self.last_poll_at is not None:
+            self.interval.observe(len(new_objects), started_at - self.last_poll_at)
+        self.last_poll_at = started_at
+
+        limit_after = self._requester.limit
+        requests_per_poll = 1
+        if limit_before is not None and limit_after is not None:
+            requests_per_poll = max(limit_before - limit_after, 1)
+        interval = self.interval.update(limit_after,
+                                        self._requester.limit_reset_in,
+                                        requests_per_poll)
+        self.next_poll_at = time.monotonic() + interval
+
+        # Saved after delivery, so objects of an interrupted batch are polled again
+        for obj in new_objects:
+            self._emit(obj)
+        self.save_state()
+        return new_objects
+
+    def poll_if_due(self) -> Optional[list]:
+        """Poll API if the interval from the last poll is passed.
+
+        :return: list of new objects or None if poll is not due yet
+        """
+        if time.monotonic() < self.next_poll_at:
+            return None
+        return self.poll()
+
+    def run(self, max_polls: Optional[int] = None) -> None:
+        """Poll API until :py:meth:`stop` is called.
+
+        API errors do not stop the service, the interval is doubled instead.
+
+        :param max_polls: stop after this count of polls, defaults to None
+        """
+        self._stop_event.clear()
+        polls = 0
+        while not self._stop_event.is_set():
+            self._try_poll()
+            polls += 1
+            if max_polls is not None and polls >= max_polls:
+                break
+            self._stop_event.wait(max(self.next_poll_at - time.monotonic(), 0))
+
+    def start(self) -> threading.Thread:
+        """Run the service in the background thread.
+
+        :return: started daemon thread
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+
+        self._thread = threading.Thread(target=self.run,
+                                        name=type(self).__name__,
+                                        daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the service and wait for the background thread.
+
+        :param timeout: seconds to wait for the background thread, defaults to None
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def save_state(self) -> None:
+        """Persist the service state if `state_path` is set and the state is changed."""
+        if self._storage:
+            state = self._get_state()
+            if state != self._saved_state:
+                self._storage.save(state)
+                self._saved_state = state
+
+    def _try_poll(self) -> list:
+        try:
+            return self.poll()
+        except (FreelancehuntError, RequestException) as error:
+            logger.warning('%s poll failed: %r', type(self).__name__, error)
+            self.next_poll_at = time.monotonic() + self.interval.backoff()
+            return []
+
+    def _emit(self, obj: Any) -> None:
+        for callback in self.callbacks:
+            try:
+                callback(obj)
+            except Exception:
+                logger.exception('%s callback %r failed', type(self).__name__, callback)
+        if self.queue is not None:
+            try:
+                self.queue.put(obj)
+            except Exception:
+                logger.exception('%s failed to put object to the queue', type(self).__name__)
+
+    def _poll(self) -> list:
+        raise NotImplementedError
+
+    def _get_state(self) -> dict:
+        raise NotImplementedError
+
+    def _set_state(self, state: dict) -> None:
+        raise NotImplementedError
+
+
+class PollingGroup:
+    """Run many polling services in one thread.
+
+    Every service is polled when its own interval is passed, so hundreds
+    of services (e.g. feeds of different accounts) share a single thread.
+
+    :param List[PollingService] services: services to run
+    """
+
+    def __init__(self, services: Optional[List[PollingService]] = None):
+        """Create group of polling services.
+
+        :param services: services to run, defaults to None
+        """
+        self.services = list(services or [])
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def add(self, service: PollingService) -> None:
+        """Add service to the group.
+
+        :param service: service to run
+        """
+        self.services.append(service)
+
+    def poll_due(self) -> list:
+        """Poll every service which interval is passed.
+
+        :return: list of new objects from all polled services
+        """
+        new_objects = []
+        now = time.monotonic()
+        for service in list(self.services):
+            if service.next_poll_at <= now:
+                new_objects += service._try_poll()
+        return new_objects
+
+    def run(self) -> None:
+        """Poll services until :py:meth:`stop` is called."""
+        self._stop_event.clear()
+        while not self._stop_event.is_set():
+            self.poll_due()
+            next_poll_at = min(
+                (service.next_poll_at for service in self.services),
+                default=time.monotonic() + 1
+            )
+            self._stop_event.wait(max(next_poll_at - time.monotonic(), 0))
+
+    def start(self) -> threading.Thread:
+        """Run services in the background thread.
+
+        :return: started daemon thread
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return self._thread
+
+        self._thread = threading.Thread(target=self.run,
+                                        name=type(self).__name__,
+                                        daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the services and wait for the background thread.
+
+        :param timeout: seconds to wait for the background thread, defaults to None
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,109 @@
+#!usr/bin/python3
+"""Synchronization of the account feed."""
+import time
+from queue import Queue
+from typing import Callable, List, Optional
+
+from ..models.feed import FeedMessage
+from ..packages.feed import Feed
+from ..utils.polling import AdaptiveInterval, SeenIds
+
+from .base import PollingService
+
+
+__all__ = ('FeedWatcher',)
+
+
+class FeedWatcher(PollingService):
+    """Poll the account feed and emit only new messages.
+
+    The watcher remembers identifiers of the seen feed messages, so each
+    message is emitted once even if it is still marked as new on the API
+    side. The feed may be marked as read after new messages, but not more
+    often than once per `read_interval` seconds.
+
+    To watch feeds of many accounts in one thread use
+    :py:class:`~freelancehunt.services.base.PollingGroup`:
+
+    .. code-block:: python
+
+        group = PollingGroup([FeedWatcher(token, callbacks=[handle]) for token in tokens])
+        group.run()
+
+    .. warning:: For directly usage please set `token` argument.
+
+    :param str token: your API token, optional
+    :param bool mark_read: mark feed as read after new messages
+    :param float read_interval: minimal interval between marking feed as read in seconds
+    """
+
+    def __init__(self,
+                 token: Optional[str] = None,
+                 mark_read: bool = False,
+                 read_interval: float = 300,
+                 seen_limit: int = 1000,
+                 callbacks: Optional[List[Callable[[FeedMessage], None]]] = None,
+                 queue: Optional[Queue] = None,
+                 state_path: Optional[str] = None,
+                 interval: Optional[AdaptiveInterval] = None,
+                 **kwargs):
+        """Create watcher for the account feed.
+
+        :param token: your API token (only for directly usage, not inside Client class),
+            defaults to None
+        :param mark_read: mark feed as read after new messages, defaults to False
+        :param read_interval: minimal interval between marking feed as read in seconds,
+            defaults to 300
+        :param seen_limit: count of the latest message identifiers to remember, defaults to 1000
+        :param callbacks: functions to call with every new message, defaults to None
+        :param queue: queue to put new messages, defaults to None
+        :param state_path: path to file to persist seen messages, defaults to None
+        :param interval: poll interval policy, defaults to None
+        """
+        self.mark_read = mark_read
+        self.read_interval = read_interval
+        self.seen_limit = seen_limit
+        super().__init__(token, callbacks, queue, state_path, interval, **kwargs)
+
+        self.feed = Feed()
+        self.feed._requester = self._requester
+        self._unread = False
+        self._last_read_at = None
+
+    def read(self) -> None:
+        """Mark feed as read now."""
+        self.feed.read()
+        self._unread = False
+        self._last_read_at = time.monotonic()
+
+    def _poll(self) -> List[FeedMessage]:
+        self.feed.update()
+
+        is_first_poll = not len(self._seen)
+        # Oldest first, as they were created, so the oldest are forgotten first
+        new_messages = []
+        for message in reversed(self.feed.list):
+            if not self._seen.add(message.id):
+                continue
+            # Without state only messages marked by API as new are new
+            if is_first_poll and not message.is_new:
+                continue
+            new_messages.append(message)
+
+        if new_messages:
+            self._unread = True
+        if self.mark_read and self._unread and self._is_read_due():
+            self.read()
+
+        return new_messages
+
+    def _is_read_due(self) -> bool:
+        if self._last_read_at is None:
+            return True
+        return time.monotonic() - self._last_read_at >= self.read_interval
+
+    def _get_state(self) -> dict:
+        return {"seen": self._seen.to_list()}
+
+    def _set_state(self, state: dict) -> None:
+        self._seen = SeenIds(state.get("seen", []), maxlen=self.seen_limit)
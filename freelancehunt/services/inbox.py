@@ -0,0 +1,212 @@
+#!usr/bin/python3
+"""Incremental synchronization of the account inbox."""
+import json
+import logging
+import os
+from datetime import datetime
+from queue import Queue
+from typing import Callable, Dict, List, Optional
+
+from ..models.thread import Thread
+from ..models.threadmessage import ThreadMessage
+from ..packages.threads import Threads
+from ..utils.polling import AdaptiveInterval
+
+from .base import PollingService
+
+
+__all__ = ('InboxSync',)
+
+
+logger = logging.getLogger(__name__)
+
+
+class InboxSync(PollingService):
+    """Keep a local mirror of the inbox and emit new thread messages.
+
+    For every thread the last known `last_post_at`, `messages_count` and
+    identifiers of the latest messages are stored. A poll requests the
+    thread list only up to the threads not changed since the previous poll,
+    and requests messages only for the changed threads and only up to the
+    page with an already seen message, so the cost of sync depends on the
+    activity, not on the inbox size.
+
+    The state file holds only these cursors, it is written when they are
+    changed. Messages are kept in memory and, with `messages_path`,
+    appended to a file (one JSON record per line), which is read on start.
+
+    .. note:: Messages of a thread are expected from the newest one,
+              identifiers are not required to grow.
+
+    .. warning:: For directly usage please set `token` argument.
+
+    :param str token: your API token, optional
+    :param int max_pages: maximal count of thread list pages requested by one poll
+    :param int max_message_pages: maximal count of message pages requested for one thread
+    :param bool keep_messages: keep messages of threads, not only thread snapshots
+    :param str messages_path: path to the append-only file of kept messages, optional
+    :param bool emit_existing: emit messages found by the first poll without state
+    """
+
+    # Count of identifiers of the latest messages kept for every thread
+    recent_ids_limit = 20
+
+    def __init__(self,
+                 token: Optional[str] = None,
+                 max_pages: int = 10,
+                 max_message_pages: int = 10,
+                 keep_messages: bool = True,
+                 messages_path: Optional[str] = None,
+                 emit_existing: bool = False,
+                 callbacks: Optional[List[Callable[[ThreadMessage], None]]] = None,
+                 queue: Optional[Queue] = None,
+                 state_path: Optional[str] = None,
+                 interval: Optional[AdaptiveInterval] = None,
+                 **kwargs):
+        """Create inbox synchronization.
+
+        :param token: your API token (only for directly usage, not inside Client class),
+            defaults to None
+        :param max_pages: maximal count of thread list pages requested by one poll, defaults to 10
+        :param max_message_pages: maximal count of message pages requested for one thread,
+            defaults to 10
+        :param keep_messages: keep messages of threads, not only thread snapshots, defaults to True
+        :param messages_path: path to the append-only file of kept messages,
+            defaults to None (messages are kept in memory only)
+        :param emit_existing: emit messages found by the first poll without state,
+            defaults to False
+        :param callbacks: functions to call with every new message, defaults to None
+        :param queue: queue to put new messages, defaults to None
+        :param state_path: path to file to persist the thread snapshots, defaults to None
+        :param interval: poll interval policy, defaults to None
+        """
+        self.max_pages = max_pages
+        self.max_message_pages = max_message_pages
+        self.keep_messages = keep_messages
+        self.messages_path = messages_path
+        self.emit_existing = emit_existing
+        super().__init__(token, callbacks, queue, state_path, interval, **kwargs)
+
+        self._messages: Dict[int, List[dict]] = {}
+        if keep_messages and messages_path:
+            self._load_messages()
+
+        self._threads = Threads()
+        self._threads._requester = self._requester
+
+    @property
+    def thread_ids(self) -> List[int]:
+        """Identifiers of all synchronized threads."""
+        return list(self._snapshots)
+
+    def get_messages(self, thread_id: int) -> List[ThreadMessage]:
+        """Get locally stored messages of the thread.
+
+        :param thread_id: the desired thread identifier
+        :return: stored messages, the newest first
+        """
+        return [
+            ThreadMessage.de_json(**dict(data, thread={"id": thread_id}))
+            for data in self._messages.get(thread_id, [])
+        ]
+
+    def _poll(self) -> List[ThreadMessage]:
+        watermark = self._watermark
+        threads = self._threads.get_threads(
+            pages=self.max_pages,
+            stop_when=lambda thread: bool(watermark and thread.last_post_at < watermark)
+        )
+
+        new_messages = []
+        for thread in threads:
+            snapshot = self._snapshots.get(thread.id)
+            if snapshot and not self._is_changed(thread, snapshot):
+                continue
+
+            thread_messages = self._sync_thread(thread, snapshot)
+            new_messages += thread_messages
+            if not self._watermark or thread.last_post_at > self._watermark:
+                self._watermark = thread.last_post_at
+
+        # The first poll without state only fills the mirror
+        if watermark is None and not self.emit_existing:
+            return []
+        new_messages.sort(key=lambda message: message.posted_at)
+        return new_messages
+
+    @staticmethod
+    def _is_changed(thread: Thread, snapshot: dict) -> bool:
+        cursor = (thread.last_post_at.isoformat(), thread.messages_count)
+        return cursor != (snapshot["last_post_at"], snapshot["messages_count"])
+
+    def _sync_thread(self, thread: Thread, snapshot: Optional[dict]) -> List[ThreadMessage]:
+        seen = set(snapshot["recent_ids"]) if snapshot else set()
+        expected_count = thread.messages_count - (snapshot["messages_count"] if snapshot else 0)
+
+        new_data = []
+        for page_data in self._iter_pages(thread.api_url, pages=self.max_message_pages):
+            fresh = [data for data in page_data if data["id"] not in seen]
+            new_data += fresh
+            # The rest are older than a seen message
+            if len(fresh) != len(page_data) or len(new_data) >= expected_count:
+                break
+
+        # Store raw data before it is parsed to objects
+        stored_data = [{key: value for key, value in data.items() if key != "meta"}
+                       for data in new_data]
+        if self.keep_messages and stored_data:
+            self._messages[thread.id] = stored_data + self._messages.get(thread.id, [])
+            if self.messages_path:
+                self._append_messages(thread.id, stored_data)
+
+        recent_ids = [data["id"] for data in new_data]
+        if snapshot:
+            recent_ids += [id for id in snapshot["recent_ids"] if id not in recent_ids]
+        self._snapshots[thread.id] = {
+            "last_post_at": thread.last_post_at.isoformat(),
+            "messages_count": thread.messages_count,
+            "recent_ids": recent_ids[:self.recent_ids_limit],
+        }
+        return [ThreadMessage.de_json(**data) for data in new_data]
+
+    def _load_messages(self) -> None:
+        if not os.path.exists(self.messages_path):
+            return
+
+        with open(self.messages_path, encoding='utf-8') as messages_file:
+            for line in messages_file:
+                try:
+                    data = json.loads(line)
+                    thread_id = data.pop("thread_id")
+                except (ValueError, KeyError) as error:
+                    # A line may be cut by a crash while it was appended
+                    logger.warning('Skipped message record in %s: %r', self.messages_path, error)
+                    continue
+                # The file is from the oldest, the mirror is from the newest
+                self._messages.setdefault(thread_id, []).insert(0, data)
+
+    def _append_messages(self, thread_id: int, messages: List[dict]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.messages_path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.messages_path, 'a', encoding='utf-8') as messages_file:
+            for data in reversed(messages):
+                messages_file.write(json.dumps(dict(data, thread_id=thread_id),
+                                               ensure_ascii=False) + '\n')
+
+    def _get_state(self) -> dict:
+        return {
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+            "threads": {str(thread_id): dict(snapshot)
+                        for thread_id, snapshot in self._snapshots.items()},
+        }
+
+    def _set_state(self, state: dict) -> None:
+        watermark = state.get("watermark")
+        self._watermark = datetime.fromisoformat(watermark) if watermark else None
+        self._snapshots: Dict[int, dict] = {}
+        for thread_id, snapshot in state.get("threads", {}).items():
+            if "recent_ids" not in snapshot:
+                # Snapshots of the previous format have the latest message only
+                last_message_id = snapshot.pop("last_message_id", None)
+                snapshot["recent_ids"] = [last_message_id] if last_message_id is not None else []
+            self._snapshots[int(thread_id)] = snapshot
@@ -0,0 +1,125 @@
+#!usr/bin/python3
+"""Watcher for the new projects."""
+from datetime import datetime
+from queue import Queue
+from typing import Callable, List, Optional, Tuple, Union
+
+from ..models.project import Project
+from ..models.skill import Skill
+from ..packages.projects import Projects
+from ..utils.polling import AdaptiveInterval, SeenIds
+
+from .base import PollingService
+
+
+__all__ = ('ProjectWatcher',)
+
+
+class ProjectWatcher(PollingService):
+    """Detect the new projects that match the filters.
+
+    The watcher keeps a high-water mark (the latest seen publish date) and
+    a bounded set of seen project identifiers, so every poll requests only
+    the pages newer than the previous poll and each project is emitted once.
+
+    Example:
+
+    .. code-block:: python
+
+        watcher = ProjectWatcher(skills=[1, 99], state_path='projects.json')
+        watcher.subscribe(lambda project: print(project.name))
+        watcher.run()
+
+    .. warning:: For directly usage please set `token` argument.
+
+    :param str token: your API token, optional
+    :param skills: filter by skills, same as for :py:meth:`Projects.get_list`
+    :param bool only_for_plus: filter only for plus projects
+    :param int max_pages: maximal count of pages requested by one poll
+    :param bool emit_existing: emit projects found by the first poll without state
+    """
+
+    def __init__(self,
+                 token: Optional[str] = None,
+                 skills: Optional[
+                     Union[int, str, Skill, List[Skill],
+                           List[int], Tuple[Skill], Tuple[int]]
+                 ] = None,
+                 only_for_plus: bool = False,
+                 max_pages: int = 5,
+                 emit_existing: bool = False,
+                 seen_limit: int = 1000,
+                 callbacks: Optional[List[Callable[[Project], None]]] = None,
+                 queue: Optional[Queue] = None,
+                 state_path: Optional[str] = None,
+                 interval: Optional[AdaptiveInterval] = None,
+                 **kwargs):
+        """Create watcher for the new projects.
+
+        :param token: your API token (only for directly usage, not inside Client class),
+            defaults to None
+        :param skills: filter by skills, defaults to None
+        :param only_for_plus: filter only for plus projects, defaults to False
+        :param max_pages: maximal count of pages requested by one poll, defaults to 5
+        :param emit_existing: emit projects found by the first poll without state,
+            defaults to False
+        :param seen_limit: count of the latest project identifiers to remember, defaults to 1000
+        :param callbacks: functions to call with every new project, defaults to None
+        :param queue: queue to put new projects, defaults to None
+        :param state_path: path to file to persist the watermark and seen projects,
+            defaults to None
+        :param interval: poll interval policy, defaults to None
+        """
+        self.skills = skills
+        self.only_for_plus = only_for_plus
+        self.max_pages = max_pages
+        self.emit_existing = emit_existing
+        self.seen_limit = seen_limit
+        super().__init__(token, callbacks, queue, state_path, interval, **kwargs)
+
+        self._projects = Projects()
+        self._projects._requester = self._requester
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        """The publish date of the latest seen project."""
+        return self._watermark
+
+    def _poll(self) -> List[Project]:
+        watermark = self._watermark
+        projects = self._projects.get_list(
+            pages=self.max_pages if watermark else 1,
+            only_for_plus=self.only_for_plus,
+            skills=self.skills,
+            stop_when=self._is_old
+        )
+
+        # Oldest first, as they were published, so the oldest are forgotten first
+        new_projects = []
+        for project in reversed(projects):
+            if not self._seen.add(project.id):
+                continue
+            published_at = project.published_at
+            if published_at and (not self._watermark or published_at > self._watermark):
+                self._watermark = published_at
+            new_projects.append(project)
+
+        # The first poll without state only remembers the current projects
+        if watermark is None and not self.emit_existing:
+            return []
+        return new_projects
+
+    def _is_old(self, project: Project) -> bool:
+        published_at = project.published_at
+        return bool(self._watermark and published_at and published_at < self._watermark)
+
+    def _get_state(self) -> dict:
+        return {
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+            "seen": self._seen.to_list(),
+        }
+
+    def _set_state(self, state: dict) -> None:
+        watermark = state.get("watermark")
+        self._watermark = datetime.fromisoformat(watermark) if watermark else None
+        self._seen = SeenIds(state.get("seen", []), maxlen=self.seen_limit)
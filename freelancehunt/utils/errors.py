@@ -8,6 +8,7 @@ __all__ = (
     'ValidationError',
     'APIRespondingError',
     'NotEmployerError',
+    'SchemaError',
 )
 
 
@@ -41,6 +42,11 @@ class NotEmployerError(FreelancehuntError):
     pass
 
 
+class SchemaError(FreelancehuntError):
+    """API data does not match the model schema."""
+    pass
+
+
 class BadRequestError(FreelancehuntError):
     """Bad request to server."""
     pass
@@ -0,0 +1,110 @@
+#!usr/bin/python3
+"""Identity map to share one object per API entity."""
+import threading
+from typing import Any, Optional, Tuple
+from weakref import WeakValueDictionary
+
+from .requester import Requester
+
+
+__all__ = ('IdentityMap',)
+
+
+class IdentityMap:
+    """Objects of API entities keyed by (type, id, language), kept by weak references.
+
+    While the map is enabled, nested objects (employers of projects,
+    skills, profiles of threads, etc.) with the same type and identifier
+    are made only once and shared by every object that refers to them,
+    so :py:meth:`load_details` of one reference updates all of them.
+    Objects are removed from the map when nothing else refers to them.
+    Objects parsed in another language of the requester are not shared.
+
+    Enable the map for all parsed objects:
+
+    .. code-block:: python
+
+        IdentityMap.enable()
+        projects = client.projects.get_list(pages=5)
+        # One Employer object for all projects of this employer
+        assert projects[0].employer is projects[1].employer
+    """
+
+    # Object singleton
+    __current = None
+
+    def __init__(self):
+        """Create empty identity map."""
+        self._objects = WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def enable(cls) -> "IdentityMap":
+        """Use the identity map for all parsed objects.
+
+        :return: the current identity map
+        """
+        if cls.__current is None:
+            cls.__current = cls()
+        return cls.__current
+
+    @classmethod
+    def disable(cls) -> None:
+        """Stop using the identity map and forget all objects."""
+        cls.__current = None
+
+    @classmethod
+    def get_current(cls) -> Optional["IdentityMap"]:
+        """Get the current identity map.
+
+        :return: the identity map or None if it is not enabled
+        """
+        return cls.__current
+
+    def get(self, model: type, id: Any, language: Optional[str] = None) -> Optional[Any]:
+        """Get the shared object of the entity.
+
+        :param model: type of the entity
+        :param id: unique identifier of the entity
+        :param language: language of the object, defaults to None (the requester language)
+        :return: the object or None if it is not known
+        """
+        return self._objects.get((model, id, language or Requester.get_language()))
+
+    def make(self, model: type, data: dict) -> Any:
+        """Get the shared object of the entity or make it from API data.
+
+        :param model: model class with `de_json()` method
+        :param data: API data of the entity
+        :return: the shared object
+        """
+        key = self._get_key(model, data)
+        if key is None:
+            return model.de_json(**data)
+
+        with self._lock:
+            obj = self._objects.get(key)
+        if obj is not None:
+            return obj
+
+        obj = model.de_json(**data)
+        with self._lock:
+            # Other thread may make the same object meanwhile
+            return self._objects.setdefault(key, obj)
+
+    def clear(self) -> None:
+        """Forget all objects."""
+        with self._lock:
+            self._objects.clear()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @staticmethod
+    def _get_key(model: type, data: dict) -> Optional[Tuple[type, Any, Optional[str]]]:
+        id = data.get("id")
+        if id is None:
+            return None
+        # Base models (e.g. Profile) make objects of the concrete type
+        identity_type = getattr(model, "_identity_type", None)
+        return (identity_type(data) if identity_type else model, id, Requester.get_language())
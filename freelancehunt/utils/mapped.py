@@ -0,0 +1,323 @@
+#!usr/bin/python3
+"""Read-only memory-mapped file of catalog entries.
+
+File layout (little-endian):
+
+* magic ``FHCATLG`` and format version (1 byte);
+* length of the JSON header (uint32) and the header: fields, count of
+  records, offsets of sections, the time and the language of the API
+  responce;
+* records of fixed width: int64 for integer fields (the minimal int64
+  means None), offset and length (uint32, uint32) in the string table
+  for string fields (the maximal uint32 length means None);
+* sorted indexes: arrays of record positions (uint32) ordered by the
+  values of the index key, indexes of one integer field are preceded by
+  the sorted values (int64, aligned to 8 bytes);
+* string table: UTF-8 strings one after another.
+
+Opening the file reads the header only, the rest is paged in by the OS
+on access and shared by all processes which map the same file.
+"""
+from __future__ import annotations
+import json
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+__all__ = ('CatalogFile',)
+
+
+MAGIC = b'FHCATLG'
+VERSION = 1
+
+_NULL_INT = -2 ** 63
+_NULL_LENGTH = 2 ** 32 - 1
+_POSITION = struct.Struct('<I')
+_INT = struct.Struct('<q')
+_HEADER_LENGTH = struct.Struct('<I')
+
+Key = Union[str, Tuple[str]]
+
+
+class CatalogFile:
+    """Entries of a catalog in a read-only memory-mapped file.
+
+    Entries are plain dicts with integer and string values. They are
+    found by binary search in the sorted indexes stored in the file, so
+    no Python objects are made until the entry is read.
+
+    Example:
+
+    .. code-block:: python
+
+        CatalogFile.write('cities.fhc', [city.to_dict() for city in cities.list],
+                          keys=('id', ('country_id', 'name')))
+        catalog = CatalogFile('cities.fhc')
+        catalog.lookup('id', 3184)
+
+    :param str path: path to the file
+    :raises ValueError: the file is not a catalog file of the supported version
+    """
+
+    def __init__(self, path: str):
+        """Map the file to memory.
+
+        :param path: path to the file
+        """
+        self.path = path
+        with open(path, 'rb') as catalog_file:
+            self._map = mmap.mmap(catalog_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._map[:len(MAGIC)] != MAGIC or self._map[len(MAGIC)] != VERSION:
+            self._map.close()
+            raise ValueError(f'{path} is not a catalog file of version {VERSION}')
+
+        start = len(MAGIC) + 1
+        (length,) = _HEADER_LENGTH.unpack_from(self._map, start)
+        header = json.loads(self._map[start + 4:start + 4 + length])
+        self.fields: List[Tuple[str, str]] = [tuple(field) for field in header['fields']]
+        self.count: int = header['count']
+        self.loaded_at: Optional[float] = header.get('loaded_at')
+        self.language: Optional[str] = header.get('language')
+        self._records_offset = header['records_offset']
+        self._strings_offset = header['strings_offset']
+        # Offsets and counts of positions in the indexes
+        self._indexes = {
+            _get_key(index['key']): (index['offset'], index['count'])
+            for index in header['indexes']
+        }
+        # Sorted values of integer indexes, binary search over them runs in C
+        self._views = []
+        self._values = {}
+        for index in header['indexes']:
+            if index.get('values_offset') is not None:
+                start = index['values_offset']
+                view = memoryview(self._map)[start:start + index['count'] * 8].cast('q')
+                self._views.append(view)
+                self._values[_get_key(index['key'])] = view
+
+        self._record = struct.Struct(_record_format(self.fields))
+        # Positions of values in unpacked records
+        self._columns: Dict[str, int] = {}
+        column = 0
+        for name, kind in self.fields:
+            self._columns[name] = column
+            column += 1 if kind == 'int' else 2
+
+    @classmethod
+    def write(cls,
+              path: str,
+              items: Iterable[Dict[str, Any]],
+              keys: Iterable[Key] = ('id',),
+              loaded_at: Optional[float] = None,
+              language: Optional[str] = None) -> None:
+        """Write entries to the file, the file is replaced atomically.
+
+        :param path: path to the file
+        :param items: entries with the same keys, values are integers, strings or None
+        :param keys: fields (or tuples of fields) to index, defaults to ('id',)
+        :param loaded_at: timestamp of the API responce with the entries, defaults to None
+        :param language: language of the entries, defaults to None
+        :raises ValueError: values of a field are neither integers nor strings
+        """
+        items = list(items)
+        fields = _get_fields(items)
+        record = struct.Struct(_record_format(fields))
+
+        strings = bytearray()
+        records = bytearray()
+        for item in items:
+            values = []
+            for name, kind in fields:
+                value = item.get(name)
+                if kind == 'int':
+                    values.append(_NULL_INT if value is None else value)
+                elif value is None:
+                    values += [0, _NULL_LENGTH]
+                else:
+                    encoded = value.encode('utf-8')
+                    values += [len(strings), len(encoded)]
+                    strings += encoded
+            records += record.pack(*values)
+
+        kinds = dict(fields)
+        indexes = []
+        for key in keys:
+            names = (key,) if isinstance(key, str) else tuple(key)
+            order = sorted(
+                (position for position, item in enumerate(items)
+                 if all(item.get(name) is not None for name in names)),
+                key=lambda position: tuple(items[position][name] for name in names),
+            )
+            values = None
+            if len(names) == 1 and kinds.get(names[0]) == 'int':
+                values = b''.join(_INT.pack(items[position][names[0]]) for position in order)
+            positions = b''.join(_POSITION.pack(position) for position in order)
+            indexes.append((list(names), len(order), values, positions))
+
+        # Offsets depend on the header length, so it is made until it is stable
+        offsets_base = 0
+        while True:
+            offset = offsets_base + len(records)
+            index_headers = []
+            for names, count, values, positions in indexes:
+                values_offset = None
+                if values is not None:
+                    offset += -offset % 8
+                    values_offset = offset
+                    offset += len(values)
+                index_headers.append({'key': names, 'offset': offset, 'count': count,
+                                      'values_offset': values_offset})
+                offset += len(positions)
+            header = json.dumps({
+                'fields': fields,
+                'count': len(items),
+                'records_offset': offsets_base,
+                'strings_offset': offset,
+                'indexes': index_headers,
+                'loaded_at': loaded_at,
+                'language': language,
+            }).encode('utf-8')
+            size = len(MAGIC) + 1 + _HEADER_LENGTH.size + len(header)
+            if size == offsets_base:
+                break
+            offsets_base = size
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(MAGIC + bytes([VERSION]))
+                tmp_file.write(_HEADER_LENGTH.pack(len(header)) + header)
+                tmp_file.write(records)
+                for _, _, values, positions in indexes:
+                    if values is not None:
+                        tmp_file.write(bytes(-tmp_file.tell() % 8))
+                        tmp_file.write(values)
+                    tmp_file.write(positions)
+                tmp_file.write(strings)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for position in range(self.count):
+            yield self.read(position)
+
+    @property
+    def keys(self) -> List[Key]:
+        """Get keys of the stored indexes."""
+        return list(self._indexes)
+
+    def read(self, position: int) -> Dict[str, Any]:
+        """Read the entry.
+
+        :param position: position of the entry in the file
+        :return: entry
+        """
+        values = self._unpack(position)
+        return {name: self._value(values, name, kind) for name, kind in self.fields}
+
+    def lookup(self, key: Key, value: Any) -> Optional[Dict[str, Any]]:
+        """Get the first entry with the value of the index key.
+
+        :param key: field or tuple of fields of the stored index
+        :param value: value of the field, or tuple of values
+        :raises KeyError: index of the key is not stored
+        :return: entry or None if it is not found
+        """
+        key = _get_key(key)
+        offset, count = self._indexes[key]
+        values = self._values.get(key)
+        if values is not None:
+            low = bisect_left(values, value)
+            if low < count and values[low] == value:
+                (position,) = _POSITION.unpack_from(self._map, offset + low * 4)
+                return self.read(position)
+            return None
+
+        names = key if isinstance(key, tuple) else (key,)
+        target = value if isinstance(key, tuple) else (value,)
+        kinds = dict(self.fields)
+
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            (position,) = _POSITION.unpack_from(self._map, offset + middle * 4)
+            values = self._unpack(position)
+            current = tuple(self._value(values, name, kinds[name]) for name in names)
+            if current < target:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < count:
+            (position,) = _POSITION.unpack_from(self._map, offset + low * 4)
+            entry = self.read(position)
+            if tuple(entry[name] for name in names) == target:
+                return entry
+        return None
+
+    def close(self) -> None:
+        """Unmap the file."""
+        for view in self._views:
+            view.release()
+        self._map.close()
+
+    def __enter__(self) -> CatalogFile:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _unpack(self, position: int) -> tuple:
+        offset = self._records_offset + position * self._record.size
+        return self._record.unpack_from(self._map, offset)
+
+    def _value(self, values: tuple, name: str, kind: str) -> Any:
+        column = self._columns[name]
+        if kind == 'int':
+            value = values[column]
+            return None if value == _NULL_INT else value
+
+        offset, length = values[column], values[column + 1]
+        if length == _NULL_LENGTH:
+            return None
+        start = self._strings_offset + offset
+        return self._map[start:start + length].decode('utf-8')
+
+
+def _get_key(key: Union[str, List[str], Tuple[str]]) -> Key:
+    if isinstance(key, str):
+        return key
+    return key[0] if len(key) == 1 else tuple(key)
+
+
+def _get_fields(items: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    """Get names and kinds ("int" or "str") of fields of the entries."""
+    kinds = {}
+    for item in items:
+        for name, value in item.items():
+            if value is None:
+                kinds.setdefault(name, None)
+                continue
+            kind = 'int' if isinstance(value, int) and not isinstance(value, bool) else \
+                'str' if isinstance(value, str) else None
+            if kind is None or kinds.get(name) not in (None, kind):
+                raise ValueError(f"Values of the field '{name}' must be integers or strings")
+            kinds[name] = kind
+    # Fields without values are stored as strings
+    return [(name, kind or 'str') for name, kind in kinds.items()]
+
+
+def _record_format(fields: List[Tuple[str, str]]) -> str:
+    return '<' + ''.join('q' if kind == 'int' else 'II' for _, kind in fields)
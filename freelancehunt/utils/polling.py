@@ -0,0 +1,149 @@
+#!usr/bin/python3
+"""Helpers for polling the API without wasting requests."""
+from collections import deque
+from typing import Iterable, List, Optional
+
+
+__all__ = ('AdaptiveInterval', 'SeenIds',)
+
+
+class AdaptiveInterval:
+    """Poll interval adapted to the observed rate of new items and API limits.
+
+    The interval is chosen so that about `target_items` new items are
+    expected per poll, and so that the remaining requests limit is enough
+    until the limit reset (keeping `reserve_requests` for other calls).
+    The interval starts from `min_interval` and at most doubles per poll,
+    so polls without new items back off exponentially to `max_interval`.
+
+    :param float min_interval: minimal interval between polls in seconds
+    :param float max_interval: maximal interval between polls in seconds
+    :param float target_items: desired count of new items per poll
+    :param float smoothing: weight of the last poll in the observed rate, from 0 to 1
+    :param int reserve_requests: requests reserved for other API calls
+    """
+
+    def __init__(self,
+                 min_interval: float = 30,
+                 max_interval: float = 900,
+                 target_items: float = 1,
+                 smoothing: float = 0.3,
+                 reserve_requests: int = 100):
+        """Create adaptive interval.
+
+        :param min_interval: minimal interval between polls in seconds, defaults to 30
+        :param max_interval: maximal interval between polls in seconds, defaults to 900
+        :param target_items: desired count of new items per poll, defaults to 1
+        :param smoothing: weight of the last poll in the observed rate, defaults to 0.3
+        :param reserve_requests: requests reserved for other API calls, defaults to 100
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Invalid interval bounds "
+                             f"({min_interval}, {max_interval})")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_items = target_items
+        self.smoothing = smoothing
+        self.reserve_requests = reserve_requests
+        # Observed items per second, None until the first observation
+        self.rate = None
+        self.interval = min_interval
+
+    def observe(self, items: int, elapsed: float) -> None:
+        """Take into account the result of the last poll.
+
+        :param items: count of new items found by the last poll
+        :param elapsed: seconds since the previous poll
+        """
+        if elapsed <= 0:
+            return
+
+        rate = items / elapsed
+        if self.rate is None:
+            self.rate = rate
+        else:
+            self.rate = self.smoothing * rate + (1 - self.smoothing) * self.rate
+
+    def backoff(self) -> float:
+        """Double the interval after a failed poll.
+
+        :return: the new interval in seconds
+        """
+        self.interval = min(self.interval * 2, self.max_interval)
+        return self.interval
+
+    def update(self,
+               remaining_limit: Optional[int] = None,
+               reset_in: Optional[float] = None,
+               requests_per_poll: int = 1) -> float:
+        """Calculate interval before the next poll.
+
+        :param remaining_limit: remaining requests until the limit reset, defaults to None
+        :param reset_in: seconds to the limit reset, defaults to None
+        :param requests_per_poll: requests made by one poll, defaults to 1
+        :return: interval in seconds
+        """
+        if not self.rate:
+            interval = self.max_interval if self.rate == 0 else self.min_interval
+        else:
+            interval = self.target_items / self.rate
+        # Grow gradually, a few empty polls do not jump to the maximal interval
+        interval = min(interval, self.interval * 2)
+        interval = min(max(interval, self.min_interval), self.max_interval)
+
+        if remaining_limit is not None and reset_in is not None:
+            available = remaining_limit - self.reserve_requests
+            if available < requests_per_poll:
+                # Wait for the limit reset
+                interval = max(interval, reset_in)
+            else:
+                interval = max(interval, reset_in * requests_per_poll / available)
+
+        self.interval = interval
+        return interval
+
+
+class SeenIds:
+    """Bounded set of already processed identifiers.
+
+    The oldest identifiers are forgotten when the set grows over `maxlen`.
+
+    :param Iterable[int] ids: initial identifiers, oldest first
+    :param int maxlen: maximal count of stored identifiers
+    """
+
+    def __init__(self, ids: Iterable[int] = (), maxlen: int = 1000):
+        """Create bounded set of identifiers.
+
+        :param ids: initial identifiers, oldest first, defaults to ()
+        :param maxlen: maximal count of stored identifiers, defaults to 1000
+        """
+        self._order = deque(maxlen=maxlen)
+        self._ids = set()
+        for item_id in ids:
+            self.add(item_id)
+
+    def add(self, item_id: int) -> bool:
+        """Add identifier to the set.
+
+        :param item_id: the identifier
+        :return: True if identifier is new, False otherwise
+        """
+        if item_id in self._ids:
+            return False
+
+        if len(self._order) == self._order.maxlen:
+            self._ids.discard(self._order[0])
+        self._order.append(item_id)
+        self._ids.add(item_id)
+        return True
+
+    def to_list(self) -> List[int]:
+        """Get stored identifiers, oldest first."""
+        return list(self._order)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
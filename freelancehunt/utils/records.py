@@ -0,0 +1,26 @@
+#!usr/bin/python3
+"""Access to the values of entities, which are objects or raw API records."""
+from typing import Any
+
+
+__all__ = ('get_item',)
+
+
+def get_item(value: Any, name: str) -> Any:
+    """Get item of nested value, which is an object or raw API data.
+
+    Example:
+
+    .. code-block:: python
+
+        city_id = get_item(get_item(project.location, 'city'), 'id')
+
+    :param value: object, dict of raw API data or None
+    :param name: name of the attribute or the key
+    :return: the item, None if it or the value is missing
+    """
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
@@ -1,14 +1,20 @@
 #!usr/bin/python3
 """Requests singleton."""
 import requests
-from datetime import datetime
+from datetime import datetime, timedelta
 from simplejson.errors import JSONDecodeError
 
 from .errors import AuthenticationError, ValidationError, APIRespondingError, \
                    NotEmployerError, UnexpectedError
 
 
-__all__ = ('Requester',)
+__all__ = ('Requester', 'LANGUAGES', 'DEFAULT_LANGUAGE',)
+
+
+# Languages of responced data supported by API
+LANGUAGES = ('en', 'ru', 'uk')
+# Language of responced data without Accept-Language header
+DEFAULT_LANGUAGE = 'en'
 
 
 class Requester:
@@ -17,13 +23,14 @@ class Requester:
     __requester = None
     # Public attributes
     token = None
+    language = None
     limit = None
     request_date = None
     # Private attributes
     __basic_url = "https://api.freelancehunt.com/v2"
     __headers = None
 
-    def __init__(self, token, language='en', **kwargs):
+    def __init__(self, token, language=DEFAULT_LANGUAGE, **kwargs):
         """
         Set general parameters for all requests.
 
@@ -34,15 +41,18 @@ class Requester:
         """
         self.token = token
         self.__headers = {'Authorization': f'Bearer {self.token}'}
-        if language in ['en', 'ru', 'uk']:
+        if language in LANGUAGES:
+            self.language = language
             self.__headers['Accept-Language'] = language
 
-    def request(self, request_type, url, filters=None, payload=None):
+    def request(self, request_type, url, filters=None, payload=None, language=None):
         """
         Make request to API and handle results.
 
         Args:
-            request_type (str): "POST", "GET", "PATCH" or "DEL".
+            request_type (str): "POST", "GET", "PATCH" or "DEL";
+            language (str): language of responced data for this request only
+                (default: the language of the requester).
 
         Return:
             dict: JSON responce data in dict
@@ -72,12 +82,18 @@ class Requester:
             else:
                 filters = None
 
+        headers = self.__headers
+        if language is not None:
+            if language not in LANGUAGES:
+                raise ValueError(f"Language must be one of {LANGUAGES}, not {language!r}")
+            headers = dict(headers, **{'Accept-Language': language})
+
         request_url = self.__basic_url + url
         responce = requests.request(
             method=request_type,
             url=request_url,
             params=filters,
-            headers=self.__headers,
+            headers=headers,
             json=payload
         )
         # No value in some POST request
@@ -156,6 +172,38 @@ class Requester:
         self.request_date = datetime.strptime(headers.get("Date"), date_pattern)
         self.limit = int(headers.get("X-RateLimit-Remaining"))
 
+    @property
+    def limit_reset_in(self):
+        """
+        Seconds to update remaining API limits.
+
+        Return:
+            int: seconds to the limits update or None if no requests made
+
+        """
+        if self.request_date is None:
+            return None
+
+        last_request_hour = self.request_date.replace(
+            microsecond=0,
+            second=0,
+            minute=0
+        )
+        update_datetime = last_request_hour + timedelta(hours=1)
+        seconds_left = update_datetime.timestamp() - datetime.utcnow().timestamp()
+        return int(seconds_left) if seconds_left > 0 else 0
+
+    @classmethod
+    def get_language(cls):
+        """
+        Language of responced data of the current requester.
+
+        Return:
+            str: language or None if it is the API default or no requester made
+
+        """
+        return cls.__requester.language if cls.__requester else None
+
     @classmethod
     def get_requester(cls, token=None, **kwargs):
         if not cls.__requester and not token:
@@ -0,0 +1,223 @@
+#!usr/bin/python3
+"""Search index over names of catalog entries."""
+import heapq
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+__all__ = ('SearchIndex', 'fold',)
+
+
+# Letters without decomposition to the base letter and a diacritic
+_LETTERS = str.maketrans({'ł': 'l', 'ø': 'o', 'đ': 'd', 'ħ': 'h', 'ı': 'i', 'æ': 'ae', 'œ': 'oe'})
+
+
+def fold(text: str) -> str:
+    """Fold text for comparison: ignore case and diacritics.
+
+    :param text: text to fold
+    :return: folded text
+    """
+    text = unicodedata.normalize('NFKD', text.casefold().translate(_LETTERS))
+    return ''.join(char for char in text if not unicodedata.combining(char))
+
+
+def _words(name: str) -> List[str]:
+    return ''.join(char if char.isalnum() else ' ' for char in name).split()
+
+
+def _grams(text: str, size: int = 3) -> List[str]:
+    return [text[i:i + size] for i in range(len(text) - size + 1)]
+
+
+def _prefix_distance(query: str, word: str, limit: int) -> int:
+    """Get count of edits (with transpositions) between the query and the closest word prefix.
+
+    Prefixes shorter than `len(query) - limit` are ignored, the result is at most `limit + 1`.
+    """
+    word = word[:len(query) + limit]
+    if len(word) < len(query) - limit:
+        return limit + 1
+
+    # Rows of distances from prefixes of the query to every prefix of the word
+    before, previous = None, list(range(len(word) + 1))
+    for i, char in enumerate(query, 1):
+        current = [i]
+        for j, other in enumerate(word, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != other))
+            if i > 1 and j > 1 and char == word[j - 2] and query[i - 2] == other:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return min(limit + 1, *previous[max(len(query) - limit, 0):])
+
+
+def _max_typos(query: str) -> int:
+    if len(query) < 4:
+        return 0
+    return 1 if len(query) < 8 else 2
+
+
+# Ranks of matches, the best first
+EXACT, PREFIX, WORD_PREFIX, SUBSTRING, FUZZY = range(5)
+
+
+class SearchIndex:
+    """Ranked search of entries by folded names.
+
+    Names are folded by :py:func:`fold`. Prefixes of names and of their
+    words are found by binary search in a sorted list, substrings by
+    posting lists of trigrams. Words with typos are taken from the
+    distinct words of names sharing the most bigrams with the query and
+    checked by edit distance of the word (or its prefix) to the query:
+    one typo is allowed in queries of 4-7 characters, two typos in
+    longer ones.
+
+    Results are ranked: exact name, name prefix, word prefix, substring,
+    word with typos (fewer typos first); shorter names first within the
+    same rank. Worse ranks are not searched when the better ones already
+    give enough results.
+
+    :param items: entries to index
+    :param key: function returning the name of an entry
+    :param int max_candidates: count of words checked for typos
+    """
+
+    def __init__(self,
+                 items: Iterable[Any],
+                 key: Callable[[Any], str] = lambda item: item.name,
+                 max_candidates: int = 50):
+        """Build index of the entries.
+
+        :param items: entries to index
+        :param key: function returning the name of an entry, defaults to the `name` attribute
+        :param max_candidates: count of words checked for typos, defaults to 50
+        """
+        self.items = list(items)
+        self.max_candidates = max_candidates
+        self._names = [fold(key(item) or '') for item in self.items]
+
+        prefixes = []
+        grams = {}
+        words = {}
+        for position, name in enumerate(self._names):
+            name_words = _words(name)
+            prefixes.append((name, PREFIX, position))
+            prefixes += [(word, WORD_PREFIX, position) for word in name_words[1:]]
+            for word in name_words:
+                words.setdefault(word, []).append(position)
+            for gram in set(_grams(name)):
+                grams.setdefault(gram, []).append(position)
+        prefixes.sort()
+        self._prefixes = prefixes
+        self._prefix_keys = [prefix for prefix, _, _ in prefixes]
+        self._lengths = [len(name) for name in self._names]
+        self._grams = grams
+
+        # Distinct words with padded bigrams, so short words and the word boundaries
+        # are matched too
+        self._words = words
+        self._vocabulary = list(words)
+        word_grams = {}
+        for word_id, word in enumerate(self._vocabulary):
+            for gram in set(_grams(f' {word} ', 2)):
+                word_grams.setdefault(gram, []).append(word_id)
+        self._word_grams = word_grams
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def find(self, text: str) -> List[Any]:
+        """Get entries with the text in the name, in the order of entries.
+
+        :param text: text to find
+        :return: list of entries
+        """
+        query = fold(text)
+        positions = self._substring_positions(query)
+        if positions is None:
+            positions = [pos for pos, name in enumerate(self._names) if query in name]
+        return [self.items[position] for position in sorted(positions)]
+
+    def search(self, text: str, limit: int = 10, fuzzy: bool = True) -> List[Any]:
+        """Get the best matching entries.
+
+        :param text: search query, e.g. the beginning of the name
+        :param limit: maximal count of results, defaults to 10
+        :param fuzzy: find names with typos if there are not enough matches, defaults to True
+        :return: list of entries, the best first
+        """
+        query = fold(text).strip()
+        if not query or limit < 1:
+            return []
+
+        lengths = self._lengths
+        # Sort keys of matches: rank, count of typos, length of name, position
+        matches = {}
+        for prefix, rank, position in self._prefix_matches(query):
+            if rank == PREFIX and prefix == query:
+                rank = EXACT
+            if position not in matches or rank < matches[position][0]:
+                matches[position] = (rank, 0, lengths[position], position)
+
+        if len(matches) < limit:
+            for position in self._substring_positions(query) or ():
+                if position not in matches:
+                    matches[position] = (SUBSTRING, 0, lengths[position], position)
+
+        if fuzzy and len(matches) < limit:
+            for position, typos in self._similar_positions(query).items():
+                if position not in matches:
+                    matches[position] = (FUZZY, typos, lengths[position], position)
+
+        return [self.items[key[3]] for key in heapq.nsmallest(limit, matches.values())]
+
+    def _prefix_matches(self, query: str) -> List[Tuple[str, int, int]]:
+        start = bisect_left(self._prefix_keys, query)
+        end = bisect_left(self._prefix_keys, query + '\U0010ffff', start)
+        return self._prefixes[start:end]
+
+    def _substring_positions(self, query: str) -> Optional[List[int]]:
+        """Get positions of names with the query, None if it is too short for trigrams."""
+        grams = set(_grams(query))
+        if not grams:
+            return None
+
+        # Candidates have every trigram of the query, the rarest one is checked first
+        postings = sorted((self._grams.get(gram, ()) for gram in grams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        return [position for position in candidates if query in self._names[position]]
+
+    def _similar_positions(self, query: str) -> Dict[int, int]:
+        """Get count of typos by positions of names with words similar to the query."""
+        limit = _max_typos(query)
+        if not limit:
+            return {}
+
+        grams = set(_grams(f' {query} ', 2))
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._word_grams.get(gram, ()))
+
+        # Every edit changes at most 3 bigrams of the padded query,
+        # the last one is not in longer words matched by prefix
+        min_shared = len(grams) - 1 - 3 * limit
+        result = {}
+        for word_id, count in shared.most_common(self.max_candidates):
+            if count < min_shared:
+                break
+            word = self._vocabulary[word_id]
+            typos = _prefix_distance(query, word, limit)
+            if typos > limit:
+                continue
+            for position in self._words[word]:
+                result[position] = min(typos, result.get(position, typos))
+        return result
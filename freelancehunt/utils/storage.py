@@ -0,0 +1,63 @@
+#!usr/bin/python3
+"""Local storage for the state of long-running services."""
+import json
+import logging
+import os
+import tempfile
+from typing import Optional
+
+
+__all__ = ('JSONStorage',)
+
+
+logger = logging.getLogger(__name__)
+
+
+class JSONStorage:
+    """Store a JSON-serializable state in a local file.
+
+    The file is replaced atomically on every save, so a crashed process
+    never leaves a half-written state behind.
+
+    :param str path: path to the state file
+    """
+
+    def __init__(self, path: str):
+        """Create storage for the state file.
+
+        :param path: path to the state file
+        """
+        self.path = path
+
+    def load(self) -> Optional[dict]:
+        """Load the stored state.
+
+        :return: stored state or None if nothing stored yet or the file is not readable
+        """
+        if not os.path.exists(self.path):
+            return None
+
+        try:
+            with open(self.path, encoding='utf-8') as state_file:
+                return json.load(state_file)
+        except (OSError, ValueError) as error:
+            # Truncated or corrupt file is replaced by the next save
+            logger.warning('State file %s is not loaded: %r', self.path, error)
+            return None
+
+    def save(self, state: dict) -> None:
+        """Replace the stored state.
+
+        :param state: JSON-serializable state to store
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as tmp_file:
+                json.dump(state, tmp_file, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -38,6 +38,12 @@ setup(
         'requests==2.23.0',
         'simplejson==3.17.0'
     ],
+    extras_require={
+        'analytics': ['numpy'],
+        'arrow': ['pyarrow'],
+        'zstd': ['zstandard'],
+        'msgpack': ['msgpack'],
+    },
     include_package_data=True,
     classifiers=[
         'Development Status :: 3 - Alpha',
@@ -11,3 +11,17 @@ logger = logging.getLogger(__name__)
 @pytest.fixture
 def expected(request):
     return request.param
+
+
+@pytest.fixture
+def project_data():
+    """Factory of project API data."""
+    def make(project_id, published_at):
+        return {
+            "id": project_id,
+            "type": "project",
+            "name": f"Project {project_id}",
+            "status": {"id": 11, "name": "Open for proposals"},
+            "published_at": published_at,
+        }
+    return make
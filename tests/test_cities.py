@@ -32,3 +32,85 @@ class CityEntity:
     #classmethod
     def de_json(cls, **data):
         pass
+
+
+def test_catalog_indexed_lookups(mocker):
+    import pytest
+    import freelancehunt
+
+    cities = freelancehunt.Cities(1, token="TOKEN")
+    get = mocker.patch.object(cities, "_get", return_value=[
+        {"id": 1, "type": "city", "name": "Kyiv"},
+        {"id": 2, "type": "city", "name": "Kharkiv"},
+    ])
+
+    assert cities.get(2).name == "Kharkiv"
+    assert cities.get_by_name("Kyiv").id == 1
+    with pytest.raises(ValueError):
+        cities.get(3)
+    assert get.call_count == 1
+
+    get.return_value = [{"id": 3, "type": "city", "name": "Lviv"}]
+    cities.update()
+    assert cities.get(3).name == "Lviv"
+    assert [city.id for city in cities.list] == [3]
+
+
+def test_all_cities_bulk_preload(mocker):
+    import freelancehunt
+
+    responces = {
+        "/countries": [{"id": 1, "type": "country", "iso2": "UA", "name": "Ukraine"},
+                       {"id": 2, "type": "country", "iso2": "PL", "name": "Poland"}],
+        "/cities/1": [{"id": 10, "type": "city", "name": "Kyiv"},
+                      {"id": 11, "type": "city", "name": "Mykolaiv"}],
+        "/cities/2": [{"id": 20, "type": "city", "name": "Mykolaiv"}],
+    }
+    get = mocker.patch.object(freelancehunt.packages.catalog.Catalog, "_get",
+                              side_effect=lambda url: responces[url])
+
+    cities = freelancehunt.AllCities(token="TOKEN", max_workers=2)
+    assert len(cities.list) == 3 and get.call_count == 3
+    assert cities.get(20).country_id == 2
+    assert cities.get_by_name(1, "Mykolaiv").id == 11
+    assert cities.get_by_name(2, "Mykolaiv").id == 20
+
+
+def test_all_cities_request_countries_with_own_token(mocker):
+    import freelancehunt
+    from freelancehunt.utils.requester import Requester
+
+    def request(requester, request_type, url, filters=None, payload=None, language=None):
+        tokens.append((requester.token, url))
+        if url == "/countries":
+            return {"data": [{"id": 1, "type": "country",
+                              "attributes": {"iso2": "UA", "name": "Ukraine"}}]}
+        return {"data": [{"id": 10, "type": "city", "attributes": {"name": "Kyiv"}}]}
+
+    tokens = []
+    mocker.patch.object(Requester, "request", autospec=True, side_effect=request)
+    cities = freelancehunt.AllCities(token="FIRST", background_refresh=False)
+    freelancehunt.AllCities(token="SECOND")
+
+    assert cities.get(10).country_id == 1
+    assert tokens == [("FIRST", "/countries"), ("FIRST", "/cities/1")]
+
+
+def test_catalog_mapped_file(mocker, tmp_path):
+    import freelancehunt
+
+    path = str(tmp_path / "cities.fhc")
+    cities = freelancehunt.Cities(1, token="TOKEN")
+    mocker.patch.object(cities, "_get", return_value=[
+        {"id": 1, "type": "city", "name": "Kyiv"},
+        {"id": 2, "type": "city", "name": "Kharkiv"},
+    ])
+    cities.save_mapped(path)
+
+    mapped = freelancehunt.Cities(1, token="TOKEN", mapped_path=path)
+    get = mocker.patch.object(mapped, "_get")
+    assert mapped.get(2).name == "Kharkiv"
+    assert mapped.get(2).country_id == 1
+    assert mapped.get_by_name("Kyiv").id == 1
+    assert [city.name for city in mapped.search("khar")] == ["Kharkiv"]
+    assert not get.called
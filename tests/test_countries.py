@@ -35,3 +35,103 @@ class CountryEntity:
     #classmethod
     def de_json(cls, **data):
         pass
+
+
+def test_catalog_snapshot(tmp_path, mocker):
+    import freelancehunt
+
+    path = str(tmp_path / "countries.json")
+    data = [{"id": 1, "type": "country", "iso2": "UA", "name": "Ukraine"}]
+
+    countries = freelancehunt.Countries(token="TOKEN", snapshot_path=path)
+    get = mocker.patch.object(countries, "_get", return_value=data)
+    assert countries.get(iso_code="UA").name == "Ukraine"
+    assert get.call_count == 1
+
+    # Fresh snapshot: no requests at all
+    cold = freelancehunt.Countries(snapshot_path=path)
+    cold_get = mocker.patch.object(cold, "_get", return_value=data)
+    assert cold.get(1).iso2 == "UA" and cold.search("ukr")[0].id == 1
+    assert cold_get.call_count == 0
+
+    # Stale snapshot: served at once and updated in background
+    stale = freelancehunt.Countries(snapshot_path=path, snapshot_max_age=0)
+    stale_get = mocker.patch.object(stale, "_get", return_value=[
+        {"id": 1, "type": "country", "iso2": "UA", "name": "Україна"},
+    ])
+    assert stale.get(1) is not None
+    stale._refresh_threads["en"].join()
+    assert stale_get.call_count == 1
+    assert stale.get(1).name == "Україна"
+
+
+def test_catalog_stale_while_revalidate(mocker):
+    import threading
+    import freelancehunt
+
+    refreshing = threading.Event()
+    responces = [
+        [{"id": 1, "type": "country", "iso2": "UA", "name": "Ukraine"}],
+        [{"id": 1, "type": "country", "iso2": "UA", "name": "Україна"}],
+    ]
+
+    def get(url, **kwargs):
+        if len(responces) == 1:
+            refreshing.wait(5)
+        return responces.pop(0)
+
+    countries = freelancehunt.Countries(token="TOKEN", max_age=0)
+    get = mocker.patch.object(countries, "_get", side_effect=get)
+    assert countries.get(1).name == "Ukraine"
+
+    # Stale entries are served while one refresh runs in background
+    assert countries.get(1).name == "Ukraine"
+    assert countries.get(1).name == "Ukraine"
+    refreshing.set()
+    countries._refresh_threads["en"].join()
+    assert get.call_count == 2
+    assert countries.get(1).name == "Україна"
+
+
+def test_catalog_refreshes_languages_separately(mocker):
+    import threading
+    import freelancehunt
+
+    refreshing = threading.Event()
+    calls = []
+
+    def get(url, language=None):
+        calls.append(language or "en")
+        if language is None and calls.count("en") > 1:
+            refreshing.wait(5)
+        return [{"id": 1, "type": "country", "iso2": "UA", "name": f"Ukraine {language}"}]
+
+    countries = freelancehunt.Countries(token="TOKEN", max_age=0)
+    mocker.patch.object(countries, "_get", side_effect=get)
+    countries._get_state("en")
+    countries._get_state("en")
+    assert countries._refresh_threads["en"].is_alive()
+
+    # Refresh of another language is not skipped while "en" one runs
+    countries._get_state("uk")
+    countries._get_state("uk")
+    countries._refresh_threads["uk"].join()
+    assert calls.count("uk") == 2
+    refreshing.set()
+    countries._refresh_threads["en"].join()
+
+
+def test_catalog_corrupt_snapshot(tmp_path, mocker):
+    import freelancehunt
+
+    path = tmp_path / "countries.json"
+    for content in ('{"version": 2, "items": [', '{"version": 2, "url": "/countries", '
+                    '"language": "en", "items": [{"iso2": "UA"}]}'):
+        path.write_text(content)
+        countries = freelancehunt.Countries(token="TOKEN", snapshot_path=str(path))
+        get = mocker.patch.object(countries, "_get", return_value=[
+            {"id": 1, "type": "country", "iso2": "UA", "name": "Ukraine"},
+        ])
+        assert countries.load_snapshot() is False
+        assert countries.get(1).name == "Ukraine"
+        assert get.call_count == 1
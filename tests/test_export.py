@@ -0,0 +1,64 @@
+#!usr/bin/python3
+"""Export of crawled entities."""
+import gzip
+import json
+
+import pytest
+
+import freelancehunt
+
+
+def make_project_data(project_id):
+    return {
+        "id": project_id,
+        "type": "project",
+        "name": f"Project {project_id}",
+        "status": {"id": 11, "name": "Open for proposals"},
+        "budget": {"amount": 1000, "currency": "UAH"},
+        "skills": [{"id": 99, "name": "Python"}],
+        "published_at": "2020-06-01T10:00:00+03:00",
+    }
+
+
+def test_parquet_dataset_writer(tmp_path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+    from freelancehunt.export.arrow import ParquetDatasetWriter
+
+    freelancehunt.Requester.get_requester("TOKEN")
+    project = freelancehunt.models.project.Project.de_json(**make_project_data(1))
+
+    with ParquetDatasetWriter(str(tmp_path), "project", partition={"day": "2020-06-01"},
+                              row_group_size=2) as writer:
+        writer.write([project])
+        writer.write([make_project_data(2), make_project_data(3)])
+
+    table = ds.dataset(str(tmp_path), partitioning="hive").to_table()
+    rows = table.sort_by("id").to_pylist()
+    assert [row["id"] for row in rows] == [1, 2, 3]
+    assert rows[0]["skill_ids"] == [99] and rows[0]["budget_currency"] == "UAH"
+    assert rows[0] == dict(rows[1], id=1, name="Project 1")
+    assert not project.is_loaded
+
+
+def test_export_ndjson_streams_pages(tmp_path, mocker):
+    from freelancehunt.export.ndjson import export_ndjson
+
+    freelancehunt.Requester.get_requester("TOKEN")
+    projects = freelancehunt.Projects()
+    responces = [
+        {"data": [{"id": 1, "type": "project", "attributes": {"name": "Проект"}}]},
+        {"data": [{"id": 2, "type": "project", "attributes": {"name": "Project 2"}}]},
+        {"data": []},
+    ]
+    request = mocker.patch.object(projects._requester, "request", side_effect=responces)
+
+    pages = projects.iter_pages(pages=5, raw=True)
+    path = str(tmp_path / "projects.ndjson.gz")
+    assert request.call_count == 0
+    assert export_ndjson(pages, path, compression="gzip") == 2
+    assert request.call_count == 3
+
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        rows = [json.loads(line) for line in file]
+    assert [(row["id"], row["name"]) for row in rows] == [(1, "Проект"), (2, "Project 2")]
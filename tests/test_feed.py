@@ -1,5 +1,6 @@
 #!usr/bin/python3
 """#TODO: Write comments."""
+import freelancehunt
 from freelancehunt import Feed
 from freelancehunt.models.feed import FeedMessage
 
@@ -54,3 +55,53 @@ class FeedEntity:
 
     def __repr__(self):
         pass
+
+
+def test_hydrate_loads_linked_projects_once(mocker):
+    def make_message(message_id, project_id):
+        return {
+            "id": message_id,
+            "from": {"id": 1, "type": "employer", "login": "login",
+                     "first_name": "First", "last_name": "Last"},
+            "message": "New bid",
+            "created_at": "2020-06-01T10:00:00+03:00",
+            "is_new": True,
+            "links": {"project": f"https://api.freelancehunt.com/v2/projects/{project_id}"},
+        }
+
+    def get(url, filters=None, page=None):
+        if url == "/my/feed":
+            return [make_message(1, 10), make_message(2, 10), make_message(3, 20)]
+        project_id = int(url.split("/")[-1])
+        return {"id": project_id, "name": f"Project {project_id}",
+                "status": {"id": 11, "name": "Open for proposals"}}
+
+    feed = freelancehunt.Feed(token="TOKEN")
+    get_mock = mocker.patch.object(feed, "_get", side_effect=get)
+
+    feed.update(prefetch=True)
+    feed.hydrate()
+
+    urls = [call.args[0] for call in get_mock.call_args_list]
+    assert sorted(urls) == ["/my/feed", "/projects/10", "/projects/20"]
+    first, second, third = feed.list
+    assert first.project is second.project
+    assert third.project.name == "Project 20"
+
+
+def test_raw_feed_and_bids(mocker):
+    message = {"id": 1, "message": "New bid", "is_new": True,
+               "created_at": "2020-06-01T10:00:00+03:00"}
+    feed = freelancehunt.Feed(token="TOKEN")
+    mocker.patch.object(feed, "_get", return_value=[message])
+    assert feed.get_list(raw=True) == [message]
+    assert feed._latest_feed is None
+
+    bid = {"id": 5, "type": "bid", "days": 3, "status": "active"}
+    from freelancehunt.packages.bids import Bids
+
+    bids = Bids(token="TOKEN")
+    get = mocker.patch.object(bids, "_get", return_value=[bid])
+    assert bids.get_project_bids(10, raw=True) == [bid]
+    assert bids.get_my_bids(status="active", raw=True) == [bid]
+    assert get.call_args.args == ("/my/bids",)
@@ -1,5 +1,8 @@
 #!usr/bin/python3
 """#TODO: Write comments."""
+import pytest
+
+import freelancehunt
 from freelancehunt import Projects
 from freelancehunt.models.project import Project
 
@@ -68,3 +71,238 @@ class ProjectEntity:
 
     def __repr__(self):
         pass
+
+
+def test_get_list_stop_when(mocker, project_data):
+    pages = {
+        1: [project_data(3, "2020-06-03T10:00:00+03:00"),
+            project_data(2, "2020-06-02T10:00:00+03:00")],
+        2: [project_data(1, "2020-06-01T10:00:00+03:00")],
+        3: [project_data(0, "2020-05-31T10:00:00+03:00")],
+    }
+    projects = freelancehunt.Projects(token="TOKEN")
+    get = mocker.patch.object(projects, "_get",
+                              side_effect=lambda url, filters, page: pages[page])
+
+    result = projects.get_list(pages=3, stop_when=lambda p: p.id <= 1)
+
+    assert [project.id for project in result] == [3, 2]
+    assert get.call_count == 2
+
+
+def test_lazy_fields_load_details(mocker, project_data):
+    freelancehunt.Requester.get_requester("TOKEN")
+    project = freelancehunt.models.project.Project.de_json(
+        **project_data(1, "2020-06-01T10:00:00+03:00")
+    )
+    load_details = mocker.patch.object(freelancehunt.models.project.Project, "load_details")
+
+    assert project.name == "Project 1"
+    assert load_details.call_count == 0
+
+    assert project.description is None
+    assert load_details.call_count == 1
+
+
+def test_known_null_does_not_reload(mocker, project_data):
+    freelancehunt.Requester.get_requester("TOKEN")
+    project_class = freelancehunt.models.project.Project
+    project = project_class.de_json(**project_data(1, "2020-06-01T10:00:00+03:00"))
+    get = mocker.patch.object(
+        project_class, "_get",
+        side_effect=lambda url: project_data(1, "2020-06-01T10:00:00+03:00")
+    )
+
+    assert project.freelancer is None
+    assert project.freelancer is None
+    assert project.is_loaded and get.call_count == 1
+
+    mocker.patch.object(project_class, "details_max_age", 0)
+    mocker.patch("freelancehunt.core.time.time", return_value=project._loaded_at + 1)
+    assert project.freelancer is None
+    assert project.freelancer is None
+    assert get.call_count == 2
+
+
+def test_nested_fields_parsed_on_access(project_data):
+    freelancehunt.Requester.get_requester("TOKEN")
+    data = project_data(1, "2020-06-01T10:00:00+03:00")
+    data["skills"] = [{"id": 99, "name": "Python"}]
+    project = freelancehunt.models.project.Project.de_json(**data)
+
+    assert project._published_at == "2020-06-01T10:00:00+03:00"
+    assert project.published_at.day == 1
+    assert project._published_at is project.published_at
+
+    skill = project.skills[0]
+    assert isinstance(skill, freelancehunt.models.skill.Skill)
+    assert project.skills[0] is skill
+
+
+def test_identity_map_shares_nested_objects(project_data):
+    freelancehunt.Requester.get_requester("TOKEN")
+    identity_map = freelancehunt.utils.identity.IdentityMap.enable()
+    try:
+        projects = []
+        for project_id in (1, 2):
+            data = project_data(project_id, "2020-06-01T10:00:00+03:00")
+            data["employer"] = {"id": 4, "type": "employer", "login": "fh",
+                                "first_name": "Freelancehunt", "last_name": ""}
+            data["skills"] = [{"id": 99, "name": "Python"}]
+            projects.append(freelancehunt.models.project.Project.de_json(**data))
+
+        assert projects[0].employer is projects[1].employer
+        assert projects[0].skills[0] is projects[1].skills[0]
+        assert identity_map.get(freelancehunt.models.user.Employer, 4) is projects[0].employer
+
+        del projects
+        assert len(identity_map) == 0
+    finally:
+        freelancehunt.utils.identity.IdentityMap.disable()
+
+
+def test_get_list_raw_records(mocker, project_data):
+    projects = freelancehunt.Projects(token="TOKEN")
+    mocker.patch.object(projects, "_get", side_effect=lambda url, filters, page: [
+        project_data(1, "2020-06-01T10:00:00+03:00")
+    ])
+
+    result = projects.get_list(raw=True)
+
+    assert result == [project_data(1, "2020-06-01T10:00:00+03:00")]
+
+
+def test_get_list_raw_stop_when(mocker, project_data):
+    pages = {
+        1: [project_data(3, "2020-06-03T10:00:00+03:00"),
+            project_data(2, "2020-06-02T10:00:00+03:00")],
+        2: [project_data(1, "2020-06-01T10:00:00+03:00")],
+        3: [project_data(0, "2020-05-31T10:00:00+03:00")],
+    }
+    projects = freelancehunt.Projects(token="TOKEN")
+    get = mocker.patch.object(projects, "_get",
+                              side_effect=lambda url, filters, page: pages[page])
+
+    result = projects.get_list(
+        pages=3, raw=True,
+        stop_when=lambda record: record["published_at"] < "2020-06-02T00:00:00+03:00"
+    )
+
+    assert result == [project_data(3, "2020-06-03T10:00:00+03:00"),
+                      project_data(2, "2020-06-02T10:00:00+03:00")]
+    assert get.call_count == 2
+
+
+def test_schema_validates_data(project_data):
+    freelancehunt.Requester.get_requester("TOKEN")
+    project_class = freelancehunt.models.project.Project
+    data = project_data(1, "2020-06-01T10:00:00+03:00")
+    data["bid_count"] = "many"
+
+    with pytest.raises(freelancehunt.utils.errors.SchemaError):
+        project_class.de_json(**data)
+    with pytest.raises(freelancehunt.utils.errors.SchemaError):
+        project_class.de_json(name="Project without id")
+
+
+def test_get_project_exclude_fields(mocker, project_data):
+    projects = freelancehunt.Projects(token="TOKEN")
+    project_class = freelancehunt.models.project.Project
+
+    def get(url, filters=None, page=None):
+        data = project_data(1, "2020-06-01T10:00:00+03:00")
+        data["description"] = "Heavy description"
+        return data
+    mocker.patch.object(projects, "_get", side_effect=get)
+    load_get = mocker.patch.object(project_class, "_get", side_effect=get)
+
+    project = projects.get_project(1, exclude=("description",))
+
+    assert "description" not in project.other
+    assert not project.is_loaded
+    assert project.name == "Project 1"
+    assert load_get.call_count == 0
+    assert project.description == "Heavy description"
+    assert load_get.call_count == 1
+
+    with pytest.raises(ValueError):
+        projects.get_list(exclude=("id",))
+
+
+def test_to_dict_round_trip(project_data):
+    import pickle
+
+    freelancehunt.Requester.get_requester("TOKEN")
+    project_class = freelancehunt.models.project.Project
+    data = project_data(1, "2020-06-01T10:00:00+03:00")
+    data["employer"] = {"id": 4, "type": "employer", "login": "fh",
+                        "first_name": "Freelancehunt", "last_name": ""}
+    data["budget"] = {"amount": 1000, "currency": "UAH"}
+    data["skills"] = [{"id": 99, "name": "Python"}]
+    project = project_class.de_json(**data)
+    # Parsed and not parsed nested fields are both kept
+    assert project.skills[0].name == "Python" and project.published_at.day == 1
+
+    record = project.to_dict()
+    assert record["skills"] == [{"id": 99, "name": "Python"}]
+    assert record["published_at"] == "2020-06-01T10:00:00+03:00"
+    assert record["type"] == "project" and "description" not in record
+
+    restored = project_class.from_dict(record)
+    assert restored.to_dict() == record
+    assert isinstance(restored.employer, freelancehunt.models.user.Employer)
+    assert restored.budget.amount == 1000 and not restored.is_loaded
+
+    project._mark_loaded()
+    unpickled = pickle.loads(pickle.dumps(project))
+    assert unpickled.to_dict() == record and unpickled.is_loaded
+
+
+def test_project_frame(project_data):
+    np = pytest.importorskip("numpy")
+    freelancehunt.Requester.get_requester("TOKEN")
+    records = []
+    for project_id, currency, amount, skills in ((1, "UAH", 1000, [1, 2]),
+                                                 (2, "USD", 50, [2]),
+                                                 (3, "UAH", 3000, [3])):
+        data = project_data(project_id, f"2020-06-0{project_id}T10:00:00+03:00")
+        data["budget"] = {"amount": amount, "currency": currency}
+        data["skills"] = [{"id": skill_id, "name": "Skill"} for skill_id in skills]
+        records.append(data)
+    projects = [freelancehunt.models.project.Project.de_json(**dict(data))
+                for data in records[:2]]
+
+    frame = freelancehunt.ProjectFrame.from_pages([projects, records[2:]])
+
+    assert frame.id.tolist() == [1, 2, 3]
+    assert frame.has_skills([2]).tolist() == [True, True, False]
+    assert frame.has_skills([1, 2], require_all=True).tolist() == [True, False, False]
+    assert frame.aggregate("currency", "budget_amount") == {"UAH": 2000, "USD": 50}
+
+    latest = frame.sort("published_at", descending=True)
+    latest = latest.filter(~latest.has_skills([1]))
+    assert latest.id.tolist() == [3, 2]
+    assert latest.skill_ids(0) == {3}
+    assert [project.id for project in latest.to_projects()] == [3, 2]
+    assert latest.to_projects()[1] is projects[1]
+    assert np.isnat(frame.expired_at).all()
+
+    repeated = frame.filter(np.array([2, 0, 0]))
+    assert repeated.id.tolist() == [3, 1, 1]
+    assert [repeated.skill_ids(position) for position in range(3)] == [{3}, {1, 2}, {1, 2}]
+    assert repeated.has_skills([1]).tolist() == [False, True, True]
+
+
+def test_load_details_keeps_bound_requester(mocker, project_data):
+    requester = freelancehunt.Requester("BOUND")
+    freelancehunt.Requester.get_requester("TOKEN")
+    project = freelancehunt.models.project.Project(1)
+    project._requester = requester
+    request = mocker.patch.object(requester, "request", side_effect=lambda *args, **kwargs: {
+        "data": project_data(1, "2020-06-01T10:00:00+03:00"),
+    })
+
+    project.load_details()
+    project.load_details()
+    assert request.call_count == 2
+    assert project._requester is requester
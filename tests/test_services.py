@@ -0,0 +1,279 @@
+#!usr/bin/python3
+"""Tests for polling services."""
+from freelancehunt import FeedWatcher, InboxSync, PollingGroup, ProjectWatcher
+from freelancehunt.utils.polling import AdaptiveInterval, SeenIds
+
+
+class TestProjectWatcher:
+
+    def test_emits_only_new_projects(self, mocker, tmp_path, project_data):
+        pages = {1: [project_data(2, "2020-06-02T10:00:00+03:00"),
+                     project_data(1, "2020-06-01T10:00:00+03:00")]}
+        state_path = str(tmp_path / "watcher.json")
+        watcher = ProjectWatcher(token="TOKEN", state_path=state_path)
+        get = mocker.patch.object(watcher._projects, "_get",
+                                  side_effect=lambda url, filters, page: pages.get(page, []))
+
+        # The first poll remembers existing projects only
+        assert watcher.poll() == []
+
+        pages = {
+            1: [project_data(4, "2020-06-04T10:00:00+03:00"),
+                project_data(3, "2020-06-03T10:00:00+03:00")],
+            2: [project_data(2, "2020-06-02T10:00:00+03:00"),
+                project_data(1, "2020-06-01T10:00:00+03:00")],
+            3: [project_data(0, "2020-06-01T10:00:00+03:00")],
+        }
+        get.reset_mock()
+        received = []
+        watcher.subscribe(received.append)
+
+        new_projects = watcher.poll()
+
+        assert [project.id for project in new_projects] == [3, 4]
+        assert received == new_projects
+        assert get.call_count == 2
+
+        restored = ProjectWatcher(token="TOKEN", state_path=state_path)
+        assert restored.watermark == watcher.watermark
+        assert 4 in restored._seen
+
+    def test_forgets_oldest_projects_first(self, mocker, project_data):
+        watcher = ProjectWatcher(token="TOKEN", seen_limit=2)
+        mocker.patch.object(watcher._projects, "_get", side_effect=lambda url, filters, page: [
+            project_data(3, "2020-06-03T10:00:00+03:00"),
+            project_data(2, "2020-06-02T10:00:00+03:00"),
+            project_data(1, "2020-06-01T10:00:00+03:00"),
+        ] if page == 1 else [])
+        watcher.poll()
+        assert watcher._seen.to_list() == [2, 3]
+
+    def test_starts_with_corrupt_state(self, mocker, tmp_path):
+        state_file = tmp_path / "watcher.json"
+        for content in ('{"watermark": "2020-06-', '{"watermark": 5, "seen": 7}', '[]'):
+            state_file.write_text(content)
+            watcher = ProjectWatcher(token="TOKEN", state_path=str(state_file))
+            assert watcher.watermark is None and not len(watcher._seen)
+
+    def test_saves_state_after_delivery(self, mocker, tmp_path, project_data):
+        pages = {1: [project_data(1, "2020-06-01T10:00:00+03:00")]}
+        state_path = str(tmp_path / "watcher.json")
+        watcher = ProjectWatcher(token="TOKEN", state_path=state_path)
+        mocker.patch.object(watcher._projects, "_get",
+                            side_effect=lambda url, filters, page: pages.get(page, []))
+        watcher.poll()
+
+        pages = {1: [project_data(2, "2020-06-02T10:00:00+03:00"),
+                     project_data(1, "2020-06-01T10:00:00+03:00")]}
+        saved = []
+        watcher.subscribe(lambda project: saved.append(
+            2 in ProjectWatcher(token="TOKEN", state_path=state_path)._seen))
+
+        assert [project.id for project in watcher.poll()] == [2]
+        assert saved == [False]
+        assert 2 in ProjectWatcher(token="TOKEN", state_path=state_path)._seen
+
+
+def make_feed_data(message_id, is_new):
+    return {
+        "id": message_id,
+        "type": "feed",
+        "from": {"id": 1, "type": "employer", "login": "login",
+                 "first_name": "First", "last_name": "Last"},
+        "message": f"Message {message_id}",
+        "created_at": "2020-06-01T10:00:00+03:00",
+        "is_new": is_new,
+    }
+
+
+class TestFeedWatcher:
+
+    def test_emits_only_new_messages(self, mocker):
+        feed = [make_feed_data(2, True), make_feed_data(1, False)]
+        watcher = FeedWatcher(token="TOKEN", mark_read=True)
+        mocker.patch.object(watcher.feed, "_get", side_effect=lambda url: list(feed))
+        post = mocker.patch.object(watcher.feed, "_post", return_value=True)
+
+        assert [message.id for message in watcher.poll()] == [2]
+        assert post.call_count == 1
+
+        feed = [make_feed_data(4, True), make_feed_data(3, True)] + feed
+        assert [message.id for message in watcher.poll()] == [3, 4]
+        # Marking as read is batched by read_interval
+        assert post.call_count == 1
+
+    def test_group_polls_due_services(self, mocker):
+        watchers = [FeedWatcher(token="TOKEN") for _ in range(2)]
+        for watcher in watchers:
+            mocker.patch.object(watcher.feed, "_get",
+                                side_effect=lambda url: [make_feed_data(1, True)])
+        group = PollingGroup(watchers)
+
+        assert len(group.poll_due()) == 2
+        # Not due until the intervals are passed
+        assert group.poll_due() == []
+
+    def test_linked_objects_use_watcher_requester(self, mocker):
+        from freelancehunt.utils.requester import Requester
+
+        def request(requester, request_type, url, filters=None, payload=None, language=None):
+            tokens.append((requester.token, url))
+            if url == "/my/feed":
+                data = make_feed_data(1, True)
+                data.pop("id")
+                return {"data": [{
+                    "id": 1, "type": "feed", "attributes": data,
+                    "links": {"project": "https://api.freelancehunt.com/v2/projects/"
+                                         f"{PROJECT_IDS[requester.token]}"},
+                }]}
+            return {"data": {"id": PROJECT_IDS[requester.token], "type": "project",
+                             "attributes": {"name": requester.token,
+                                            "status": {"id": 11, "name": "Open for proposals"}}}}
+
+        PROJECT_IDS = {"FIRST": 10, "SECOND": 20}
+        tokens = []
+        mocker.patch.object(Requester, "request", autospec=True, side_effect=request)
+        watchers = [FeedWatcher(token="FIRST"), FeedWatcher(token="SECOND")]
+        messages = PollingGroup(watchers).poll_due()
+
+        assert [message.project.name for message in messages] == ["FIRST", "SECOND"]
+        assert sorted(tokens) == [("FIRST", "/my/feed"), ("FIRST", "/projects/10"),
+                                  ("SECOND", "/my/feed"), ("SECOND", "/projects/20")]
+
+    def test_failing_callback_does_not_stop_delivery(self, mocker):
+        feed = [make_feed_data(2, True), make_feed_data(1, True)]
+        watcher = FeedWatcher(token="TOKEN")
+        mocker.patch.object(watcher.feed, "_get", side_effect=lambda url: list(feed))
+        received = []
+
+        def fail(message):
+            raise RuntimeError("callback failed")
+
+        watcher.subscribe(fail)
+        watcher.subscribe(received.append)
+        group = PollingGroup([watcher])
+
+        assert [message.id for message in group.poll_due()] == [1, 2]
+        assert [message.id for message in received] == [1, 2]
+
+
+PARTICIPANTS = {
+    "from": {"id": 1, "type": "employer", "login": "employer",
+             "first_name": "First", "last_name": "Last"},
+    "to": {"id": 2, "type": "freelancer", "login": "freelancer",
+           "first_name": "First", "last_name": "Last"},
+}
+
+
+def make_thread_data(thread_id, last_post_at, messages_count):
+    return {
+        "id": thread_id,
+        "subject": f"Thread {thread_id}",
+        "first_post_at": "2020-06-01T10:00:00+03:00",
+        "last_post_at": f"2020-06-{last_post_at:02}T10:00:00+03:00",
+        "messages_count": messages_count,
+        "is_unread": True,
+        "has_attachments": False,
+        "participants": PARTICIPANTS,
+    }
+
+
+def make_message_data(message_id):
+    return {
+        "id": message_id,
+        "posted_at": f"2020-06-{message_id:02}T10:00:00+03:00",
+        "message": f"Message {message_id}",
+        "message_html": f"Message {message_id}",
+        "participants": PARTICIPANTS,
+    }
+
+
+class TestInboxSync:
+
+    def test_syncs_only_changed_threads(self, mocker):
+        threads = [make_thread_data(20, 2, 2), make_thread_data(10, 1, 1)]
+        messages = {
+            "/threads/20": [make_message_data(2), make_message_data(1)],
+            "/threads/10": [make_message_data(1)],
+        }
+
+        def get(url, filters=None, page=None):
+            if url == "/threads":
+                return list(threads) if page == 1 else []
+            return list(messages[url]) if page == 1 else []
+
+        inbox = InboxSync(token="TOKEN")
+        mocker.patch.object(inbox._threads, "_get", side_effect=get)
+        get_mock = mocker.patch.object(inbox, "_get", side_effect=get)
+
+        assert inbox.poll() == []
+        assert sorted(inbox.thread_ids) == [10, 20]
+
+        threads = [make_thread_data(20, 3, 3), make_thread_data(10, 1, 1)]
+        messages["/threads/20"].insert(0, make_message_data(3))
+        get_mock.reset_mock()
+
+        new_messages = inbox.poll()
+
+        assert [message.id for message in new_messages] == [3]
+        assert [call.args[0] for call in get_mock.call_args_list] == ["/threads/20"]
+        assert [message.id for message in inbox.get_messages(20)] == [3, 2, 1]
+
+    def test_persists_cursors_and_appends_messages(self, mocker, tmp_path):
+        import json
+
+        threads = [make_thread_data(20, 2, 2)]
+        messages = {"/threads/20": [make_message_data(5), make_message_data(7)]}
+
+        def get(url, filters=None, page=None):
+            if url == "/threads":
+                return list(threads) if page == 1 else []
+            return list(messages[url]) if page == 1 else []
+
+        paths = {"state_path": str(tmp_path / "inbox.json"),
+                 "messages_path": str(tmp_path / "messages.ndjson")}
+        inbox = InboxSync(token="TOKEN", **paths)
+        mocker.patch.object(inbox._threads, "_get", side_effect=get)
+        mocker.patch.object(inbox, "_get", side_effect=get)
+        inbox.poll()
+
+        # Identifiers do not have to grow, new messages are the not seen ones
+        threads = [make_thread_data(20, 3, 3)]
+        messages["/threads/20"].insert(0, make_message_data(6))
+        assert [message.id for message in inbox.poll()] == [6]
+
+        state = json.loads((tmp_path / "inbox.json").read_text())
+        assert "messages" not in state and state["threads"]["20"]["recent_ids"] == [6, 5, 7]
+
+        # Nothing changed: the state is not written again
+        save = mocker.patch.object(inbox._storage, "save")
+        assert inbox.poll() == []
+        assert not save.called
+
+        restored = InboxSync(token="TOKEN", **paths)
+        assert [message.id for message in restored.get_messages(20)] == [6, 5, 7]
+
+
+def test_seen_ids_is_bounded():
+    seen = SeenIds([1, 2, 3], maxlen=3)
+    assert not seen.add(3)
+    assert seen.add(4)
+    assert 1 not in seen and seen.to_list() == [2, 3, 4]
+
+
+def test_adaptive_interval_respects_limit():
+    interval = AdaptiveInterval(min_interval=10, max_interval=600, reserve_requests=0)
+    interval.observe(items=10, elapsed=10)
+    assert interval.update() == 10
+    assert interval.update(remaining_limit=10, reset_in=1000) == 100
+    assert interval.update(remaining_limit=0, reset_in=1000) == 1000
+
+
+def test_adaptive_interval_backs_off_gradually():
+    interval = AdaptiveInterval(min_interval=30, max_interval=900)
+    assert interval.update() == 30
+    intervals = []
+    for _ in range(6):
+        interval.observe(items=0, elapsed=interval.interval)
+        intervals.append(interval.update())
+    assert intervals == [60, 120, 240, 480, 900, 900]
@@ -29,3 +29,81 @@ class SkillEntity:
 
     def de_json(cls, **data):
         pass
+
+
+def test_catalog_search(mocker):
+    import freelancehunt
+
+    skills = freelancehunt.Skills(token="TOKEN")
+    mocker.patch.object(skills, "_get", return_value=[
+        {"id": 1, "type": "skill", "name": "PHP"},
+        {"id": 2, "type": "skill", "name": "Python"},
+        {"id": 3, "type": "skill", "name": "Web programming"},
+        {"id": 4, "type": "skill", "name": "Programming"},
+        {"id": 5, "type": "skill", "name": "Café design"},
+    ])
+
+    assert [skill.id for skill in skills.search("p", limit=3)] == [1, 2, 4]
+    assert [skill.id for skill in skills.search("progarm")] == [4, 3]
+    assert [skill.id for skill in skills.search("pyhton")] == [2]
+    assert [skill.id for skill in skills.find("CAFE")] == [5]
+    assert [skill.id for skill in skills.find("gram")] == [3, 4]
+
+
+def test_catalog_languages(mocker):
+    import freelancehunt
+
+    names = {"en": "Architecture", "ru": "Архитектура", "uk": "Архітектура"}
+    skills = freelancehunt.Skills(token="TOKEN")
+    get = mocker.patch.object(skills, "_get", side_effect=lambda url, language=None: [
+        {"id": 1, "type": "skill", "name": names[language or "en"]},
+    ])
+
+    skills.update_languages()
+    assert get.call_count == 3
+    assert skills.get(1).names == names
+    assert skills.get(1).name == "Architecture"
+
+    uk_skills = freelancehunt.Skills(language="uk")
+    mocker.patch.object(uk_skills, "_get", side_effect=lambda url, language=None: [
+        {"id": 1, "type": "skill", "name": names[language]},
+    ])
+    assert uk_skills.get_by_name("Архітектура").id == 1
+
+
+def test_catalog_refresh_keeps_languages(mocker):
+    import freelancehunt
+
+    names = {"en": "Architecture", "ru": "Архитектура", "uk": "Архітектура"}
+    skills = freelancehunt.Skills(token="TOKEN", max_age=0)
+    get = mocker.patch.object(skills, "_get", side_effect=lambda url, language=None: [
+        {"id": 1, "type": "skill", "name": names[language or "en"]},
+    ])
+    skills.update_languages()
+
+    # Stale read refreshes every merged language
+    assert skills.get(1).names == names
+    skills._refresh_threads["en"].join()
+    assert get.call_count == 6
+    assert skills.get(1).names == names
+
+
+def test_catalog_language_of_requester(mocker):
+    import freelancehunt
+    from freelancehunt.utils.requester import Requester
+
+    try:
+        skills = freelancehunt.Skills(token="TOKEN", language="uk")
+        assert skills._requester.language == "uk"
+
+        # Requester without a language gets the API default one
+        Requester.get_requester("TOKEN", language=None)
+        skills = freelancehunt.Skills()
+        get = mocker.patch.object(skills, "_get", side_effect=lambda url, language=None: [
+            {"id": 1, "type": "skill", "name": f"Architecture {language}"},
+        ])
+        skills.update_languages()
+        assert skills.get(1).name == "Architecture en"
+        assert get.call_count == 3
+    finally:
+        Requester.get_requester("TOKEN")